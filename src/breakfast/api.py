@@ -1,28 +1,76 @@
+import contextlib
 import datetime
 import fnmatch
+import hashlib
+import json
 import os
 import random
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
 from urllib.parse import quote, urlparse
 
 import click
 import requests
-
+from requests.adapters import HTTPAdapter
+
+from .cache import (
+    project_pr_detail,
+    read_check_cache,
+    read_conditional_entry,
+    read_protection_cache,
+    write_check_cache,
+    write_conditional_entry,
+    write_protection_cache,
+)
 from .constants import (
+    _ADAPTIVE_BACKOFF_COOLDOWN,
+    _ADAPTIVE_DECREASE_FACTOR,
+    _ADAPTIVE_INITIAL_CONCURRENCY,
+    _ADAPTIVE_LATENCY_FACTOR,
+    _CHECK_PAGE_SIZE,
+    _CONGESTION_STATUSES,
+    _DEFAULT_HTTP_POOL_SIZE,
+    _GRAPHQL_BATCH_SIZE,
+    _GRAPHQL_OVERFLOW_MAX_PAGES,
+    _GRAPHQL_OVERFLOW_WORKERS,
+    _GRAPHQL_PR_PAGE_SIZE,
     _GRAPHQL_REPOSITORY_PAGE_SIZE,
+    _GRAPHQL_SEARCH_RESULT_LIMIT,
+    _HEDGE_MAX_FRACTION,
+    _HEDGE_MIN_SAMPLES,
+    _HEDGE_QUANTILE,
+    _HEDGE_WINDOW,
     _MAX_GRAPHQL_ERROR_MESSAGE_LENGTH,
     _MAX_GRAPHQL_ERROR_TYPES,
     _MAX_RETRIES,
     _MAX_STORED_GRAPHQL_ERRORS,
+    _PENDING_CHECK_CACHE_TTL,
+    _RATE_LIMIT_MAX_WAIT,
+    _RATE_LIMIT_PACE_FRACTION,
+    _RATE_LIMIT_RESERVE,
     _REQUEST_TIMEOUT,
+    _RETRY_BASE_DELAY,
+    _RETRY_BUDGET_MIN,
+    _RETRY_BUDGET_RATIO,
+    _RETRY_MAX_DELAY,
     _RETRY_STATUSES,
+    _SECONDARY_RATE_LIMIT_WAIT,
     BREAKFAST_ITEMS,
     GITHUB_API_URL,
     GITHUB_GRAPHQL_URL,
 )
 from .logger import logger
+from .transport import (
+    RATE_LIMIT_POLICIES,
+    AdaptiveConcurrencyLimiter,
+    RateLimitScheduler,
+    RequestHedger,
+    RetryPolicy,
+    SingleFlight,
+    is_secondary_rate_limit,
+)
 
 
 def _resolve_github_token_info():
@@ -45,6 +93,16 @@ def _resolve_github_token():
 SECRET_GITHUB_TOKEN, SECRET_GITHUB_TOKEN_VAR = _resolve_github_token_info()
 
 
+def _token_cache_scope():
+    """Return a short digest of the token, keying caches whose answers vary by it.
+
+    What a lookup returns depends on what the token may see, so an entry
+    cached under one token must not answer for another.
+    """
+    token = SECRET_GITHUB_TOKEN or ""
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
 def _summarize_graphql_errors(errors):
     """Return a bounded summary of GraphQL errors grouped by type.
 
@@ -84,12 +142,14 @@ class GitHubGraphQLError(ValueError):
     """Raised when GitHub returns fatal GraphQL errors.
 
     Attributes:
+        data: Partial ``data`` object returned alongside the errors, if any.
         error_count: Total number of errors in the response.
         errors: Bounded tuple of representative original error objects.
         summary: Bounded error summary grouped by type.
     """
 
-    def __init__(self, errors):
+    def __init__(self, errors, data=None):
+        self.data = data
         self.error_count = len(errors)
         self.errors = tuple(errors[:_MAX_STORED_GRAPHQL_ERRORS])
         self.summary = _summarize_graphql_errors(errors)
@@ -117,6 +177,39 @@ class GitHubRateLimitError(Exception):
             super().__init__("GitHub API rate limit exceeded.")
 
 
+class GitHubRateLimitBudgetExhausted(requests.exceptions.RequestException):
+    """Raised instead of sending a request once a rate-limit budget is spent.
+
+    Only raised under the ``degrade`` policy: callers treat it like any other
+    failed request, so optional data falls back to its placeholder while the
+    rest of the run completes.
+
+    Attributes:
+        resource: Rate-limit resource whose budget is spent (e.g. ``core``).
+        reset_time: UTC time when the budget resets, or None if unknown.
+    """
+
+    def __init__(self, resource, reset_time=None):
+        self.resource = resource
+        self.reset_time = reset_time
+        message = f"GitHub API rate limit budget for {resource} is spent."
+        if reset_time:
+            message += f" Try again after {reset_time} UTC."
+        super().__init__(message)
+
+
+class GitHubDeadlineExceeded(requests.exceptions.RequestException):
+    """Raised instead of starting or retrying a request past the run deadline.
+
+    Like ``GitHubRateLimitBudgetExhausted``, callers treat it as a failed
+    request; the CLI additionally knows the data is missing rather than
+    broken, and fills it from stale cache where it can.
+    """
+
+    def __init__(self):
+        super().__init__("The --deadline time budget is spent.")
+
+
 class OwnerNotFoundError(Exception):
     """Raised when a GitHub owner (org or user) cannot be resolved."""
 
@@ -154,13 +247,458 @@ _api_stats = {
     "graphql_calls": 0,
     "rest_rate_limit_remaining": None,
     "rest_rate_limit_reset": None,
+    "rest_not_modified": 0,
+    "graphql_overflow_pages": 0,
+    "rate_limit_degraded": 0,
 }
 
+_single_flight = SingleFlight()
+
+_conditional_requests_enabled = False
+
+
+def configure_conditional_requests(enabled):
+    """Enable or disable ETag/Last-Modified validators on REST requests.
+
+    When enabled, ``make_github_api_request`` stores each response's
+    validators and body in the cache directory, sends them back as
+    ``If-None-Match`` / ``If-Modified-Since`` on the next request for the
+    same path, and serves the stored body when GitHub answers 304. GitHub
+    does not charge 304 responses against the REST rate limit.
+    """
+    global _conditional_requests_enabled
+    _conditional_requests_enabled = bool(enabled)
+
+
+_protection_cache_ttl = None
+_protection_cache_refresh = False
+
+
+def configure_protection_cache(ttl, refresh=False):
+    """Keep branch-protection lookups in the cache directory across runs.
+
+    ``get_required_approving_review_count`` then answers from disk for
+    *ttl* seconds, including negative results: tokens without admin rights
+    get 403/404 for every protected branch, and that answer rarely changes.
+    With *refresh* the stored entries are not read but are still rewritten.
+    A *ttl* of None disables the disk layer.
+    """
+    global _protection_cache_ttl, _protection_cache_refresh
+    _protection_cache_ttl = ttl
+    _protection_cache_refresh = bool(refresh)
+
+
+_check_cache_enabled = False
+
+
+def configure_check_cache(enabled):
+    """Keep each commit's check status in the cache directory across runs.
+
+    Statuses are keyed by ``(owner, repo, sha)``, so a PR whose head has not
+    moved needs no check calls once its checks have settled; see
+    ``read_check_cache`` for how long each status is trusted.
+    """
+    global _check_cache_enabled
+    _check_cache_enabled = bool(enabled)
+
+
+def cached_check_status(owner, repo, sha):
+    """Return the stored check status for a commit, or None when not cached."""
+    if not _check_cache_enabled:
+        return None
+    return read_check_cache(owner, repo, sha, _PENDING_CHECK_CACHE_TTL)
+
+
+def store_check_status(owner, repo, sha, status):
+    """Record a freshly classified check status for ``cached_check_status``."""
+    if _check_cache_enabled:
+        write_check_cache(owner, repo, sha, status)
+
+
+_deadline_at = None
+
+
+def configure_deadline(seconds):
+    """Bound all requests from now on to *seconds* of wall time.
+
+    Each request's connect and read timeouts are capped at the time left, and
+    once it is spent no request is started or retried; they raise
+    ``GitHubDeadlineExceeded`` instead. ``None`` removes the bound.
+    """
+    global _deadline_at
+    _deadline_at = None if seconds is None else time.monotonic() + seconds
+
+
+def deadline_remaining():
+    """Return seconds left before the deadline, or None when there is none."""
+    deadline_at = _deadline_at
+    if deadline_at is None:
+        return None
+    return max(0.0, deadline_at - time.monotonic())
+
+
+def _deadline_timeout(wait=0.0):
+    """Return the request timeout to use, raising if the deadline is spent.
+
+    Args:
+        wait: Seconds the caller is about to sleep before sending.
+    """
+    remaining = deadline_remaining()
+    if remaining is None:
+        return _REQUEST_TIMEOUT
+    remaining -= wait
+    if remaining <= 0:
+        raise GitHubDeadlineExceeded()
+    return tuple(min(limit, remaining) for limit in _REQUEST_TIMEOUT)
+
+
+_rate_limit_scheduler = RateLimitScheduler(
+    pace_fraction=_RATE_LIMIT_PACE_FRACTION,
+    reserve=_RATE_LIMIT_RESERVE,
+    max_wait=_RATE_LIMIT_MAX_WAIT,
+)
+
+
+def configure_rate_limit_policy(policy):
+    """Choose what happens when a rate-limit budget is about to run out.
+
+    Every REST and GraphQL request reserves budget from a shared scheduler
+    first; see :class:`~breakfast.transport.RateLimitScheduler`. Short waits
+    for the window to reset are always taken. Beyond that, ``wait`` sleeps
+    until the reset, ``degrade`` raises ``GitHubRateLimitBudgetExhausted`` so
+    the remaining requests fail soft, and ``abort`` raises
+    ``GitHubRateLimitError`` before GitHub starts answering 403.
+
+    Args:
+        policy: One of ``"wait"``, ``"degrade"`` or ``"abort"``.
+
+    Raises:
+        ValueError: If *policy* is not a known policy.
+    """
+    if policy not in RATE_LIMIT_POLICIES:
+        raise ValueError(f"Unknown rate-limit policy: {policy!r}")
+    _rate_limit_scheduler.policy = policy
+
+
+def reset_rate_limit_budget():
+    """Forget the tracked rate-limit budgets, e.g. between independent runs."""
+    _rate_limit_scheduler.reset()
+
+
+def _format_reset_time(reset_ts):
+    """Format an epoch reset timestamp as a UTC string, or None."""
+    if reset_ts is None:
+        return None
+    return datetime.datetime.fromtimestamp(
+        int(reset_ts), tz=datetime.timezone.utc
+    ).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _rest_rate_limit_resource(query_string):
+    """Return the rate-limit resource a REST path is charged against."""
+    return "search" if query_string.startswith("/search/") else "core"
+
+
+def _acquire_rate_limit_budget(resource):
+    """Reserve budget for one request, raising when the policy says stop.
+
+    A pacing or reset wait that would run past the deadline raises
+    ``GitHubDeadlineExceeded`` instead of sleeping.
+    """
+    decision = _rate_limit_scheduler.acquire(resource, timeout=deadline_remaining())
+    if decision is None:
+        return
+    if decision == "deadline":
+        raise GitHubDeadlineExceeded()
+    budget = _rate_limit_scheduler.budget(resource)
+    reset_time = _format_reset_time(budget["reset"] if budget else None)
+    if decision == "degrade":
+        with _api_stats_lock:
+            _api_stats["rate_limit_degraded"] += 1
+        raise GitHubRateLimitBudgetExhausted(resource, reset_time)
+    raise GitHubRateLimitError(reset_time)
+
+
+_retry_policy = RetryPolicy(
+    max_retries=_MAX_RETRIES,
+    base_delay=_RETRY_BASE_DELAY,
+    max_delay=_RETRY_MAX_DELAY,
+    max_wait=_RATE_LIMIT_MAX_WAIT,
+    retry_statuses=_RETRY_STATUSES,
+    secondary_limit_wait=_SECONDARY_RATE_LIMIT_WAIT,
+    budget_ratio=_RETRY_BUDGET_RATIO,
+    budget_min=_RETRY_BUDGET_MIN,
+)
+
+
+def reset_retry_budget():
+    """Refill the shared retry budget, e.g. between independent runs."""
+    _retry_policy.reset()
+
+
+def _new_concurrency_limiter(max_limit):
+    return AdaptiveConcurrencyLimiter(
+        max_limit,
+        initial=_ADAPTIVE_INITIAL_CONCURRENCY,
+        decrease_factor=_ADAPTIVE_DECREASE_FACTOR,
+        latency_factor=_ADAPTIVE_LATENCY_FACTOR,
+        cooldown=_ADAPTIVE_BACKOFF_COOLDOWN,
+    )
+
+
+_concurrency_limiter = _new_concurrency_limiter(_DEFAULT_HTTP_POOL_SIZE)
+
+
+def configure_adaptive_concurrency(max_workers):
+    """Reset the adaptive in-flight request limit with a new upper bound.
+
+    Requests no longer run at the full worker count straight away: an AIMD
+    limiter starts small, grows while GitHub answers quickly and cleanly, and
+    halves on 403 secondary limits, 429, 5xx and ``Retry-After``. Worker
+    pools can stay sized to *max_workers*; the limiter decides how many of
+    those workers actually have a request in flight.
+
+    Args:
+        max_workers: Upper bound for the concurrency limit.
+    """
+    global _concurrency_limiter
+    _concurrency_limiter = _new_concurrency_limiter(max_workers)
+
+
+def _is_congestion_signal(response):
+    """Return True when *response* says GitHub wants fewer requests."""
+    headers = getattr(response, "headers", None) or {}
+    if response.status_code in _CONGESTION_STATUSES:
+        return True
+    if headers.get("Retry-After") is not None:
+        return True
+    if is_secondary_rate_limit(response):
+        return True
+    return response.status_code == 403 and headers.get("X-RateLimit-Remaining") == "0"
+
+
+def _endpoint_family(url):
+    """Return a coarse name for the REST endpoint *url* points at.
+
+    Owner, repository, numbers, SHAs and branch names are dropped so that
+    ``/repos/o/r/pulls/1`` and ``/repos/o/r/pulls/2`` share a family while
+    ``/repos/o/r/commits/<sha>/check-runs`` gets its own.
+    """
+    parts = [part for part in urlparse(url).path.split("/") if part]
+    if len(parts) < 3 or parts[0] != "repos":
+        return "/".join(parts) or "root"
+    parts = parts[3:]
+    if not parts:
+        return "repo"
+    if len(parts) > 2:
+        return f"{parts[0]}/{parts[-1]}"
+    return parts[0]
+
+
+def _send_limited(kind, send, *args, **kwargs):
+    """Send a request through the adaptive concurrency limiter.
+
+    REST calls are keyed by endpoint family, and revalidations answered with
+    304 get their own key, so the limiter compares each response's latency
+    with that of similar requests. Waiting for a slot counts against the
+    deadline, and a ``timeout`` keyword is recomputed once the slot is held.
+    """
+    limiter = _concurrency_limiter
+    if not limiter.acquire(timeout=deadline_remaining()):
+        raise GitHubDeadlineExceeded()
+    if "timeout" in kwargs:
+        try:
+            kwargs["timeout"] = _deadline_timeout()
+        except GitHubDeadlineExceeded:
+            limiter.abandon()
+            raise
+    if kind == "rest" and args:
+        kind = f"rest:{_endpoint_family(args[0])}"
+    t0 = time.monotonic()
+    congested = True
+    try:
+        response = send(*args, **kwargs)
+        congested = _is_congestion_signal(response)
+        if response.status_code == 304:
+            kind = f"{kind}:304"
+        return response
+    finally:
+        limiter.release(kind, time.monotonic() - t0, congested)
+
+
+_hedger = None
+
+
+def configure_request_hedging(enabled, max_workers=_DEFAULT_HTTP_POOL_SIZE):
+    """Enable or disable hedging of slow REST GETs.
+
+    When enabled, a REST request that has not answered by the observed p95
+    latency gets a duplicate on another pooled connection and the first reply
+    wins. Hedges are capped at a small fraction of all requests. GraphQL
+    POSTs are never hedged.
+
+    Args:
+        enabled: Whether to hedge.
+        max_workers: Size of the thread pool that runs hedged requests.
+    """
+    global _hedger
+    hedger = None
+    if enabled:
+        hedger = RequestHedger(
+            max_workers=2 * max_workers,
+            max_fraction=_HEDGE_MAX_FRACTION,
+            quantile=_HEDGE_QUANTILE,
+            window=_HEDGE_WINDOW,
+            min_samples=_HEDGE_MIN_SAMPLES,
+        )
+    previous, _hedger = _hedger, hedger
+    if previous is not None:
+        previous.shutdown()
+
+
+_session_lock = threading.Lock()
+_session = None
+_fanout_executor = None
+_session_token = None
+_session_pool_size = _DEFAULT_HTTP_POOL_SIZE
+
+
+def configure_session_pool(pool_size):
+    """Size the shared HTTP connection pool, normally to the worker count.
+
+    Any existing session is closed so the next request builds a fresh pool of
+    the requested size. Call this once before the first request of a run.
+
+    Args:
+        pool_size: Maximum number of keep-alive connections to GitHub.
+    """
+    global _session_pool_size
+    with _session_lock:
+        _session_pool_size = max(1, int(pool_size))
+    close_session()
+
+
+def close_session():
+    """Close the shared session and drop its pooled connections.
+
+    The fan-out pool is shut down too, so the next ``submit_fanout`` call
+    builds one sized to the current pool size.
+    """
+    global _session, _session_token, _fanout_executor
+    with _session_lock:
+        session, _session, _session_token = _session, None, None
+        fanout, _fanout_executor = _fanout_executor, None
+    if session is not None:
+        session.close()
+    if fanout is not None:
+        fanout.shutdown(wait=False)
+
+
+def submit_fanout(fn, *args, **kwargs):
+    """Run one per-PR status request on the shared fan-out pool.
+
+    Lets a caller that already runs on a worker thread start a PR's
+    independent requests (checks, reviews, ...) side by side and wait for
+    them together. Only the per-PR fallback of the batched status lookups
+    uses it. Submitted callables must be leaf requests: they must
+    not wait on other fan-out tasks themselves, or a saturated pool could
+    deadlock.
+
+    Returns:
+        concurrent.futures.Future: Future for ``fn(*args, **kwargs)``.
+    """
+    global _fanout_executor
+    with _session_lock:
+        if _fanout_executor is None:
+            _fanout_executor = ThreadPoolExecutor(
+                max_workers=2 * _session_pool_size,
+                thread_name_prefix="breakfast-fanout",
+            )
+        executor = _fanout_executor
+    return executor.submit(fn, *args, **kwargs)
+
+
+def _get_session():
+    """Return the shared keep-alive session, creating it on first use.
+
+    A single ``requests.Session`` is shared by every worker thread so TCP and
+    TLS connections to GitHub are reused instead of re-established per call.
+    The adapter's pool is sized to the configured worker count so concurrent
+    workers do not discard connections when the pool overflows.
+
+    Returns:
+        requests.Session: Session with the auth and media-type headers pre-set.
+    """
+    global _session, _session_token
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=_session_pool_size,
+                max_retries=0,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["Accept"] = "application/vnd.github.v3+json"
+            _session = session
+        if _session_token != SECRET_GITHUB_TOKEN:
+            _session.headers["Authorization"] = f"token {SECRET_GITHUB_TOKEN}"
+            _session_token = SECRET_GITHUB_TOKEN
+        return _session
+
+
+def _get_connection_stats():
+    """Return ``(opened, requests)`` counters from the shared connection pools."""
+    with _session_lock:
+        session = _session
+    if session is None:
+        return 0, 0
+    opened = sent = 0
+    for adapter in {id(a): a for a in session.adapters.values()}.values():
+        poolmanager = getattr(adapter, "poolmanager", None)
+        if poolmanager is None:
+            continue
+        for key in list(poolmanager.pools.keys()):
+            pool = poolmanager.pools.get(key)
+            if pool is None:
+                continue
+            opened += getattr(pool, "num_connections", 0)
+            sent += getattr(pool, "num_requests", 0)
+    return opened, sent
+
 
 def get_api_stats():
-    """Return a snapshot of the current API call statistics."""
+    """Return a snapshot of the current API call statistics.
+
+    Besides call counts and rate-limit headers, the snapshot includes
+    ``connections_opened`` and ``connections_reused`` taken from the shared
+    session's pools, so a run can confirm that keep-alive reuse happens, and
+    ``rate_limit_waits`` / ``rate_limit_wait_seconds`` from the scheduler,
+    ``retries`` / ``retries_refused`` from the retry policy,
+    ``hedges_sent`` / ``hedges_won`` from request hedging,
+    ``deduplicated_calls`` answered by an identical in-flight request and
+    the adaptive ``concurrency_limit``, its ``concurrency_peak`` and the
+    number of ``concurrency_backoffs``.
+    """
     with _api_stats_lock:
-        return dict(_api_stats)
+        stats = dict(_api_stats)
+    stats["rate_limit_waits"] = _rate_limit_scheduler.waits
+    stats["retries"] = _retry_policy.retries
+    hedger = _hedger
+    stats["hedges_sent"] = hedger.hedges if hedger is not None else 0
+    stats["hedges_won"] = hedger.wins if hedger is not None else 0
+    stats["retries_refused"] = _retry_policy.refused
+    stats["deduplicated_calls"] = _single_flight.shared
+    limiter = _concurrency_limiter
+    stats["concurrency_limit"] = limiter.limit
+    stats["concurrency_peak"] = limiter.peak
+    stats["concurrency_backoffs"] = limiter.backoffs
+    stats["rate_limit_wait_seconds"] = _rate_limit_scheduler.waited_seconds
+    opened, sent = _get_connection_stats()
+    stats["connections_opened"] = opened
+    stats["connections_reused"] = max(sent - opened, 0)
+    return stats
 
 
 def get_graphql_rate_limit():
@@ -177,32 +715,78 @@ def get_graphql_rate_limit():
     """
     try:
         response = make_github_graphql_request(query)
-        return response.get("data", {}).get("rateLimit")
+        rate_limit = response.get("data", {}).get("rateLimit")
+        if rate_limit:
+            _rate_limit_scheduler.record_graphql(rate_limit)
+        return rate_limit
     except (ValueError, requests.exceptions.RequestException):
         return None
 
 
+def _shared_request(key, send, *args):
+    """Run *send* through single-flight, bounding a joiner's wait by the deadline."""
+    try:
+        return _single_flight.do(key, send, *args, timeout=deadline_remaining())
+    except TimeoutError as exc:
+        raise GitHubDeadlineExceeded() from exc
+
+
 def make_github_api_request(query_string):
+    """Fetch a GitHub REST path, sharing identical requests already in flight.
+
+    Concurrent callers asking for the same path wait for a single request
+    instead of each sending their own; see ``SingleFlight``.
+    """
+    return _shared_request(("rest", query_string), _send_api_request, query_string)
+
+
+def _send_api_request(query_string):
     url = GITHUB_API_URL + query_string
-    headers = {
-        "Authorization": f"token {SECRET_GITHUB_TOKEN}",
-        "Accept": "application/vnd.github.v3+json",
-    }
+    session = _get_session()
+    resource = _rest_rate_limit_resource(query_string)
+    conditional = _conditional_requests_enabled
+    scope = _token_cache_scope() if conditional else ""
+    stored = read_conditional_entry(query_string, scope) if conditional else None
+    request_kwargs = {}
+    if stored is not None:
+        validators = {}
+        if stored["etag"]:
+            validators["If-None-Match"] = stored["etag"]
+        if stored["last_modified"]:
+            validators["If-Modified-Since"] = stored["last_modified"]
+        request_kwargs["headers"] = validators
+    _retry_policy.record_request()
+    retry_delay = 0.0
     for attempt in range(_MAX_RETRIES + 1):
         if attempt:
-            time.sleep(2 ** (attempt - 1) + random.uniform(0, 0.5))
+            _deadline_timeout(retry_delay)
+            time.sleep(retry_delay)
+        _deadline_timeout()
+        _acquire_rate_limit_budget(resource)
+        # The budget wait may have used up part of the deadline.
+        request_kwargs["timeout"] = _deadline_timeout()
         try:
             t0 = time.monotonic()
-            req = requests.get(url, headers=headers, timeout=_REQUEST_TIMEOUT)
+            hedger = _hedger
+            if hedger is None:
+                req = _send_limited("rest", session.get, url, **request_kwargs)
+            else:
+                req = hedger.call(
+                    lambda: _send_limited("rest", session.get, url, **request_kwargs),
+                    prepare_hedge=lambda: _acquire_rate_limit_budget(resource),
+                )
             elapsed_ms = int((time.monotonic() - t0) * 1000)
-            if req.status_code in _RETRY_STATUSES and attempt < _MAX_RETRIES:
+            _rate_limit_scheduler.record(resource, getattr(req, "headers", None) or {})
+            retry_delay = _retry_policy.delay_for(attempt, req)
+            if retry_delay is not None:
                 logger.debug(
                     "api_call type=rest url=%s status=%d"
-                    " elapsed_ms=%d attempt=%d retrying",
+                    " elapsed_ms=%d attempt=%d retrying delay=%.2f",
                     url,
                     req.status_code,
                     elapsed_ms,
                     attempt + 1,
+                    retry_delay,
                 )
                 continue
             if req.status_code == 401:
@@ -218,12 +802,9 @@ def make_github_api_request(query_string):
                 req.status_code == 403
                 and req.headers.get("X-RateLimit-Remaining") == "0"
             ):
-                reset_ts = req.headers.get("X-RateLimit-Reset")
-                reset_time = None
-                if reset_ts:
-                    reset_time = datetime.datetime.fromtimestamp(
-                        int(reset_ts), tz=datetime.timezone.utc
-                    ).strftime("%Y-%m-%d %H:%M:%S")
+                reset_time = _format_reset_time(
+                    req.headers.get("X-RateLimit-Reset") or None
+                )
                 logger.warning(
                     "api_call type=rest url=%s rate_limit_exceeded reset=%s",
                     url,
@@ -237,10 +818,23 @@ def make_github_api_request(query_string):
                 req.status_code,
                 elapsed_ms,
             )
-            result = req.json()
+            resp_headers = getattr(req, "headers", None) or {}
+            not_modified = req.status_code == 304 and stored is not None
+            if not_modified:
+                result = stored["body"]
+            else:
+                result = req.json()
+                if conditional and req.status_code == 200:
+                    etag = resp_headers.get("ETag")
+                    last_modified = resp_headers.get("Last-Modified")
+                    if etag or last_modified:
+                        write_conditional_entry(
+                            query_string, etag, last_modified, result, scope
+                        )
             with _api_stats_lock:
                 _api_stats["rest_calls"] += 1
-                resp_headers = getattr(req, "headers", {})
+                if not_modified:
+                    _api_stats["rest_not_modified"] += 1
                 remaining = resp_headers.get("X-RateLimit-Remaining")
                 reset_ts = resp_headers.get("X-RateLimit-Reset")
                 if remaining is not None:
@@ -259,7 +853,8 @@ def make_github_api_request(query_string):
                 str(exc),
                 attempt + 1,
             )
-            if attempt == _MAX_RETRIES:
+            retry_delay = _retry_policy.delay_for(attempt)
+            if retry_delay is None:
                 raise
 
 
@@ -269,7 +864,9 @@ def _fetch_pr_detail(pr_url):
     if len(parts) < 4:
         raise ValueError(f"Unexpected PR URL format: {pr_url!r}")
     owner, repo, pr_num = parts[0], parts[1], parts[3]
-    return make_github_api_request(f"/repos/{owner}/{repo}/pulls/{pr_num}")
+    return project_pr_detail(
+        make_github_api_request(f"/repos/{owner}/{repo}/pulls/{pr_num}")
+    )
 
 
 def make_paginated_github_api_request(query_string, rate=100):
@@ -298,29 +895,54 @@ def make_paginated_github_api_request(query_string, rate=100):
 
 
 def make_github_graphql_request(query, variables=None):
+    """Run a GraphQL query, sharing identical queries already in flight.
+
+    Two calls are identical when both the query text and the variables
+    match; see ``SingleFlight``.
+    """
+    key = ("graphql", query, json.dumps(variables or {}, sort_keys=True, default=str))
+    return _shared_request(key, _send_graphql_request, query, variables)
+
+
+def _send_graphql_request(query, variables=None):
+    session = _get_session()
     headers = {
         "Authorization": f"Bearer {SECRET_GITHUB_TOKEN}",
         "Content-Type": "application/json",
     }
     payload = {"query": query, "variables": variables or {}}
+    _retry_policy.record_request()
+    retry_delay = 0.0
     for attempt in range(_MAX_RETRIES + 1):
         if attempt:
-            time.sleep(2 ** (attempt - 1) + random.uniform(0, 0.5))
+            _deadline_timeout(retry_delay)
+            time.sleep(retry_delay)
+        _deadline_timeout()
+        _acquire_rate_limit_budget("graphql")
+        timeout = _deadline_timeout()
         try:
             t0 = time.monotonic()
-            response = requests.post(
+            response = _send_limited(
+                "graphql",
+                session.post,
                 GITHUB_GRAPHQL_URL,
                 json=payload,
                 headers=headers,
-                timeout=_REQUEST_TIMEOUT,
+                timeout=timeout,
             )
             elapsed_ms = int((time.monotonic() - t0) * 1000)
-            if response.status_code in _RETRY_STATUSES and attempt < _MAX_RETRIES:
+            _rate_limit_scheduler.record(
+                "graphql", getattr(response, "headers", None) or {}
+            )
+            retry_delay = _retry_policy.delay_for(attempt, response)
+            if retry_delay is not None:
                 logger.debug(
-                    "api_call type=graphql status=%d elapsed_ms=%d attempt=%d retrying",
+                    "api_call type=graphql status=%d elapsed_ms=%d attempt=%d"
+                    " retrying delay=%.2f",
                     response.status_code,
                     elapsed_ms,
                     attempt + 1,
+                    retry_delay,
                 )
                 continue
             if response.status_code == 401:
@@ -351,7 +973,7 @@ def make_github_graphql_request(query, variables=None):
                 error_class = GitHubGraphQLError
                 if error_types == {"RESOURCE_LIMITS_EXCEEDED"}:
                     error_class = GitHubGraphQLResourceLimitError
-                raise error_class(errors)
+                raise error_class(errors, data=resp_json.get("data"))
             logger.debug(
                 "api_call type=graphql status=%d elapsed_ms=%d",
                 response.status_code,
@@ -371,19 +993,29 @@ def make_github_graphql_request(query, variables=None):
                 str(exc),
                 attempt + 1,
             )
-            if attempt == _MAX_RETRIES:
+            retry_delay = _retry_policy.delay_for(attempt)
+            if retry_delay is None:
                 raise
 
 
 _GLOB_CHARS = frozenset("*?[")
 
 
+def _exact_repo_name(repo_filter):
+    """Return the name an ``=name`` exact filter selects, or None."""
+    if repo_filter.startswith("=") and len(repo_filter) > 1:
+        return repo_filter[1:]
+    return None
+
+
 def _match_repo_filter(repo_name, repo_filters):
     """Match a repo name against one or more filter patterns (OR logic).
 
-    Each filter uses glob matching when it contains ``*``, ``?``, or ``[``,
-    otherwise falls back to substring matching for backwards compatibility.
-    An empty list matches all repos.
+    A filter of the form ``=name`` matches that repository name exactly
+    (case-insensitively, like GitHub). Otherwise each filter uses glob
+    matching when it contains ``*``, ``?``, or ``[``, and falls back to
+    substring matching for backwards compatibility. An empty list matches
+    all repos.
     """
     if not repo_filters:
         return True
@@ -391,6 +1023,9 @@ def _match_repo_filter(repo_name, repo_filters):
 
 
 def _match_single_filter(repo_name, repo_filter):
+    exact_name = _exact_repo_name(repo_filter)
+    if exact_name is not None:
+        return repo_name.lower() == exact_name.lower()
     if any(c in repo_filter for c in _GLOB_CHARS):
         return fnmatch.fnmatch(repo_name, repo_filter)
     return repo_filter in repo_name
@@ -461,29 +1096,76 @@ def _request_github_repository_page(query, owner, cursor, page_size):
             current_page_size = next_page_size
 
 
-def get_github_prs(owner, repo_filters, fetch_state="open"):
-    """Return pull-request URLs for an owner using bounded repository pages.
+_PR_DETAIL_FIELDS = """
+                    url
+                    databaseId
+                    number
+                    title
+                    state
+                    isDraft
+                    merged
+                    createdAt
+                    updatedAt
+                    closedAt
+                    mergedAt
+                    additions
+                    deletions
+                    changedFiles
+                    mergeable
+                    mergeStateStatus
+                    headRefName
+                    headRefOid
+                    baseRefName
+                    author { login url }
+                    commits { totalCount }
+                    comments { totalCount }
+                    reviewThreads { totalCount }
+                    labels(first: 20) { nodes { name color } }
+                    reviewRequests(first: 20) {
+                      nodes {
+                        requestedReviewer {
+                          ... on User { login url }
+                          ... on Team { slug name }
+                        }
+                      }
+                    }
+"""
+
+
+# Newest activity first, so a repository cut short by
+# _GRAPHQL_OVERFLOW_MAX_PAGES loses its oldest PRs rather than arbitrary ones.
+_PR_ORDER_GQL = "orderBy: {field: UPDATED_AT, direction: DESC}"
+
+
+def _build_repository_page_query(fetch_state, pr_fields="url", repo_fields="name"):
+    """Return the repository-page discovery query for the given PR fields.
 
     Args:
-        owner: GitHub organization or user login.
-        repo_filters: Repository name filters, or an empty value for all repos.
         fetch_state: Pull-request state selector.
+        pr_fields: GraphQL selection applied to each pull-request node.
+        repo_fields: GraphQL selection applied to each repository node.
 
     Returns:
-        list[str]: Matching pull-request URLs.
+        str: Query taking ``owner``, ``cursor`` and ``repositoryPageSize``.
     """
     states_list = _FETCH_STATE_MAP.get(fetch_state.lower(), ["OPEN"])
     states_gql = ", ".join(states_list)
-    base_query = f"""
+    return f"""
     query($owner: String!, $cursor: String, $repositoryPageSize: Int!){{
       repositoryOwner(login: $owner){{
         repositories(after: $cursor, first: $repositoryPageSize){{
           nodes{{
-            name
-            pullRequests(first:100,states: [{states_gql}]){{
+            {repo_fields}
+            pullRequests(
+              first:{_GRAPHQL_PR_PAGE_SIZE},states: [{states_gql}],{_PR_ORDER_GQL}
+            ){{
                 nodes{{
-                    url
+                    {pr_fields}
                  }}
+                pageInfo {{
+                  endCursor
+                  hasNextPage
+                }}
             }}
           }}
           pageInfo {{
@@ -494,36 +1176,683 @@ def get_github_prs(owner, repo_filters, fetch_state="open"):
       }}
     }}
         """
+
+
+_discovery_progress_enabled = True
+
+
+@contextlib.contextmanager
+def quiet_discovery_progress():
+    """Silence the per-owner "Fetching ... PRs" progress line while active.
+
+    Used when several owners are discovered at once, so their inline progress
+    does not interleave on stderr; the caller prints a shared line instead.
+    """
+    global _discovery_progress_enabled
+    previous = _discovery_progress_enabled
+    _discovery_progress_enabled = False
+    try:
+        yield
+    finally:
+        _discovery_progress_enabled = previous
+
+
+_discovery_truncated = None
+
+
+@contextlib.contextmanager
+def discovery_truncation():
+    """Collect the repositories whose PR list discovery cut short while active.
+
+    Yields a set that gains ``"owner/repo"`` for each repository whose
+    overflow paging stopped at ``_GRAPHQL_OVERFLOW_MAX_PAGES``. PRs are read
+    most recently updated first, so only the oldest PRs are left out.
+    """
+    global _discovery_truncated
+    previous = _discovery_truncated
+    _discovery_truncated = truncated = set()
+    try:
+        yield truncated
+    finally:
+        _discovery_truncated = previous
+
+
+_discovery_sink = None
+
+
+@contextlib.contextmanager
+def discovery_sink(callback):
+    """Stream discovered PR URLs to *callback* while discovery runs.
+
+    Discovery functions still return their full result, but with a sink
+    installed each page's PR URLs are also handed to ``callback(urls)`` as
+    soon as the page arrives, so callers can start fetching details before
+    the last page is read. Overflow pages of large repositories follow once
+    they are loaded. The callback runs on discovery threads and may block to
+    apply back-pressure.
+    """
+    global _discovery_sink
+    previous = _discovery_sink
+    _discovery_sink = callback
+    try:
+        yield
+    finally:
+        _discovery_sink = previous
+
+
+def _emit_discovered(pull_requests):
+    """Hand a page of PR nodes to the active discovery sink, if any."""
+    sink = _discovery_sink
+    if sink is None:
+        return
+    urls = [pr["url"] for pr in pull_requests if pr and pr.get("url")]
+    if urls:
+        sink(urls)
+
+
+def _fetch_repository_pages(owner, query):
+    """Walk every repository page for an owner, echoing progress to stderr.
+
+    Repository nodes are yielded page by page as they arrive rather than
+    after the last page, so callers can act on early pages while later ones
+    are still in flight.
+
+    Args:
+        owner: GitHub organization or user login.
+        query: Query built by ``_build_repository_page_query``.
+
+    Yields:
+        dict: Non-null repository nodes, in page order.
+
+    Raises:
+        OwnerNotFoundError: If GitHub cannot resolve the owner login.
+    """
     cursor = None
     page_size = _GRAPHQL_REPOSITORY_PAGE_SIZE
-    gql_responses = []
 
-    click.echo(f"Fetching {owner} PRs...", nl=False, err=True)
+    progress = _discovery_progress_enabled
+    if progress:
+        click.echo(f"Fetching {owner} PRs...", nl=False, err=True)
     while True:
         response, page_size = _request_github_repository_page(
-            base_query, owner, cursor, page_size
+            query, owner, cursor, page_size
         )
         if response["data"]["repositoryOwner"] is None:
             raise OwnerNotFoundError(owner)
-        gql_responses.append(response)
-        page_info = response["data"]["repositoryOwner"]["repositories"]["pageInfo"]
+        repositories = response["data"]["repositoryOwner"]["repositories"]
+        yield from (repo for repo in repositories["nodes"] if repo is not None)
+        page_info = repositories["pageInfo"]
         if not page_info["hasNextPage"]:
             break
         cursor = page_info["endCursor"]
-        click.echo(random.choices(BREAKFAST_ITEMS)[0], nl=False, err=True)
-    click.echo("...Done", err=True)
+        if progress:
+            click.echo(random.choices(BREAKFAST_ITEMS)[0], nl=False, err=True)
+    if progress:
+        click.echo("...Done", err=True)
 
-    prs = []
-    for response in gql_responses:
-        for repo in response["data"]["repositoryOwner"]["repositories"]["nodes"]:
+
+def _build_pull_request_page_query(fetch_state, pr_fields="url"):
+    """Return the follow-up query for one repository's later PR pages.
+
+    Args:
+        fetch_state: Pull-request state selector.
+        pr_fields: GraphQL selection applied to each pull-request node.
+
+    Returns:
+        str: Query taking ``owner``, ``name`` and ``cursor``.
+    """
+    states_list = _FETCH_STATE_MAP.get(fetch_state.lower(), ["OPEN"])
+    states_gql = ", ".join(states_list)
+    return f"""
+    query($owner: String!, $name: String!, $cursor: String){{
+      repository(owner: $owner, name: $name){{
+        pullRequests(
+          first: {_GRAPHQL_PR_PAGE_SIZE}, after: $cursor, states: [{states_gql}],
+          {_PR_ORDER_GQL}
+        ){{
+          nodes{{
+            {pr_fields}
+          }}
+          pageInfo {{
+            endCursor
+            hasNextPage
+          }}
+        }}
+      }}
+    }}
+        """
+
+
+def _fetch_remaining_pull_requests(owner, repo, query):
+    """Follow one repository's pull-request cursor past its first page.
+
+    At most ``_GRAPHQL_OVERFLOW_MAX_PAGES`` pages are read, so one huge
+    repository (``--fetch-state all`` on a monorepo, say) cannot hold up
+    discovery indefinitely; a repository cut short is logged and flagged.
+    Each page is a separate request, so a spent ``--deadline`` also stops
+    the paging.
+
+    Args:
+        owner: GitHub organization or user login.
+        repo: Repository node from the repository-page query.
+        query: Query built by ``_build_pull_request_page_query``.
+
+    Returns:
+        tuple: Pull-request nodes from the later pages, the page count and
+        whether the cap left pages unread.
+    """
+    cursor = repo["pullRequests"]["pageInfo"]["endCursor"]
+    nodes = []
+    pages = 0
+    truncated = False
+    while cursor:
+        if pages >= _GRAPHQL_OVERFLOW_MAX_PAGES:
+            logger.warning(
+                "graphql_pr_overflow_truncated owner=%s repo=%s pages=%d pr_count=%d",
+                owner,
+                repo["name"],
+                pages,
+                len(nodes),
+            )
+            truncated = True
+            break
+        response = make_github_graphql_request(
+            query, {"owner": owner, "name": repo["name"], "cursor": cursor}
+        )
+        pages += 1
+        connection = ((response.get("data") or {}).get("repository") or {}).get(
+            "pullRequests"
+        )
+        if not connection:
+            break
+        nodes.extend(node for node in connection["nodes"] if node is not None)
+        page_info = connection["pageInfo"]
+        cursor = page_info["endCursor"] if page_info["hasNextPage"] else None
+    return nodes, pages, truncated
+
+
+def _complete_pull_request_pages(owner, repos, fetch_state, pr_fields):
+    """Append the PRs past the first page of every truncated repository.
+
+    The repository-page query only reads the first ``_GRAPHQL_PR_PAGE_SIZE``
+    PRs of each repository, keeping its cost flat. Repositories reporting
+    ``hasNextPage`` are paged with a separate per-repository query, up to
+    ``_GRAPHQL_OVERFLOW_WORKERS`` repositories at a time.
+
+    Args:
+        owner: GitHub organization or user login.
+        repos: Repository nodes to complete in place.
+        fetch_state: Pull-request state selector.
+        pr_fields: GraphQL selection applied to each pull-request node.
+
+    Returns:
+        list[str]: Names of the repositories the page cap left incomplete.
+    """
+    overflowing = [
+        repo
+        for repo in repos
+        if (repo["pullRequests"].get("pageInfo") or {}).get("hasNextPage")
+    ]
+    incomplete = []
+    if not overflowing:
+        return incomplete
+    query = _build_pull_request_page_query(fetch_state, pr_fields)
+    max_workers = min(_GRAPHQL_OVERFLOW_WORKERS, len(overflowing))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_fetch_remaining_pull_requests, owner, repo, query): repo
+            for repo in overflowing
+        }
+        for future in as_completed(futures):
+            repo = futures[future]
+            nodes, pages, truncated = future.result()
+            if truncated:
+                incomplete.append(repo["name"])
+            repo["pullRequests"]["nodes"].extend(nodes)
+            _emit_discovered(nodes)
+            with _api_stats_lock:
+                _api_stats["graphql_overflow_pages"] += pages
+            logger.debug(
+                "graphql_pr_overflow owner=%s repo=%s pages=%d pr_count=%d",
+                owner,
+                repo["name"],
+                pages,
+                len(nodes),
+            )
+    return incomplete
+
+
+def _build_named_repository_query(count, fetch_state, pr_fields, repo_fields):
+    """Return a query reading ``count`` repositories of one owner by name.
+
+    Each repository is aliased ``r{i}`` and selects the same fields as a node
+    of the repository-page query, so both paths share their post-processing.
+    """
+    states_list = _FETCH_STATE_MAP.get(fetch_state.lower(), ["OPEN"])
+    states_gql = ", ".join(states_list)
+    var_defs = "".join(f", $n{i}: String!" for i in range(count))
+    fields = "\n".join(f"""
+        r{i}: repository(name: $n{i}){{
+          {repo_fields}
+          pullRequests(
+            first:{_GRAPHQL_PR_PAGE_SIZE},states: [{states_gql}],{_PR_ORDER_GQL}
+          ){{
+            nodes{{
+              {pr_fields}
+            }}
+            pageInfo {{
+              endCursor
+              hasNextPage
+            }}
+          }}
+        }}""" for i in range(count))
+    return f"""
+    query($owner: String!{var_defs}){{
+      repositoryOwner(login: $owner){{{fields}
+      }}
+    }}
+        """
+
+
+def _fetch_named_repositories(owner, names, fetch_state, pr_fields, repo_fields):
+    """Read repositories by exact name instead of scanning the owner.
+
+    Names are resolved ``_GRAPHQL_REPOSITORY_PAGE_SIZE`` at a time with
+    aliased ``repository(name:)`` fields, so ``-r =my-app`` costs one query
+    however many repositories the owner has. Names GitHub cannot resolve are
+    skipped, as a scan would find no match for them.
+
+    Raises:
+        OwnerNotFoundError: If GitHub cannot resolve the owner login.
+    """
+    progress = _discovery_progress_enabled
+    if progress:
+        click.echo(f"Fetching {owner} PRs...", nl=False, err=True)
+    repos = []
+    for start in range(0, len(names), _GRAPHQL_REPOSITORY_PAGE_SIZE):
+        batch = names[start : start + _GRAPHQL_REPOSITORY_PAGE_SIZE]
+        query = _build_named_repository_query(
+            len(batch), fetch_state, pr_fields, repo_fields
+        )
+        variables = {"owner": owner}
+        variables.update({f"n{i}": name for i, name in enumerate(batch)})
+        try:
+            data = make_github_graphql_request(query, variables).get("data") or {}
+        except GitHubGraphQLError as exc:
+            error_types = {
+                error.get("type") if isinstance(error, dict) else None
+                for error in exc.errors
+            }
+            if error_types != {"NOT_FOUND"}:
+                raise
+            data = exc.data or {}
+        owner_node = data.get("repositoryOwner")
+        if owner_node is None:
+            raise OwnerNotFoundError(owner)
+        for i, name in enumerate(batch):
+            repo = owner_node.get(f"r{i}")
             if repo is None:
+                logger.debug(
+                    "graphql_repository_not_found owner=%s repo=%s", owner, name
+                )
                 continue
+            repos.append(repo)
+        if progress and start + _GRAPHQL_REPOSITORY_PAGE_SIZE < len(names):
+            click.echo(random.choices(BREAKFAST_ITEMS)[0], nl=False, err=True)
+    if progress:
+        click.echo("...Done", err=True)
+    return repos
+
+
+def _discover_repositories(
+    owner, repo_filters, fetch_state, pr_fields="url", repo_fields="name"
+):
+    """Return matching repository nodes with every pull-request page loaded.
+
+    Args:
+        owner: GitHub organization or user login.
+        repo_filters: Repository name filters, or an empty value for all repos.
+        fetch_state: Pull-request state selector.
+        pr_fields: GraphQL selection applied to each pull-request node.
+        repo_fields: GraphQL selection applied to each repository node.
+
+    Returns:
+        list[dict]: Repository nodes passing ``repo_filters``. Repositories
+        left incomplete by the overflow page cap are added to the active
+        ``discovery_truncation`` set.
+    """
+    exact_names = [_exact_repo_name(f) for f in repo_filters or []]
+    if exact_names and all(exact_names):
+        # Every filter names one repository: look them up directly.
+        unique_names = list({name.lower(): name for name in exact_names}.values())
+        repos = _fetch_named_repositories(
+            owner, unique_names, fetch_state, pr_fields, repo_fields
+        )
+        for repo in repos:
+            _emit_discovered(repo["pullRequests"]["nodes"])
+    else:
+        query = _build_repository_page_query(fetch_state, pr_fields, repo_fields)
+        repos = []
+        for repo in _fetch_repository_pages(owner, query):
             if _match_repo_filter(repo["name"], repo_filters):
-                for pr in repo["pullRequests"]["nodes"]:
-                    prs.append(pr["url"])
+                repos.append(repo)
+                _emit_discovered(repo["pullRequests"]["nodes"])
+    incomplete = _complete_pull_request_pages(owner, repos, fetch_state, pr_fields)
+    collector = _discovery_truncated
+    if collector is not None:
+        collector.update(f"{owner}/{name}" for name in incomplete)
+    return repos
+
+
+def get_github_prs(owner, repo_filters, fetch_state="open"):
+    """Return pull-request URLs for an owner using bounded repository pages.
+
+    Args:
+        owner: GitHub organization or user login.
+        repo_filters: Repository name filters, or an empty value for all repos.
+        fetch_state: Pull-request state selector.
+
+    Returns:
+        list[str]: Matching pull-request URLs.
+    """
+    prs = []
+    for repo in _discover_repositories(owner, repo_filters, fetch_state):
+        for pr in repo["pullRequests"]["nodes"]:
+            prs.append(pr["url"])
     return prs
 
 
+def get_github_pr_updates(owner, repo_filters, fetch_state="open"):
+    """Return pull-request URLs with their ``updatedAt`` timestamps.
+
+    Costs the same repository-page queries as ``get_github_prs``; the extra
+    field lets callers tell which cached PRs changed since they were stored.
+
+    Args:
+        owner: GitHub organization or user login.
+        repo_filters: Repository name filters, or an empty value for all repos.
+        fetch_state: Pull-request state selector.
+
+    Returns:
+        dict[str, str]: Pull-request URL mapped to its ISO 8601 ``updatedAt``,
+        in discovery order.
+    """
+    updates = {}
+    for repo in _discover_repositories(
+        owner, repo_filters, fetch_state, pr_fields="url updatedAt"
+    ):
+        for pr in repo["pullRequests"]["nodes"]:
+            updates[pr["url"]] = pr.get("updatedAt")
+    return updates
+
+
+_SEARCH_STATE_QUALIFIERS = {
+    "open": ["is:open"],
+    "closed": ["is:closed", "is:unmerged"],
+    "merged": ["is:merged"],
+    "all": [],
+}
+
+_SEARCH_QUERY = """
+query($searchQuery: String!, $cursor: String){
+  search(query: $searchQuery, type: ISSUE, first: 100, after: $cursor){
+    issueCount
+    nodes{
+      ... on PullRequest {
+        url
+        updatedAt
+        repository { name }
+      }
+    }
+    pageInfo {
+      endCursor
+      hasNextPage
+    }
+  }
+}
+"""
+
+
+def _quote_search_term(value):
+    """Quote a search qualifier value when it contains spaces or commas."""
+    if any(c in value for c in ' ,"'):
+        return '"' + value.replace('"', "") + '"'
+    return value
+
+
+def build_pr_search_query(
+    owner,
+    repo_filters,
+    fetch_state="open",
+    *,
+    mine_only=False,
+    needs_my_review=False,
+    labels=(),
+    exclude_labels=(),
+    no_drafts=False,
+    drafts_only=False,
+):
+    """Return the GitHub search string selecting an owner's matching PRs.
+
+    ``user:`` scopes the search to the owner (organizations included). Exact
+    ``=name`` repo filters become ``repo:`` qualifiers when every filter is
+    exact; substring and glob filters cannot be expressed in search syntax
+    and are applied to the results instead.
+
+    Args:
+        owner: GitHub organization or user login.
+        repo_filters: Repository name filters, or an empty value for all repos.
+        fetch_state: Pull-request state selector.
+        mine_only: Restrict to PRs authored by the authenticated user.
+        needs_my_review: Restrict to PRs requesting the user's review.
+        labels: Labels of which a PR must carry at least one.
+        exclude_labels: Labels a PR must not carry.
+        no_drafts: Exclude draft PRs.
+        drafts_only: Restrict to draft PRs.
+
+    Returns:
+        str: Search query for ``type: ISSUE`` searches.
+    """
+    terms = ["is:pr", f"user:{owner}"]
+    exact_names = [_exact_repo_name(f) for f in repo_filters or []]
+    if exact_names and all(exact_names):
+        terms.extend(f"repo:{owner}/{name}" for name in dict.fromkeys(exact_names))
+    terms.extend(_SEARCH_STATE_QUALIFIERS.get(fetch_state.lower(), ["is:open"]))
+    if mine_only:
+        terms.append("author:@me")
+    if needs_my_review:
+        terms.append("review-requested:@me")
+    if labels:
+        terms.append("label:" + ",".join(_quote_search_term(lb) for lb in labels))
+    terms.extend(f"-label:{_quote_search_term(lb)}" for lb in exclude_labels)
+    if no_drafts:
+        terms.append("draft:false")
+    if drafts_only:
+        terms.append("draft:true")
+    return " ".join(terms)
+
+
+def _is_unsearchable_owner_error(exc):
+    """Return True when a search failed because its ``user:`` does not exist.
+
+    GitHub rejects the whole query with an ``INVALID`` error rather than
+    returning no results, so the message is the only marker.
+    """
+    return any(
+        isinstance(error, dict)
+        and "cannot be searched" in str(error.get("message", "")).lower()
+        for error in exc.errors
+    )
+
+
+def search_github_prs(owner, repo_filters, fetch_state="open", **qualifiers):
+    """Discover an owner's PRs with the search API instead of a repo scan.
+
+    Cost grows with the number of matching PRs rather than the size of the
+    owner, so personal views (``author:@me``, ``review-requested:@me``) on a
+    large organization take a page or two. GitHub returns at most
+    ``_GRAPHQL_SEARCH_RESULT_LIMIT`` results per search; a larger match is
+    truncated and logged.
+
+    Args:
+        owner: GitHub organization or user login.
+        repo_filters: Repository name filters, or an empty value for all repos.
+        fetch_state: Pull-request state selector.
+        **qualifiers: Keyword arguments for ``build_pr_search_query``.
+
+    Returns:
+        dict[str, str]: Pull-request URL mapped to its ``updatedAt``, in
+        search order.
+
+    Raises:
+        OwnerNotFoundError: If GitHub cannot resolve the owner login.
+    """
+    search_query = build_pr_search_query(owner, repo_filters, fetch_state, **qualifiers)
+    progress = _discovery_progress_enabled
+    if progress:
+        click.echo(f"Fetching {owner} PRs...", nl=False, err=True)
+    updates = {}
+    cursor = None
+    while True:
+        try:
+            response = make_github_graphql_request(
+                _SEARCH_QUERY, {"searchQuery": search_query, "cursor": cursor}
+            )
+        except GitHubGraphQLError as exc:
+            if _is_unsearchable_owner_error(exc):
+                raise OwnerNotFoundError(owner) from exc
+            raise
+        search = response["data"]["search"]
+        page = []
+        for node in search["nodes"]:
+            if not node or "url" not in node:
+                continue
+            repo_name = (node.get("repository") or {}).get("name", "")
+            if _match_repo_filter(repo_name, repo_filters):
+                updates[node["url"]] = node.get("updatedAt")
+                page.append(node)
+        _emit_discovered(page)
+        if not search["pageInfo"]["hasNextPage"]:
+            break
+        cursor = search["pageInfo"]["endCursor"]
+        if progress:
+            click.echo(random.choices(BREAKFAST_ITEMS)[0], nl=False, err=True)
+    if progress:
+        click.echo("...Done", err=True)
+    if search["issueCount"] > _GRAPHQL_SEARCH_RESULT_LIMIT:
+        logger.warning(
+            "graphql_search_truncated owner=%s issue_count=%d limit=%d query=%r",
+            owner,
+            search["issueCount"],
+            _GRAPHQL_SEARCH_RESULT_LIMIT,
+            search_query,
+        )
+    logger.debug(
+        "graphql_search owner=%s query=%r pr_count=%d",
+        owner,
+        search_query,
+        len(updates),
+    )
+    return updates
+
+
+_GRAPHQL_MERGEABLE_MAP = {"MERGEABLE": True, "CONFLICTING": False}
+
+
+def _normalize_graphql_pr(node, repo):
+    """Reshape a GraphQL pull-request node into the REST ``pulls/{n}`` layout.
+
+    Only the fields read by the renderers, filters, sorters and templates are
+    produced, under the same keys and value types as the REST payload, so the
+    rest of the pipeline cannot tell which API a PR came from.
+
+    Args:
+        node: Pull-request node selected with ``_PR_DETAIL_FIELDS``.
+        repo: Repository node carrying ``name``, ``url`` and ``owner``.
+
+    Returns:
+        dict: PR detail in the REST response shape.
+    """
+    author = node.get("author") or {}
+    reviewers = []
+    teams = []
+    for request in (node.get("reviewRequests") or {}).get("nodes") or []:
+        reviewer = (request or {}).get("requestedReviewer") or {}
+        if "login" in reviewer:
+            reviewers.append(
+                {"login": reviewer["login"], "html_url": reviewer.get("url")}
+            )
+        elif "slug" in reviewer:
+            teams.append({"slug": reviewer["slug"], "name": reviewer.get("name")})
+    merge_state = node.get("mergeStateStatus")
+    repo_info = {
+        "name": repo["name"],
+        "html_url": repo.get("url"),
+        "owner": {"login": (repo.get("owner") or {}).get("login")},
+    }
+    return {
+        "id": node.get("databaseId"),
+        "number": node.get("number"),
+        "html_url": node.get("url"),
+        "title": node.get("title", ""),
+        "state": "open" if node.get("state") == "OPEN" else "closed",
+        "draft": bool(node.get("isDraft")),
+        "merged": bool(node.get("merged")),
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "closed_at": node.get("closedAt"),
+        "merged_at": node.get("mergedAt"),
+        "additions": node.get("additions", 0),
+        "deletions": node.get("deletions", 0),
+        "changed_files": node.get("changedFiles", 0),
+        "commits": (node.get("commits") or {}).get("totalCount", 0),
+        "comments": (node.get("comments") or {}).get("totalCount", 0),
+        "review_comments": (node.get("reviewThreads") or {}).get("totalCount", 0),
+        "mergeable": _GRAPHQL_MERGEABLE_MAP.get(node.get("mergeable")),
+        "mergeable_state": merge_state.lower() if merge_state else None,
+        "user": {
+            "login": author.get("login", "ghost"),
+            "html_url": author.get("url"),
+        },
+        "labels": [
+            {"name": label["name"], "color": label.get("color")}
+            for label in (node.get("labels") or {}).get("nodes") or []
+            if label
+        ],
+        "requested_reviewers": reviewers,
+        "requested_teams": teams,
+        "head": {"ref": node.get("headRefName"), "sha": node.get("headRefOid")},
+        "base": {"ref": node.get("baseRefName"), "repo": repo_info},
+    }
+
+
+def get_github_pr_details(owner, repo_filters, fetch_state="open"):
+    """Return full PR details for an owner straight from the discovery query.
+
+    Selects every field the renderers need in the repository-page query, so
+    one GraphQL page replaces the per-URL REST ``pulls/{n}`` detail calls.
+
+    Args:
+        owner: GitHub organization or user login.
+        repo_filters: Repository name filters, or an empty value for all repos.
+        fetch_state: Pull-request state selector.
+
+    Returns:
+        list[dict]: Matching PR details in the REST response shape.
+    """
+    details = []
+    for repo in _discover_repositories(
+        owner,
+        repo_filters,
+        fetch_state,
+        pr_fields=_PR_DETAIL_FIELDS,
+        repo_fields="name url owner { login }",
+    ):
+        for pr in repo["pullRequests"]["nodes"]:
+            details.append(_normalize_graphql_pr(pr, repo))
+    return details
+
+
 def get_authenticated_user_login():
     user = make_github_api_request("/user")
     login = user.get("login")
@@ -546,7 +1875,19 @@ def _review_status_from_latest_reviews(owner, repo, pr_number):
     reviews = make_paginated_github_api_request(
         f"/repos/{owner}/{repo}/pulls/{pr_number}/reviews"
     )
+    return _summarize_reviews(reviews)
+
 
+def _summarize_reviews(reviews):
+    """Aggregate approval state from review events in chronological order.
+
+    Args:
+        reviews: Reviews in the REST shape (``user.login`` and ``state``).
+
+    Returns:
+        dict: ``status`` (``approved``, ``changes`` or ``pending``) and the
+        ``current`` approval count.
+    """
     if not reviews:
         return {"status": "pending", "current": 0}
 
@@ -582,7 +1923,23 @@ def get_required_approving_review_count(owner, repo, branch):
     Returns:
         int | None: Required approval count, or ``None`` when it cannot be
         determined from branch protection data.
+
+    Results are memoised for the process and, when enabled via
+    ``configure_protection_cache``, on disk across runs.
     """
+    ttl = _protection_cache_ttl
+    scope = _token_cache_scope()
+    if ttl is not None and not _protection_cache_refresh:
+        cached = read_protection_cache(owner, repo, branch, ttl, scope)
+        if cached is not None:
+            return cached["required"]
+    required = _fetch_required_approving_review_count(owner, repo, branch)
+    if ttl is not None:
+        write_protection_cache(owner, repo, branch, required, scope)
+    return required
+
+
+def _fetch_required_approving_review_count(owner, repo, branch):
     encoded_branch = quote(branch, safe="")
     query_string = (
         f"/repos/{owner}/{repo}/branches/{encoded_branch}"
@@ -632,6 +1989,8 @@ def _fetch_review_decision(owner, repo, pr_number):
             .get("pullRequest", {})
             .get("reviewDecision")
         )
+    except GitHubDeadlineExceeded:
+        raise
     except (ValueError, requests.exceptions.RequestException):
         return None
 
@@ -659,7 +2018,6 @@ def get_approval_summary(
         review counts.
     """
     review_summary = _review_status_from_latest_reviews(owner, repo, pr_number)
-    current_reviews = review_summary["current"]
     required_reviews = None
 
     if base_branch:
@@ -667,12 +2025,29 @@ def get_approval_summary(
             required_reviews = get_required_approving_review_count(
                 owner, repo, base_branch
             )
+        except GitHubDeadlineExceeded:
+            raise
         except requests.exceptions.RequestException:
             required_reviews = None
 
     if review_decision is _REVIEW_DECISION_SENTINEL:
         review_decision = _fetch_review_decision(owner, repo, pr_number)
 
+    return _combine_approval_summary(review_summary, required_reviews, review_decision)
+
+
+def _combine_approval_summary(review_summary, required_reviews, review_decision):
+    """Merge review tallies, branch protection and ``reviewDecision``.
+
+    Args:
+        review_summary: Result of ``_summarize_reviews``.
+        required_reviews: Required approval count, or ``None`` if unknown.
+        review_decision: GitHub ``reviewDecision`` value, or ``None``.
+
+    Returns:
+        dict: Summary with ``status``, ``current`` and ``required``.
+    """
+    current_reviews = review_summary["current"]
     status = _REVIEW_DECISION_MAP.get(review_decision, review_summary["status"])
 
     if required_reviews is not None and review_decision is None and status != "changes":
@@ -712,15 +2087,154 @@ def get_approval_status(owner, repo, pr_number, base_branch=None):
     )["status"]
 
 
-def get_check_status(owner, repo, sha):
-    # Check Runs API (GitHub Actions, newer CI integrations)
-    cr_data = make_github_api_request(f"/repos/{owner}/{repo}/commits/{sha}/check-runs")
-    check_runs = cr_data.get("check_runs", [])
+_APPROVAL_BATCH_FIELDS = """
+          reviewDecision
+          latestOpinionatedReviews(first: 100) {
+            nodes { state author { login } }
+          }
+"""
+
+
+def _build_approval_batch_query(count):
+    """Return an aliased query resolving ``count`` PRs' approval signals."""
+    var_defs = ", ".join(
+        f"$o{i}: String!, $r{i}: String!, $n{i}: Int!" for i in range(count)
+    )
+    fields = "\n".join(f"""
+      a{i}: repository(owner: $o{i}, name: $r{i}) {{
+        pullRequest(number: $n{i}) {{{_APPROVAL_BATCH_FIELDS}}}
+      }}""" for i in range(count))
+    return f"query({var_defs}) {{{fields}\n    }}"
+
+
+def _approval_summary_from_graphql(pull_request, required_reviews=None):
+    """Build an approval summary from one batched ``pullRequest`` node."""
+    pull_request = pull_request or {}
+    reviews = [
+        {
+            "user": {"login": (node.get("author") or {}).get("login")},
+            "state": node.get("state"),
+        }
+        for node in (pull_request.get("latestOpinionatedReviews") or {}).get("nodes")
+        or []
+        if node
+    ]
+    return _combine_approval_summary(
+        _summarize_reviews(reviews),
+        required_reviews,
+        pull_request.get("reviewDecision"),
+    )
+
+
+def _required_review_counts(targets):
+    """Return the required approval count per ``(owner, repo, base_branch)``.
+
+    Branch protection is read over REST through
+    ``get_required_approving_review_count`` and its protection cache, one
+    lookup per distinct base branch, side by side on the fan-out pool. A
+    lookup that fails counts as unknown, as in ``get_approval_summary``.
+    """
+    futures = {
+        (owner, repo, base_branch): submit_fanout(
+            get_required_approving_review_count, owner, repo, base_branch
+        )
+        for owner, repo, _pr_number, base_branch in targets
+        if base_branch
+    }
+    counts = {}
+    for key, future in futures.items():
+        try:
+            counts[key] = future.result()
+        except GitHubDeadlineExceeded:
+            for pending in futures.values():
+                pending.cancel()
+            raise
+        except requests.exceptions.RequestException:
+            counts[key] = None
+    return counts
+
+
+def _fetch_approval_summary_batch(targets):
+    """Resolve one batch of approval targets with a single query."""
+    variables = {}
+    for i, (owner, repo, pr_number, _base_branch) in enumerate(targets):
+        variables.update({f"o{i}": owner, f"r{i}": repo, f"n{i}": int(pr_number)})
+    response = make_github_graphql_request(
+        _build_approval_batch_query(len(targets)), variables
+    )
+    data = response.get("data") or {}
+    required = _required_review_counts(targets)
+    return {
+        target[:3]: _approval_summary_from_graphql(
+            (data.get(f"a{i}") or {}).get("pullRequest"),
+            required.get((target[0], target[1], target[3])),
+        )
+        for i, target in enumerate(targets)
+    }
+
+
+def get_approval_summaries(targets):
+    """Resolve approval summaries for many PRs with batched GraphQL queries.
+
+    Each query reads ``reviewDecision`` and the latest opinionated review per
+    reviewer for up to ``_GRAPHQL_BATCH_SIZE`` PRs, replacing the paginated
+    REST reviews walk and the per-PR ``reviewDecision`` query. Required
+    approval counts come from ``get_required_approving_review_count``, whose
+    protection cache and tolerance of 403/404 keep a token that may not read
+    branch protection from failing the whole batch. A batch GitHub rejects
+    falls back to ``get_approval_summary`` for its PRs.
+
+    Args:
+        targets: Iterable of ``(owner, repo, pr_number, base_branch)`` tuples.
+
+    Returns:
+        dict: ``(owner, repo, pr_number)`` mapped to summaries with
+        ``status``, ``current`` and ``required``.
+    """
+    unique = list(dict.fromkeys(targets))
+    results = {}
+    for start in range(0, len(unique), _GRAPHQL_BATCH_SIZE):
+        batch = unique[start : start + _GRAPHQL_BATCH_SIZE]
+        try:
+            results.update(_fetch_approval_summary_batch(batch))
+            continue
+        except GitHubGraphQLError as exc:
+            logger.warning(
+                "approval_batch_failed size=%d error_count=%d errors=%s",
+                len(batch),
+                exc.error_count,
+                exc.summary,
+            )
+        for owner, repo, pr_number, base_branch in batch:
+            try:
+                results[(owner, repo, pr_number)] = get_approval_summary(
+                    owner, repo, pr_number, base_branch=base_branch
+                )
+            except (ValueError, requests.exceptions.RequestException) as exc:
+                logger.warning(
+                    "approval_status_fetch_failed target=%s error=%r",
+                    (owner, repo, pr_number),
+                    str(exc),
+                )
+                results[(owner, repo, pr_number)] = {
+                    "status": "pending",
+                    "current": 0,
+                    "required": None,
+                }
+    return results
+
+
+def _classify_checks(check_runs, statuses):
+    """Reduce check runs and commit statuses to pass/fail/pending/none.
 
-    # Commit Status API (Jenkins, older CI integrations)
-    status_data = make_github_api_request(f"/repos/{owner}/{repo}/commits/{sha}/status")
-    statuses = status_data.get("statuses", [])
+    Args:
+        check_runs: Check Runs in the REST shape (lowercase ``status`` and
+            ``conclusion``).
+        statuses: Commit statuses in the REST shape (lowercase ``state``).
 
+    Returns:
+        str: One of ``pass``, ``fail``, ``pending``, or ``none``.
+    """
     if not check_runs and not statuses:
         return "none"
 
@@ -747,6 +2261,195 @@ def get_check_status(owner, repo, sha):
     return "pass"
 
 
+def _fetch_counted_pages(query_string, key):
+    """Return every item under *key* of a paginated ``total_count`` resource.
+
+    Pages of ``_CHECK_PAGE_SIZE`` are read until a short page arrives or the
+    items collected reach the response's ``total_count``, so a commit with
+    more checks than one page holds is not classified from a partial list.
+    """
+    items = []
+    page = 1
+    while True:
+        data = make_github_api_request(
+            f"{query_string}?per_page={_CHECK_PAGE_SIZE}&page={page}"
+        )
+        batch = data.get(key, [])
+        items.extend(batch)
+        total = data.get("total_count")
+        if len(batch) < _CHECK_PAGE_SIZE or (
+            isinstance(total, int) and len(items) >= total
+        ):
+            return items
+        page += 1
+
+
+def _fetch_check_runs(owner, repo, sha):
+    """Return a commit's check runs (GitHub Actions, newer CI integrations)."""
+    return _fetch_counted_pages(
+        f"/repos/{owner}/{repo}/commits/{sha}/check-runs", "check_runs"
+    )
+
+
+def _fetch_commit_statuses(owner, repo, sha):
+    """Return a commit's statuses (Jenkins, older CI integrations)."""
+    return _fetch_counted_pages(
+        f"/repos/{owner}/{repo}/commits/{sha}/status", "statuses"
+    )
+
+
+def get_check_status(owner, repo, sha):
+    cached = cached_check_status(owner, repo, sha)
+    if cached is not None:
+        return cached
+    check_runs = _fetch_check_runs(owner, repo, sha)
+    statuses = _fetch_commit_statuses(owner, repo, sha)
+    status = _classify_checks(check_runs, statuses)
+    store_check_status(owner, repo, sha, status)
+    return status
+
+
+_CHECK_ROLLUP_FIELDS = """
+        statusCheckRollup {
+          state
+          contexts(first: 100) {
+            pageInfo { hasNextPage }
+            nodes {
+              __typename
+              ... on CheckRun { status conclusion }
+              ... on StatusContext { state }
+            }
+          }
+        }
+"""
+
+_ROLLUP_STATE_MAP = {
+    "SUCCESS": "pass",
+    "FAILURE": "fail",
+    "ERROR": "fail",
+    "PENDING": "pending",
+    "EXPECTED": "pending",
+}
+
+
+def _check_status_from_rollup(rollup):
+    """Map a GraphQL ``statusCheckRollup`` onto the check vocabulary.
+
+    The individual contexts are classified with the same rules as the REST
+    path. When a commit has more contexts than one page holds, GitHub's own
+    rollup ``state`` (which covers every context) is used instead.
+
+    Args:
+        rollup: ``statusCheckRollup`` object, or ``None`` for no checks.
+
+    Returns:
+        str: One of ``pass``, ``fail``, ``pending``, or ``none``.
+    """
+    if not rollup:
+        return "none"
+    contexts = rollup.get("contexts") or {}
+    if (contexts.get("pageInfo") or {}).get("hasNextPage"):
+        return _ROLLUP_STATE_MAP.get(rollup.get("state"), "none")
+    check_runs = []
+    statuses = []
+    for node in contexts.get("nodes") or []:
+        if not node:
+            continue
+        if node.get("__typename") == "CheckRun":
+            conclusion = node.get("conclusion")
+            check_runs.append(
+                {
+                    "status": (node.get("status") or "").lower(),
+                    "conclusion": conclusion.lower() if conclusion else None,
+                }
+            )
+        elif node.get("__typename") == "StatusContext":
+            state = node.get("state") or ""
+            statuses.append(
+                {"state": "pending" if state == "EXPECTED" else state.lower()}
+            )
+    return _classify_checks(check_runs, statuses)
+
+
+def _build_check_batch_query(count):
+    """Return an aliased query resolving ``count`` commits' check rollups."""
+    var_defs = ", ".join(
+        f"$o{i}: String!, $r{i}: String!, $s{i}: GitObjectID!" for i in range(count)
+    )
+    fields = "\n".join(f"""
+      c{i}: repository(owner: $o{i}, name: $r{i}) {{
+        object(oid: $s{i}) {{
+          ... on Commit {{{_CHECK_ROLLUP_FIELDS}}}
+        }}
+      }}""" for i in range(count))
+    return f"query({var_defs}) {{{fields}\n    }}"
+
+
+def _fetch_check_status_batch(targets):
+    """Resolve one batch of ``(owner, repo, sha)`` targets with a single query."""
+    variables = {}
+    for i, (owner, repo, sha) in enumerate(targets):
+        variables.update({f"o{i}": owner, f"r{i}": repo, f"s{i}": sha})
+    response = make_github_graphql_request(
+        _build_check_batch_query(len(targets)), variables
+    )
+    data = response.get("data") or {}
+    results = {}
+    for i, target in enumerate(targets):
+        commit = (data.get(f"c{i}") or {}).get("object") or {}
+        results[target] = _check_status_from_rollup(commit.get("statusCheckRollup"))
+    return results
+
+
+def get_check_statuses(targets):
+    """Resolve CI status for many commits with batched GraphQL queries.
+
+    Each query covers up to ``_GRAPHQL_BATCH_SIZE`` commits through aliased
+    ``statusCheckRollup`` lookups, replacing two REST calls per commit. A batch
+    that GitHub rejects outright (for example because one repository is no
+    longer visible) falls back to the REST resolver for its commits.
+
+    Args:
+        targets: Iterable of ``(owner, repo, sha)`` tuples.
+
+    Returns:
+        dict: ``(owner, repo, sha)`` mapped to ``pass``, ``fail``, ``pending``,
+        or ``none``.
+    """
+    results = {}
+    unique = []
+    for target in dict.fromkeys(targets):
+        cached = cached_check_status(*target)
+        if cached is None:
+            unique.append(target)
+        else:
+            results[target] = cached
+    for start in range(0, len(unique), _GRAPHQL_BATCH_SIZE):
+        batch = unique[start : start + _GRAPHQL_BATCH_SIZE]
+        try:
+            fetched = _fetch_check_status_batch(batch)
+            for target, status in fetched.items():
+                store_check_status(*target, status)
+            results.update(fetched)
+            continue
+        except GitHubGraphQLError as exc:
+            logger.warning(
+                "check_status_batch_failed size=%d error_count=%d errors=%s",
+                len(batch),
+                exc.error_count,
+                exc.summary,
+            )
+        for target in batch:
+            try:
+                results[target] = get_check_status(*target)
+            except requests.exceptions.RequestException as exc:
+                logger.warning(
+                    "check_status_fetch_failed target=%s error=%r", target, str(exc)
+                )
+                results[target] = "none"
+    return results
+
+
 def _pr_days_since(timestamp_str, now=None):
     """Return the number of days since the given ISO 8601 timestamp, or 0 on error."""
     if not timestamp_str:
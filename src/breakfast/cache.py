@@ -1,12 +1,21 @@
 import hashlib
 import json
 import os
-from datetime import datetime, timezone
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from urllib.parse import urlparse
 
 import click
 
-from .constants import _SUFFIX_MAP
+from .constants import (
+    _FAILED_CHECK_CACHE_TTL,
+    _PR_DETAIL_PROJECTION,
+    _PR_DETAIL_SCHEMA_VERSION,
+    _SUFFIX_MAP,
+)
 from .logger import logger
 from .xdg import get_cache_dir
 
@@ -60,50 +69,673 @@ def parse_ttl(value: str | int) -> int:
     return n
 
 
+def _project(value, spec):
+    if spec is None:
+        return value
+    if isinstance(value, list):
+        return [_project(item, spec) for item in value]
+    if isinstance(value, dict):
+        return {
+            key: _project(value[key], sub) for key, sub in spec.items() if key in value
+        }
+    return value
+
+
+def project_pr_detail(pr_detail: dict) -> dict:
+    """Return *pr_detail* reduced to the fields in ``_PR_DETAIL_PROJECTION``.
+
+    A REST ``pulls/{n}`` payload carries the PR body and dozens of URL
+    templates on its nested repo objects; the renderers, filters, sorters and
+    templates read about 25 fields. Fields the payload lacks stay absent, so
+    ``.get()`` defaults behave as before.
+    """
+    return _project(pr_detail, _PR_DETAIL_PROJECTION)
+
+
 def make_cache_key(org: str, repo_filter: str) -> str:
     """Return a 16-hex-char key for (org, repo_filter), case-normalised."""
     raw = f"{org.lower()}:{repo_filter.lower()}"
     return hashlib.sha256(raw.encode()).hexdigest()[:16]
 
 
-def cache_path(org: str, repo_filter: str) -> Path:
-    key = make_cache_key(org, repo_filter)
-    return _CACHE_DIR / f"prs_{key}.json"
+# ---------------------------------------------------------------------------
+# SQLite store
+#
+# The PR, URL-list and per-commit check caches share one SQLite database in
+# WAL mode, so concurrent runs can read while another writes and a multi-repo
+# refresh commits in a single transaction. The read_*/write_* functions below
+# keep the shapes the per-key JSON files had; those files are imported into the
+# store the first time it is opened, then removed.
+#
+# PR bodies live once each in ``pr_objects``, keyed by the PR's id, its
+# updated_at and a digest of the body; the per-set ``prs`` rows and the per-PR
+# ``pr_entries`` rows are manifests that reference them by key. A PR cached
+# by several layers, or rewritten unchanged, is stored and written once.
+# Bodies are stored projected (``project_pr_detail``); ``meta.pr_detail_schema``
+# records the projection they follow.
+# ---------------------------------------------------------------------------
 
+_STORE_NAME = "cache.sqlite3"
+_STORE_SCHEMA_VERSION = "1"
+_store_local = threading.local()
+
+_STORE_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS pr_sets (
+        kind TEXT NOT NULL,
+        owner TEXT NOT NULL,
+        scope TEXT NOT NULL,
+        fetched_at TEXT NOT NULL,
+        has_checks INTEGER NOT NULL,
+        has_approvals INTEGER NOT NULL,
+        has_approval_details INTEGER NOT NULL,
+        coverage TEXT,
+        PRIMARY KEY (kind, owner, scope)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS pr_sets_fetched_at ON pr_sets (fetched_at)",
+    """
+    CREATE TABLE IF NOT EXISTS prs (
+        kind TEXT NOT NULL,
+        owner TEXT NOT NULL,
+        scope TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        pr_id INTEGER,
+        repo TEXT,
+        object_key TEXT NOT NULL,
+        PRIMARY KEY (kind, owner, scope, position)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS prs_pr_id ON prs (pr_id)",
+    "CREATE INDEX IF NOT EXISTS prs_owner_repo ON prs (owner, repo)",
+    "CREATE INDEX IF NOT EXISTS prs_object_key ON prs (object_key)",
+    """
+    CREATE TABLE IF NOT EXISTS checks (
+        kind TEXT NOT NULL,
+        owner TEXT NOT NULL,
+        scope TEXT NOT NULL,
+        pr_id INTEGER NOT NULL,
+        status TEXT NOT NULL,
+        PRIMARY KEY (kind, owner, scope, pr_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS approvals (
+        kind TEXT NOT NULL,
+        owner TEXT NOT NULL,
+        scope TEXT NOT NULL,
+        pr_id INTEGER NOT NULL,
+        status TEXT,
+        detail TEXT,
+        PRIMARY KEY (kind, owner, scope, pr_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS url_lists (
+        owner TEXT NOT NULL,
+        scope TEXT NOT NULL,
+        fetched_at TEXT NOT NULL,
+        PRIMARY KEY (owner, scope)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS url_lists_fetched_at ON url_lists (fetched_at)",
+    """
+    CREATE TABLE IF NOT EXISTS urls (
+        owner TEXT NOT NULL,
+        scope TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        url TEXT NOT NULL,
+        PRIMARY KEY (owner, scope, position)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS commit_checks (
+        owner TEXT NOT NULL,
+        repo TEXT NOT NULL,
+        sha TEXT NOT NULL,
+        status TEXT NOT NULL,
+        fetched_at TEXT NOT NULL,
+        PRIMARY KEY (owner, repo, sha)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS pr_entries (
+        url TEXT PRIMARY KEY,
+        owner TEXT NOT NULL,
+        repo TEXT NOT NULL,
+        pr_id INTEGER,
+        fetched_at TEXT NOT NULL,
+        object_key TEXT NOT NULL,
+        check_status TEXT,
+        approval_detail TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS pr_entries_owner_repo ON pr_entries (owner, repo)",
+    "CREATE INDEX IF NOT EXISTS pr_entries_fetched_at ON pr_entries (fetched_at)",
+    "CREATE INDEX IF NOT EXISTS pr_entries_object_key ON pr_entries (object_key)",
+    """
+    CREATE TABLE IF NOT EXISTS pr_objects (
+        key TEXT PRIMARY KEY,
+        pr_id INTEGER,
+        body TEXT NOT NULL
+    )
+    """,
+)
 
-def graphql_cache_path(org: str, repo_filter: str) -> Path:
-    key = make_cache_key(org, repo_filter)
-    return _CACHE_DIR / f"graphql_{key}.json"
 
+# PR sets: "result" rows hold a whole run keyed by (org spec, repo filter);
+# "repo" rows hold one repository keyed by (org, repo name).
+_RESULT_SET = "result"
+_REPO_SET = "repo"
 
-def read_graphql_cache(org: str, repo_filter: str, ttl: int) -> list | None:
-    """Return cached PR URL list if present and within TTL, else None."""
-    path = graphql_cache_path(org, repo_filter)
+_CACHE_READ_ERRORS = (
+    OSError,
+    sqlite3.Error,
+    json.JSONDecodeError,
+    KeyError,
+    ValueError,
+    TypeError,
+)
+
+
+def store_path() -> Path:
+    """Return the SQLite database holding the PR, URL-list and check caches."""
+    return _CACHE_DIR / _STORE_NAME
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection, immediate: bool = False):
+    """Run the block in one transaction, rolling back if it raises.
+
+    Reads use a deferred transaction so they see a single snapshot; writes
+    take the write lock up front (``BEGIN IMMEDIATE``) so two writers wait on
+    the busy timeout instead of failing to upgrade a read lock.
+    """
+    conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
     try:
-        if not path.exists():
-            logger.debug("cache_miss layer=graphql path=%s reason=file_not_found", path)
+        yield conn
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _open_store(path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=5, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with _transaction(conn, immediate=True):
+            for statement in _STORE_SCHEMA:
+                conn.execute(statement)
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = 'schema_version'"
+            ).fetchone()
+            if row is None:
+                _migrate_json_files(conn)
+                conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (_STORE_SCHEMA_VERSION,),
+                )
+            _check_pr_detail_schema(conn)
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+def _check_pr_detail_schema(conn: sqlite3.Connection) -> None:
+    """Drop cached PRs stored under another ``_PR_DETAIL_SCHEMA_VERSION``.
+
+    Bodies are projected when written, so ones projected with another field
+    set may lack fields now needed; every cached PR set and per-PR entry is
+    dropped rather than served.
+    """
+    row = conn.execute(
+        "SELECT value FROM meta WHERE key = 'pr_detail_schema'"
+    ).fetchone()
+    if row is not None and row[0] == _PR_DETAIL_SCHEMA_VERSION:
+        return
+    if row is not None:
+        for table in ("pr_sets", "prs", "checks", "approvals", "pr_entries"):
+            conn.execute(f"DELETE FROM {table}")
+        _drop_orphan_objects(conn)
+        logger.debug(
+            "cache_pr_schema_invalidated from=%s to=%s",
+            row[0],
+            _PR_DETAIL_SCHEMA_VERSION,
+        )
+    conn.execute(
+        "INSERT INTO meta (key, value) VALUES ('pr_detail_schema', ?)"
+        " ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+        (_PR_DETAIL_SCHEMA_VERSION,),
+    )
+
+
+def _is_unreadable_store(exc: sqlite3.Error) -> bool:
+    return getattr(exc, "sqlite_errorcode", None) in (
+        sqlite3.SQLITE_NOTADB,
+        sqlite3.SQLITE_CORRUPT,
+    )
+
+
+def _connect() -> sqlite3.Connection:
+    """Return this thread's connection to the store, opening it on first use.
+
+    SQLite connections must not be shared between threads, so each thread
+    keeps its own. A file that is not a readable database is only ever a
+    cache, so it is discarded and recreated rather than failing every run.
+    """
+    path = store_path()
+    connections = getattr(_store_local, "connections", None)
+    if connections is None:
+        connections = _store_local.connections = {}
+    conn = connections.get(path)
+    if conn is not None and path.exists():
+        return conn
+    if conn is not None:
+        conn.close()
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    try:
+        conn = _open_store(path)
+    except sqlite3.DatabaseError as exc:
+        if not _is_unreadable_store(exc):
+            raise
+        logger.warning("cache_store_reset path=%s error=%r", path, str(exc))
+        click.echo(
+            click.style(
+                f"Warning: cache store was unreadable and has been reset: {exc}",
+                fg="yellow",
+            ),
+            err=True,
+        )
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{path}{suffix}").unlink(missing_ok=True)
+        conn = _open_store(path)
+    connections[path] = conn
+    return conn
+
+
+def close_store() -> None:
+    """Close the calling thread's store connections."""
+    connections = getattr(_store_local, "connections", None) or {}
+    for conn in connections.values():
+        conn.close()
+    connections.clear()
+
+
+def _age_seconds(fetched_at: str) -> float:
+    return (
+        datetime.now(timezone.utc) - datetime.fromisoformat(fetched_at)
+    ).total_seconds()
+
+
+def _pr_repo_name(pr: dict) -> str | None:
+    try:
+        return pr["base"]["repo"]["name"].lower()
+    except (KeyError, TypeError, AttributeError):
+        return None
+
+
+def _pr_object_key(pr: dict, body: str) -> str:
+    """Return the pr_objects key for a PR: its id, updated_at and a body digest.
+
+    id and updated_at identify the PR revision; the digest separates bodies
+    that share them but were fetched differently (a search result versus the
+    full REST detail, or a mergeable state GitHub computed later).
+    """
+    digest = hashlib.sha256(body.encode()).hexdigest()[:16]
+    return f"{pr.get('id')}:{pr.get('updated_at')}:{digest}"
+
+
+def _put_pr_object(conn: sqlite3.Connection, pr: dict) -> str:
+    """Store *pr*, projected, unless its key is already there; return the key."""
+    pr = project_pr_detail(pr)
+    body = json.dumps(pr)
+    key = _pr_object_key(pr, body)
+    conn.execute(
+        "INSERT INTO pr_objects (key, pr_id, body) VALUES (?, ?, ?)"
+        " ON CONFLICT (key) DO NOTHING",
+        (key, pr.get("id"), body),
+    )
+    return key
+
+
+def _load_pr_object(object_key: str, body: str | None) -> dict:
+    if body is None:
+        raise KeyError(f"PR object {object_key!r} is missing")
+    return json.loads(body)
+
+
+def _drop_orphan_objects(conn: sqlite3.Connection) -> int:
+    """Delete PR bodies no manifest references any more; return how many."""
+    return conn.execute(
+        "DELETE FROM pr_objects"
+        " WHERE key NOT IN (SELECT object_key FROM prs)"
+        " AND key NOT IN (SELECT object_key FROM pr_entries)"
+    ).rowcount
+
+
+def _put_pr_set(
+    conn: sqlite3.Connection,
+    kind: str,
+    owner: str,
+    scope: str,
+    pr_details: list,
+    check_statuses: dict | None,
+    approval_statuses: dict | None,
+    approval_details: dict | None,
+    fetched_at: str,
+    coverage: dict | None = None,
+) -> None:
+    """Upsert one PR set row by row, dropping rows the new contents no longer have."""
+    key = (kind, owner.lower(), scope.lower())
+    conn.execute(
+        "INSERT INTO pr_sets (kind, owner, scope, fetched_at, has_checks,"
+        " has_approvals, has_approval_details, coverage)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+        " ON CONFLICT (kind, owner, scope) DO UPDATE SET"
+        " fetched_at = excluded.fetched_at, has_checks = excluded.has_checks,"
+        " has_approvals = excluded.has_approvals,"
+        " has_approval_details = excluded.has_approval_details,"
+        " coverage = excluded.coverage",
+        (
+            *key,
+            fetched_at,
+            check_statuses is not None,
+            approval_statuses is not None,
+            approval_details is not None,
+            json.dumps(coverage) if coverage is not None else None,
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO prs (kind, owner, scope, position, pr_id, repo, object_key)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?)"
+        " ON CONFLICT (kind, owner, scope, position) DO UPDATE SET"
+        " pr_id = excluded.pr_id, repo = excluded.repo,"
+        " object_key = excluded.object_key",
+        [
+            (
+                *key,
+                position,
+                pr.get("id"),
+                _pr_repo_name(pr),
+                _put_pr_object(conn, pr),
+            )
+            for position, pr in enumerate(pr_details)
+        ],
+    )
+    conn.execute(
+        "DELETE FROM prs WHERE kind = ? AND owner = ? AND scope = ? AND position >= ?",
+        (*key, len(pr_details)),
+    )
+
+    checks = {int(k): v for k, v in (check_statuses or {}).items()}
+    conn.executemany(
+        "INSERT INTO checks (kind, owner, scope, pr_id, status)"
+        " VALUES (?, ?, ?, ?, ?)"
+        " ON CONFLICT (kind, owner, scope, pr_id) DO UPDATE SET"
+        " status = excluded.status",
+        [(*key, pr_id, status) for pr_id, status in checks.items()],
+    )
+    conn.execute(
+        "DELETE FROM checks WHERE kind = ? AND owner = ? AND scope = ?"
+        " AND pr_id NOT IN (SELECT value FROM json_each(?))",
+        (*key, json.dumps(list(checks))),
+    )
+
+    statuses = {int(k): v for k, v in (approval_statuses or {}).items()}
+    details = {int(k): v for k, v in (approval_details or {}).items()}
+    approval_ids = list(dict.fromkeys([*statuses, *details]))
+    conn.executemany(
+        "INSERT INTO approvals (kind, owner, scope, pr_id, status, detail)"
+        " VALUES (?, ?, ?, ?, ?, ?)"
+        " ON CONFLICT (kind, owner, scope, pr_id) DO UPDATE SET"
+        " status = excluded.status, detail = excluded.detail",
+        [
+            (
+                *key,
+                pr_id,
+                statuses.get(pr_id),
+                json.dumps(details[pr_id]) if pr_id in details else None,
+            )
+            for pr_id in approval_ids
+        ],
+    )
+    conn.execute(
+        "DELETE FROM approvals WHERE kind = ? AND owner = ? AND scope = ?"
+        " AND pr_id NOT IN (SELECT value FROM json_each(?))",
+        (*key, json.dumps(approval_ids)),
+    )
+
+
+def _get_pr_set(
+    conn: sqlite3.Connection,
+    kind: str,
+    owner: str,
+    scope: str,
+    ttl: int,
+    ignore_ttl: bool,
+    layer: str,
+) -> dict | None:
+    key = (kind, owner.lower(), scope.lower())
+    with _transaction(conn):
+        row = conn.execute(
+            "SELECT fetched_at, has_checks, has_approvals, has_approval_details,"
+            " coverage FROM pr_sets WHERE kind = ? AND owner = ? AND scope = ?",
+            key,
+        ).fetchone()
+        if row is None:
+            logger.debug(
+                "cache_miss layer=%s key=%s/%s reason=not_found", layer, owner, scope
+            )
             return None
-        data = json.loads(path.read_text())
-        fetched_at = datetime.fromisoformat(data["fetched_at"])
-        age = (datetime.now(timezone.utc) - fetched_at).total_seconds()
-        if age > ttl:
+        fetched_at, has_checks, has_approvals, has_approval_details, coverage = row
+        age = _age_seconds(fetched_at)
+        if not ignore_ttl and age > ttl:
             logger.debug(
-                "cache_miss layer=graphql path=%s reason=expired age=%.0fs ttl=%ss",
-                path,
+                "cache_miss layer=%s key=%s/%s reason=expired age=%.0fs ttl=%ss",
+                layer,
+                owner,
+                scope,
                 age,
                 ttl,
             )
             return None
+        prs = [
+            _load_pr_object(object_key, body)
+            for object_key, body in conn.execute(
+                "SELECT prs.object_key, pr_objects.body FROM prs"
+                " LEFT JOIN pr_objects ON pr_objects.key = prs.object_key"
+                " WHERE kind = ? AND owner = ? AND scope = ? ORDER BY position",
+                key,
+            )
+        ]
+        checks = dict(
+            conn.execute(
+                "SELECT pr_id, status FROM checks"
+                " WHERE kind = ? AND owner = ? AND scope = ?",
+                key,
+            ).fetchall()
+        )
+        approval_rows = conn.execute(
+            "SELECT pr_id, status, detail FROM approvals"
+            " WHERE kind = ? AND owner = ? AND scope = ?",
+            key,
+        ).fetchall()
+    logger.debug(
+        "cache_hit layer=%s key=%s/%s age=%.0fs pr_count=%d",
+        layer,
+        owner,
+        scope,
+        age,
+        len(prs),
+    )
+    return {
+        "prs": prs,
+        "fetched_at": fetched_at,
+        "coverage": json.loads(coverage) if coverage is not None else None,
+        "check_statuses": checks if has_checks else None,
+        "approval_statuses": (
+            {pr_id: status for pr_id, status, _ in approval_rows if status is not None}
+            if has_approvals
+            else None
+        ),
+        "approval_details": (
+            {
+                pr_id: json.loads(detail)
+                for pr_id, _, detail in approval_rows
+                if detail is not None
+            }
+            if has_approval_details
+            else None
+        ),
+    }
+
+
+def _put_url_list(
+    conn: sqlite3.Connection, owner: str, scope: str, urls: list, fetched_at: str
+) -> None:
+    key = (owner.lower(), scope.lower())
+    conn.execute(
+        "INSERT INTO url_lists (owner, scope, fetched_at) VALUES (?, ?, ?)"
+        " ON CONFLICT (owner, scope) DO UPDATE SET fetched_at = excluded.fetched_at",
+        (*key, fetched_at),
+    )
+    conn.executemany(
+        "INSERT INTO urls (owner, scope, position, url) VALUES (?, ?, ?, ?)"
+        " ON CONFLICT (owner, scope, position) DO UPDATE SET url = excluded.url",
+        [(*key, position, url) for position, url in enumerate(urls)],
+    )
+    conn.execute(
+        "DELETE FROM urls WHERE owner = ? AND scope = ? AND position >= ?",
+        (*key, len(urls)),
+    )
+
+
+def _put_commit_check(
+    conn: sqlite3.Connection,
+    owner: str,
+    repo: str,
+    sha: str,
+    status: str,
+    fetched_at: str,
+) -> None:
+    conn.execute(
+        "INSERT INTO commit_checks (owner, repo, sha, status, fetched_at)"
+        " VALUES (?, ?, ?, ?, ?)"
+        " ON CONFLICT (owner, repo, sha) DO UPDATE SET"
+        " status = excluded.status, fetched_at = excluded.fetched_at",
+        (owner.lower(), repo.lower(), sha, status, fetched_at),
+    )
+
+
+def _migrate_json_files(conn: sqlite3.Connection) -> None:
+    """Import the per-key JSON cache files the store replaced, then delete them.
+
+    Runs once, inside the transaction that creates the schema. A file that
+    cannot be read is dropped rather than imported; it would only have been
+    a cache miss.
+    """
+    imported = 0
+    for pattern in ("prs_*.json", "pr_repo_*.json", "graphql_*.json", "checks_*.json"):
+        for path in sorted(_CACHE_DIR.glob(pattern)):
+            try:
+                data = json.loads(path.read_text())
+                if pattern == "graphql_*.json":
+                    _put_url_list(
+                        conn,
+                        data["organization"],
+                        data["repo_filter"],
+                        data["urls"],
+                        data["fetched_at"],
+                    )
+                elif pattern == "checks_*.json":
+                    _put_commit_check(
+                        conn,
+                        data["owner"],
+                        data["repo"],
+                        data["sha"],
+                        data["status"],
+                        data["fetched_at"],
+                    )
+                else:
+                    is_repo = pattern == "pr_repo_*.json"
+                    _put_pr_set(
+                        conn,
+                        _REPO_SET if is_repo else _RESULT_SET,
+                        data["organization"],
+                        data["repo"] if is_repo else data["repo_filter"],
+                        data["prs"],
+                        data.get("check_statuses"),
+                        data.get("approval_statuses"),
+                        data.get("approval_details"),
+                        data["fetched_at"],
+                    )
+                imported += 1
+            except (OSError, json.JSONDecodeError, KeyError, ValueError, TypeError):
+                logger.debug("cache_migrate_skip path=%s", path)
+            path.unlink(missing_ok=True)
+    if imported:
+        logger.debug("cache_migrate imported=%d", imported)
+
+
+def read_graphql_cache(org: str, repo_filter: str, ttl: int) -> list | None:
+    """Return cached PR URL list if present and within TTL, else None."""
+    try:
+        conn = _connect()
+        key = (org.lower(), repo_filter.lower())
+        with _transaction(conn):
+            row = conn.execute(
+                "SELECT fetched_at FROM url_lists WHERE owner = ? AND scope = ?", key
+            ).fetchone()
+            if row is None:
+                logger.debug(
+                    "cache_miss layer=graphql key=%s/%s reason=not_found",
+                    org,
+                    repo_filter,
+                )
+                return None
+            age = _age_seconds(row[0])
+            if age > ttl:
+                logger.debug(
+                    "cache_miss layer=graphql key=%s/%s reason=expired"
+                    " age=%.0fs ttl=%ss",
+                    org,
+                    repo_filter,
+                    age,
+                    ttl,
+                )
+                return None
+            urls = [
+                url
+                for (url,) in conn.execute(
+                    "SELECT url FROM urls WHERE owner = ? AND scope = ?"
+                    " ORDER BY position",
+                    key,
+                )
+            ]
         logger.debug(
-            "cache_hit layer=graphql path=%s age=%.0fs url_count=%d",
-            path,
+            "cache_hit layer=graphql key=%s/%s age=%.0fs url_count=%d",
+            org,
+            repo_filter,
             age,
-            len(data["urls"]),
+            len(urls),
         )
-        return data["urls"]
-    except (OSError, json.JSONDecodeError, KeyError, ValueError, TypeError) as exc:
+        return urls
+    except _CACHE_READ_ERRORS as exc:
         logger.warning(
-            "cache_read_error layer=graphql path=%s error=%r", path, str(exc)
+            "cache_read_error layer=graphql key=%s/%s error=%r",
+            org,
+            repo_filter,
+            str(exc),
         )
         click.echo(
             click.style(f"Warning: failed to read GraphQL cache: {exc}", fg="yellow"),
@@ -113,23 +745,24 @@ def read_graphql_cache(org: str, repo_filter: str, ttl: int) -> list | None:
 
 
 def write_graphql_cache(org: str, repo_filter: str, urls: list) -> None:
-    """Write PR URL list to disk cache. Silently ignores write failures."""
+    """Write PR URL list to the cache store. Warns instead of raising on failure."""
     try:
-        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        path = graphql_cache_path(org, repo_filter)
-        payload = {
-            "fetched_at": datetime.now(timezone.utc).isoformat(),
-            "organization": org,
-            "repo_filter": repo_filter,
-            "url_count": len(urls),
-            "urls": urls,
-        }
-        _atomic_write_text(path, json.dumps(payload))
-        logger.debug("cache_write layer=graphql path=%s url_count=%d", path, len(urls))
-    except OSError as exc:
+        conn = _connect()
+        with _transaction(conn, immediate=True):
+            _put_url_list(
+                conn, org, repo_filter, urls, datetime.now(timezone.utc).isoformat()
+            )
+        logger.debug(
+            "cache_write layer=graphql key=%s/%s url_count=%d",
+            org,
+            repo_filter,
+            len(urls),
+        )
+    except (OSError, sqlite3.Error) as exc:
         logger.warning(
-            "cache_write_error layer=graphql path=%s error=%r",
-            graphql_cache_path(org, repo_filter),
+            "cache_write_error layer=graphql key=%s/%s error=%r",
+            org,
+            repo_filter,
             str(exc),
         )
         click.echo(
@@ -151,170 +784,570 @@ def read_pr_cache(
       "check_statuses"   – dict[int, str] or None (absent from older caches)
       "approval_statuses"– dict[int, str] or None (absent from older caches)
       "approval_details" – dict[int, dict] or None (absent from older caches)
+      "coverage"         – the owners/filters/state the entry holds, or None
     """
-    path = cache_path(org, repo_filter)
     try:
-        if not path.exists():
-            logger.debug(
-                "cache_miss layer=pr_detail path=%s reason=file_not_found", path
+        return _get_pr_set(
+            _connect(), _RESULT_SET, org, repo_filter, ttl, ignore_ttl, "pr_detail"
+        )
+    except _CACHE_READ_ERRORS as exc:
+        logger.warning(
+            "cache_read_error layer=pr_detail key=%s/%s error=%r",
+            org,
+            repo_filter,
+            str(exc),
+        )
+        click.echo(
+            click.style(f"Warning: failed to read PR cache: {exc}", fg="yellow"),
+            err=True,
+        )
+        return None
+
+
+def write_pr_cache(
+    org: str,
+    repo_filter: str,
+    pr_details: list,
+    check_statuses: dict | None = None,
+    approval_statuses: dict | None = None,
+    approval_details: dict | None = None,
+    coverage: dict | None = None,
+) -> None:
+    """Write pr_details (and optional statuses) to the cache store.
+
+    *coverage* records which owners, repo filters and fetch state the PRs
+    were discovered for, so narrower queries can be answered from this entry
+    (see ``list_pr_cache_coverage``).
+    """
+    try:
+        conn = _connect()
+        with _transaction(conn, immediate=True):
+            _put_pr_set(
+                conn,
+                _RESULT_SET,
+                org,
+                repo_filter,
+                pr_details,
+                check_statuses,
+                approval_statuses,
+                approval_details,
+                datetime.now(timezone.utc).isoformat(),
+                coverage,
             )
-            return None
-        data = json.loads(path.read_text())
-        fetched_at = datetime.fromisoformat(data["fetched_at"])
-        age = (datetime.now(timezone.utc) - fetched_at).total_seconds()
-        if not ignore_ttl and age > ttl:
-            logger.debug(
-                "cache_miss layer=pr_detail path=%s reason=expired age=%.0fs ttl=%ss",
-                path,
-                age,
-                ttl,
+            _drop_orphan_objects(conn)
+        logger.debug(
+            "cache_write layer=pr_detail key=%s/%s pr_count=%d",
+            org,
+            repo_filter,
+            len(pr_details),
+        )
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning(
+            "cache_write_error layer=pr_detail key=%s/%s error=%r",
+            org,
+            repo_filter,
+            str(exc),
+        )
+        click.echo(
+            click.style(f"Warning: failed to write PR cache: {exc}", fg="yellow"),
+            err=True,
+        )
+
+
+def list_pr_cache_coverage(ttl: int) -> list:
+    """Return the coverage of every full-result entry within *ttl*, newest first.
+
+    Each item has ``org`` and ``repo_filter`` (the entry's key, for
+    ``read_pr_cache``) and the ``coverage`` recorded when it was written.
+    Entries written without coverage are left out.
+    """
+    try:
+        rows = (
+            _connect()
+            .execute(
+                "SELECT owner, scope, fetched_at, coverage FROM pr_sets"
+                " WHERE kind = ? AND coverage IS NOT NULL"
+                " ORDER BY fetched_at DESC",
+                (_RESULT_SET,),
             )
-            return None
-        # JSON keys are always strings; convert back to int for PR IDs.
-        raw_checks = data.get("check_statuses")
-        raw_approvals = data.get("approval_statuses")
-        raw_approval_details = data.get("approval_details")
-        pr_count = len(data["prs"])
+            .fetchall()
+        )
+        return [
+            {"org": owner, "repo_filter": scope, "coverage": json.loads(coverage)}
+            for owner, scope, fetched_at, coverage in rows
+            if _age_seconds(fetched_at) <= ttl
+        ]
+    except _CACHE_READ_ERRORS as exc:
+        logger.warning("cache_read_error layer=pr_detail_coverage error=%r", str(exc))
+        return []
+
+
+def read_repo_pr_cache(
+    org: str, repo_name: str, ttl: int, ignore_ttl: bool = False
+) -> dict | None:
+    """Return cached PR details for a single repo, or None on miss/expiry.
+
+    If ignore_ttl is True, expired cache data will still be returned on a hit.
+    """
+    try:
+        return _get_pr_set(
+            _connect(), _REPO_SET, org, repo_name, ttl, ignore_ttl, "repo_pr"
+        )
+    except _CACHE_READ_ERRORS as exc:
+        logger.warning(
+            "cache_read_error layer=repo_pr key=%s/%s error=%r",
+            org,
+            repo_name,
+            str(exc),
+        )
+        click.echo(
+            click.style(f"Warning: failed to read repo PR cache: {exc}", fg="yellow"),
+            err=True,
+        )
+        return None
+
+
+def write_repo_pr_caches(entries: dict) -> None:
+    """Write several repos' PR details to the cache store in one transaction.
+
+    *entries* maps ``(org, repo_name)`` to a dict with a ``prs`` list and
+    optional ``check_statuses``, ``approval_statuses`` and ``approval_details``
+    maps, as ``write_repo_pr_cache`` takes them. Either every repo is written
+    or, on failure, none is.
+    """
+    if not entries:
+        return
+    try:
+        conn = _connect()
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        with _transaction(conn, immediate=True):
+            for (org, repo_name), entry in entries.items():
+                _put_pr_set(
+                    conn,
+                    _REPO_SET,
+                    org,
+                    repo_name,
+                    entry["prs"],
+                    entry.get("check_statuses"),
+                    entry.get("approval_statuses"),
+                    entry.get("approval_details"),
+                    fetched_at,
+                )
+            _drop_orphan_objects(conn)
         logger.debug(
-            "cache_hit layer=pr_detail path=%s age=%.0fs pr_count=%d",
-            path,
-            age,
-            pr_count,
+            "cache_write layer=repo_pr repos=%d pr_count=%d",
+            len(entries),
+            sum(len(entry["prs"]) for entry in entries.values()),
         )
-        return {
-            "prs": data["prs"],
-            "fetched_at": data["fetched_at"],
-            "check_statuses": (
-                {int(k): v for k, v in raw_checks.items()}
-                if raw_checks is not None
-                else None
-            ),
-            "approval_statuses": (
-                {int(k): v for k, v in raw_approvals.items()}
-                if raw_approvals is not None
-                else None
-            ),
-            "approval_details": (
-                {int(k): v for k, v in raw_approval_details.items()}
-                if raw_approval_details is not None
-                else None
-            ),
-        }
-    except (OSError, json.JSONDecodeError, KeyError, ValueError, TypeError) as exc:
+    except (OSError, sqlite3.Error) as exc:
         logger.warning(
-            "cache_read_error layer=pr_detail path=%s error=%r", path, str(exc)
+            "cache_write_error layer=repo_pr repos=%d error=%r", len(entries), str(exc)
+        )
+        click.echo(
+            click.style(f"Warning: failed to write repo PR cache: {exc}", fg="yellow"),
+            err=True,
+        )
+
+
+def write_repo_pr_cache(
+    org: str,
+    repo_name: str,
+    pr_details: list,
+    check_statuses: dict | None = None,
+    approval_statuses: dict | None = None,
+    approval_details: dict | None = None,
+) -> None:
+    """Write PR details for a single repo to the cache store."""
+    write_repo_pr_caches(
+        {
+            (org, repo_name): {
+                "prs": pr_details,
+                "check_statuses": check_statuses,
+                "approval_statuses": approval_statuses,
+                "approval_details": approval_details,
+            }
+        }
+    )
+
+
+def _url_repo(url: str) -> tuple[str, str]:
+    parts = urlparse(url).path.strip("/").split("/")
+    if len(parts) < 2:
+        raise ValueError(f"Not a pull request URL: {url!r}")
+    return parts[0].lower(), parts[1].lower()
+
+
+def read_pr_entries(urls: list, ttl: int, ignore_ttl: bool = False) -> dict:
+    """Return the per-PR cache entries for *urls* that are within *ttl*.
+
+    Each PR is cached on its own, keyed by its URL, so a repo with one new PR
+    only misses on that PR. URLs with no fresh entry are simply absent from
+    the result. If ignore_ttl is True, expired entries are returned too.
+
+    Returns:
+        dict[str, dict]: Keyed by URL, each with ``pr``, ``check_status``,
+        ``approval_detail`` (None when not cached) and ``fetched_at``.
+    """
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+    try:
+        conn = _connect()
+        rows = conn.execute(
+            "SELECT url, fetched_at, object_key, pr_objects.body, check_status,"
+            " approval_detail FROM pr_entries"
+            " LEFT JOIN pr_objects ON pr_objects.key = pr_entries.object_key"
+            " WHERE url IN (SELECT value FROM json_each(?))",
+            (json.dumps(urls),),
+        ).fetchall()
+        entries = {}
+        expired = 0
+        for url, fetched_at, object_key, body, check_status, approval_detail in rows:
+            if not ignore_ttl and _age_seconds(fetched_at) > ttl:
+                expired += 1
+                continue
+            entries[url] = {
+                "pr": _load_pr_object(object_key, body),
+                "check_status": check_status,
+                "approval_detail": (
+                    json.loads(approval_detail) if approval_detail is not None else None
+                ),
+                "fetched_at": fetched_at,
+            }
+        logger.debug(
+            "cache_lookup layer=pr_entry hits=%d misses=%d expired=%d",
+            len(entries),
+            len(urls) - len(entries),
+            expired,
         )
+        return entries
+    except _CACHE_READ_ERRORS as exc:
+        logger.warning("cache_read_error layer=pr_entry error=%r", str(exc))
         click.echo(
             click.style(f"Warning: failed to read PR cache: {exc}", fg="yellow"),
             err=True,
         )
+        return {}
+
+
+def write_pr_entries(
+    entries: dict, vanished_from: dict | None = None, max_age: int | None = None
+) -> None:
+    """Upsert per-PR cache entries and drop PRs that have left their repos.
+
+    *entries* maps a PR URL to a dict with ``pr`` and optional
+    ``check_status`` and ``approval_detail``. *vanished_from* maps
+    ``(owner, repo)`` to every PR URL discovery currently returns for that
+    repo; cached PRs of those repos outside the list are deleted. Entries
+    fetched more than *max_age* seconds ago are deleted as well, whatever
+    their repo. All of it happens in one transaction, which also removes PR
+    objects no entry references any more.
+    """
+    vanished_from = vanished_from or {}
+    if not entries and not vanished_from and max_age is None:
+        return
+    try:
+        conn = _connect()
+        now = datetime.now(timezone.utc)
+        fetched_at = now.isoformat()
+        dropped = 0
+        with _transaction(conn, immediate=True):
+            conn.executemany(
+                "INSERT INTO pr_entries (url, owner, repo, pr_id, fetched_at,"
+                " object_key, check_status, approval_detail)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT (url) DO UPDATE SET owner = excluded.owner,"
+                " repo = excluded.repo, pr_id = excluded.pr_id,"
+                " fetched_at = excluded.fetched_at, object_key = excluded.object_key,"
+                " check_status = excluded.check_status,"
+                " approval_detail = excluded.approval_detail",
+                [
+                    (
+                        url,
+                        *_url_repo(url),
+                        entry["pr"].get("id"),
+                        fetched_at,
+                        _put_pr_object(conn, entry["pr"]),
+                        entry.get("check_status"),
+                        (
+                            json.dumps(entry["approval_detail"])
+                            if entry.get("approval_detail") is not None
+                            else None
+                        ),
+                    )
+                    for url, entry in entries.items()
+                ],
+            )
+            for (owner, repo), urls in vanished_from.items():
+                dropped += conn.execute(
+                    "DELETE FROM pr_entries WHERE owner = ? AND repo = ?"
+                    " AND url NOT IN (SELECT value FROM json_each(?))",
+                    (owner.lower(), repo.lower(), json.dumps(list(urls))),
+                ).rowcount
+            expired = 0
+            if max_age is not None:
+                expired = conn.execute(
+                    "DELETE FROM pr_entries WHERE fetched_at < ?",
+                    ((now - timedelta(seconds=max_age)).isoformat(),),
+                ).rowcount
+            _drop_orphan_objects(conn)
+        logger.debug(
+            "cache_write layer=pr_entry pr_count=%d dropped=%d expired=%d",
+            len(entries),
+            dropped,
+            expired,
+        )
+    except (OSError, sqlite3.Error, ValueError, TypeError) as exc:
+        logger.warning("cache_write_error layer=pr_entry error=%r", str(exc))
+        click.echo(
+            click.style(f"Warning: failed to write PR cache: {exc}", fg="yellow"),
+            err=True,
+        )
+
+
+def read_check_cache(
+    owner: str,
+    repo: str,
+    sha: str,
+    ttl: int,
+    fail_ttl: int = _FAILED_CHECK_CACHE_TTL,
+) -> str | None:
+    """Return the cached check status for a commit, or None on a miss.
+
+    ``pass`` never expires, since every run and status on that commit has
+    concluded successfully. ``fail`` is trusted for *fail_ttl* seconds,
+    because a failed run can be re-run on the same commit. ``pending`` and
+    ``none`` can change at any moment, so they are only returned within
+    *ttl* seconds.
+    """
+    try:
+        row = (
+            _connect()
+            .execute(
+                "SELECT status, fetched_at FROM commit_checks"
+                " WHERE owner = ? AND repo = ? AND sha = ?",
+                (owner.lower(), repo.lower(), sha),
+            )
+            .fetchone()
+        )
+        if row is None:
+            logger.debug(
+                "cache_miss layer=checks key=%s/%s@%s reason=not_found",
+                owner,
+                repo,
+                sha,
+            )
+            return None
+        status, fetched_at = row
+        if status != "pass":
+            age = _age_seconds(fetched_at)
+            if status == "fail":
+                ttl = fail_ttl
+            if age > ttl:
+                logger.debug(
+                    "cache_miss layer=checks key=%s/%s@%s reason=expired"
+                    " status=%s age=%.0fs ttl=%ss",
+                    owner,
+                    repo,
+                    sha,
+                    status,
+                    age,
+                    ttl,
+                )
+                return None
+        logger.debug(
+            "cache_hit layer=checks key=%s/%s@%s status=%s", owner, repo, sha, status
+        )
+        return status
+    except _CACHE_READ_ERRORS as exc:
+        logger.warning(
+            "cache_read_error layer=checks key=%s/%s@%s error=%r",
+            owner,
+            repo,
+            sha,
+            str(exc),
+        )
         return None
 
 
-def repo_pr_cache_path(org: str, repo_name: str) -> Path:
-    raw = f"{org.lower()}:{repo_name.lower()}"
+def write_check_cache(owner: str, repo: str, sha: str, status: str) -> None:
+    """Persist a commit's check status, keyed by the commit SHA."""
+    try:
+        conn = _connect()
+        with _transaction(conn, immediate=True):
+            _put_commit_check(
+                conn, owner, repo, sha, status, datetime.now(timezone.utc).isoformat()
+            )
+        logger.debug(
+            "cache_write layer=checks key=%s/%s@%s status=%s", owner, repo, sha, status
+        )
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning(
+            "cache_write_error layer=checks key=%s/%s@%s error=%r",
+            owner,
+            repo,
+            sha,
+            str(exc),
+        )
+
+
+def conditional_cache_path(request_path: str, scope: str = "") -> Path:
+    raw = f"{scope}:{request_path}"
     key = hashlib.sha256(raw.encode()).hexdigest()[:16]
-    return _CACHE_DIR / f"pr_repo_{key}.json"
+    return _CACHE_DIR / f"etag_{key}.json"
+
 
+def read_conditional_entry(request_path: str, scope: str = "") -> dict | None:
+    """Return the stored validators and body for a REST request path, or None.
 
-def read_repo_pr_cache(org: str, repo_name: str, ttl: int) -> dict | None:
-    """Return cached PR details for a single repo, or None on miss/expiry."""
-    path = repo_pr_cache_path(org, repo_name)
+    The entry has ``etag``, ``last_modified`` and ``body`` keys. GitHub
+    decides freshness by answering the validators with 304, so entries do
+    not expire; a hit marks the file as used for
+    ``prune_conditional_cache``. Bodies are only visible to the token that
+    fetched them, so entries are keyed by *scope*, an identity of that token.
+    """
+    path = conditional_cache_path(request_path, scope)
     try:
         if not path.exists():
-            logger.debug("cache_miss layer=repo_pr path=%s reason=file_not_found", path)
             return None
         data = json.loads(path.read_text())
+        if data.get("path") != request_path or data.get("scope", "") != scope:
+            return None
+        if not data.get("etag") and not data.get("last_modified"):
+            return None
+        os.utime(path)
+        return {
+            "etag": data.get("etag"),
+            "last_modified": data.get("last_modified"),
+            "body": data["body"],
+        }
+    except (OSError, json.JSONDecodeError, KeyError, AttributeError) as exc:
+        logger.warning(
+            "cache_read_error layer=conditional path=%s error=%r", path, str(exc)
+        )
+        return None
+
+
+def write_conditional_entry(
+    request_path: str,
+    etag: str | None,
+    last_modified: str | None,
+    body,
+    scope: str = "",
+) -> None:
+    """Persist a REST response body with its ETag/Last-Modified validators."""
+    path = conditional_cache_path(request_path, scope)
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "path": request_path,
+            "scope": scope,
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+        }
+        _atomic_write_text(path, json.dumps(payload))
+        logger.debug("cache_write layer=conditional path=%s", path)
+    except (OSError, TypeError, ValueError) as exc:
+        logger.warning(
+            "cache_write_error layer=conditional path=%s error=%r", path, str(exc)
+        )
+
+
+def prune_conditional_cache(max_age: int) -> int:
+    """Delete stored validators not written or used for *max_age* seconds.
+
+    Returns:
+        int: Number of files removed.
+    """
+    cutoff = datetime.now(timezone.utc).timestamp() - max_age
+    removed = 0
+    try:
+        for path in _CACHE_DIR.glob("etag_*.json"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+    except OSError as exc:
+        logger.warning("cache_prune_error layer=conditional error=%r", str(exc))
+    if removed:
+        logger.debug("cache_prune layer=conditional removed=%d", removed)
+    return removed
+
+
+def protection_cache_path(owner: str, repo: str, branch: str, scope: str = "") -> Path:
+    raw = f"{scope}:{owner.lower()}:{repo.lower()}:{branch}"
+    key = hashlib.sha256(raw.encode()).hexdigest()[:16]
+    return _CACHE_DIR / f"protection_{key}.json"
+
+
+def read_protection_cache(
+    owner: str, repo: str, branch: str, ttl: int, scope: str = ""
+) -> dict | None:
+    """Return a cached required-approval lookup within *ttl*, or None on a miss.
+
+    A hit is a dict with a ``required`` key, which is itself None when the
+    lookup was negative (no protection rule, or a 403/404 for the token), so
+    callers can tell a cached "unknown" apart from a miss. Negative answers
+    depend on who asked, so lookups are keyed by *scope*, an identity of the
+    token they were made with.
+    """
+    path = protection_cache_path(owner, repo, branch, scope)
+    try:
+        if not path.exists():
+            logger.debug(
+                "cache_miss layer=protection path=%s reason=file_not_found", path
+            )
+            return None
+        data = json.loads(path.read_text())
+        if data.get("branch") != branch or data.get("scope", "") != scope:
+            return None
         fetched_at = datetime.fromisoformat(data["fetched_at"])
         age = (datetime.now(timezone.utc) - fetched_at).total_seconds()
         if age > ttl:
             logger.debug(
-                "cache_miss layer=repo_pr path=%s reason=expired age=%.0fs ttl=%ss",
+                "cache_miss layer=protection path=%s reason=expired age=%.0fs ttl=%ss",
                 path,
                 age,
                 ttl,
             )
             return None
-        raw_checks = data.get("check_statuses")
-        raw_approvals = data.get("approval_statuses")
-        raw_approval_details = data.get("approval_details")
         logger.debug(
-            "cache_hit layer=repo_pr path=%s age=%.0fs pr_count=%d",
+            "cache_hit layer=protection path=%s age=%.0fs required=%s",
             path,
             age,
-            len(data["prs"]),
+            data["required"],
         )
-        return {
-            "prs": data["prs"],
-            "check_statuses": (
-                {int(k): v for k, v in raw_checks.items()}
-                if raw_checks is not None
-                else None
-            ),
-            "approval_statuses": (
-                {int(k): v for k, v in raw_approvals.items()}
-                if raw_approvals is not None
-                else None
-            ),
-            "approval_details": (
-                {int(k): v for k, v in raw_approval_details.items()}
-                if raw_approval_details is not None
-                else None
-            ),
-        }
+        return {"required": data["required"]}
     except (OSError, json.JSONDecodeError, KeyError, ValueError, TypeError) as exc:
         logger.warning(
-            "cache_read_error layer=repo_pr path=%s error=%r", path, str(exc)
-        )
-        click.echo(
-            click.style(f"Warning: failed to read repo PR cache: {exc}", fg="yellow"),
-            err=True,
+            "cache_read_error layer=protection path=%s error=%r", path, str(exc)
         )
         return None
 
 
-def write_repo_pr_cache(
-    org: str,
-    repo_name: str,
-    pr_details: list,
-    check_statuses: dict | None = None,
-    approval_statuses: dict | None = None,
-    approval_details: dict | None = None,
+def write_protection_cache(
+    owner: str, repo: str, branch: str, required: int | None, scope: str = ""
 ) -> None:
-    """Write PR details for a single repo to disk cache."""
+    """Persist a required-approval lookup, including negative (None) results."""
+    path = protection_cache_path(owner, repo, branch, scope)
     try:
         _CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        path = repo_pr_cache_path(org, repo_name)
         payload = {
             "fetched_at": datetime.now(timezone.utc).isoformat(),
-            "organization": org,
-            "repo": repo_name,
-            "pr_count": len(pr_details),
-            "prs": pr_details,
+            "owner": owner,
+            "repo": repo,
+            "branch": branch,
+            "scope": scope,
+            "required": required,
         }
-        if check_statuses is not None:
-            payload["check_statuses"] = {str(k): v for k, v in check_statuses.items()}
-        if approval_statuses is not None:
-            payload["approval_statuses"] = {
-                str(k): v for k, v in approval_statuses.items()
-            }
-        if approval_details is not None:
-            payload["approval_details"] = {
-                str(k): v for k, v in approval_details.items()
-            }
         _atomic_write_text(path, json.dumps(payload))
-        logger.debug(
-            "cache_write layer=repo_pr path=%s pr_count=%d", path, len(pr_details)
-        )
+        logger.debug("cache_write layer=protection path=%s required=%s", path, required)
     except OSError as exc:
         logger.warning(
-            "cache_write_error layer=repo_pr path=%s error=%r",
-            repo_pr_cache_path(org, repo_name),
-            str(exc),
-        )
-        click.echo(
-            click.style(f"Warning: failed to write repo PR cache: {exc}", fg="yellow"),
-            err=True,
+            "cache_write_error layer=protection path=%s error=%r", path, str(exc)
         )
 
 
@@ -340,49 +1373,3 @@ def write_cached_user_login(login: str) -> None:
         logger.debug("cache_write layer=user_login login=%s", login)
     except OSError as exc:
         logger.warning("cache_write_error layer=user_login error=%r", str(exc))
-
-
-def write_pr_cache(
-    org: str,
-    repo_filter: str,
-    pr_details: list,
-    check_statuses: dict | None = None,
-    approval_statuses: dict | None = None,
-    approval_details: dict | None = None,
-) -> None:
-    """Write pr_details (and optional statuses) to disk cache."""
-    try:
-        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        path = cache_path(org, repo_filter)
-        payload = {
-            "fetched_at": datetime.now(timezone.utc).isoformat(),
-            "organization": org,
-            "repo_filter": repo_filter,
-            "pr_count": len(pr_details),
-            "prs": pr_details,
-        }
-        # Store with string keys (JSON requirement); restored to int on read.
-        if check_statuses is not None:
-            payload["check_statuses"] = {str(k): v for k, v in check_statuses.items()}
-        if approval_statuses is not None:
-            payload["approval_statuses"] = {
-                str(k): v for k, v in approval_statuses.items()
-            }
-        if approval_details is not None:
-            payload["approval_details"] = {
-                str(k): v for k, v in approval_details.items()
-            }
-        _atomic_write_text(path, json.dumps(payload))
-        logger.debug(
-            "cache_write layer=pr_detail path=%s pr_count=%d", path, len(pr_details)
-        )
-    except OSError as exc:
-        logger.warning(
-            "cache_write_error layer=pr_detail path=%s error=%r",
-            cache_path(org, repo_filter),
-            str(exc),
-        )
-        click.echo(
-            click.style(f"Warning: failed to write PR cache: {exc}", fg="yellow"),
-            err=True,
-        )
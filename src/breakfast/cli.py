@@ -1,8 +1,10 @@
+import contextlib
 import os
 import random
 import re
 import shutil
 import sys
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
@@ -15,30 +17,65 @@ import requests
 from .api import (
     SECRET_GITHUB_TOKEN,
     GitHubAuthenticationError,
+    GitHubDeadlineExceeded,
     GitHubGraphQLError,
     GitHubGraphQLResourceLimitError,
+    GitHubRateLimitBudgetExhausted,
     GitHubRateLimitError,
     OwnerNotFoundError,
+    _classify_checks,
+    _combine_approval_summary,
+    _fetch_check_runs,
+    _fetch_commit_statuses,
     _fetch_pr_detail,
+    _fetch_review_decision,
     _match_exclude_repos,
+    _match_repo_filter,
+    _review_status_from_latest_reviews,
+    build_pr_search_query,
+    cached_check_status,
+    configure_adaptive_concurrency,
+    configure_check_cache,
+    configure_conditional_requests,
+    configure_deadline,
+    configure_protection_cache,
+    configure_rate_limit_policy,
+    configure_request_hedging,
+    configure_session_pool,
+    deadline_remaining,
+    discovery_sink,
+    discovery_truncation,
     get_api_stats,
+    get_approval_summaries,
     get_approval_summary,
     get_authenticated_user_login,
     get_check_status,
+    get_check_statuses,
+    get_github_pr_details,
+    get_github_pr_updates,
     get_github_prs,
     get_graphql_rate_limit,
     get_pr_age_days,
+    get_required_approving_review_count,
+    quiet_discovery_progress,
+    search_github_prs,
+    store_check_status,
+    submit_fanout,
 )
 from .cache import (
+    list_pr_cache_coverage,
     parse_ttl,
+    prune_conditional_cache,
     read_cached_user_login,
     read_graphql_cache,
     read_pr_cache,
+    read_pr_entries,
     read_repo_pr_cache,
     write_cached_user_login,
     write_graphql_cache,
     write_pr_cache,
-    write_repo_pr_cache,
+    write_pr_entries,
+    write_repo_pr_caches,
 )
 from .config import (
     filter_pr_details,
@@ -47,7 +84,17 @@ from .config import (
     parse_columns_config,
     update_config,
 )
-from .constants import BREAKFAST_ITEMS
+from .constants import (
+    _CONDITIONAL_CACHE_MAX_AGE,
+    _GRAPHQL_BATCH_SIZE,
+    _GRAPHQL_OVERFLOW_MAX_PAGES,
+    _GRAPHQL_PR_PAGE_SIZE,
+    _MAX_CONCURRENT_OWNERS,
+    _PR_ENTRY_MAX_AGE_TTLS,
+    _STREAM_PENDING_PER_WORKER,
+    BREAKFAST_ITEMS,
+    DEFAULT_PROTECTION_CACHE_TTL,
+)
 from .logger import configure as configure_logging
 from .logger import logger
 from .renderers import (
@@ -58,6 +105,7 @@ from .renderers import (
     render_table,
     render_template,
 )
+from .transport import RATE_LIMIT_POLICIES
 from .ui import (
     get_random_cake_recipe,
     get_random_pizza_recipe,
@@ -220,6 +268,43 @@ def _print_debug_summary(t0, pr_count, api_stats, graphql_rate_limit):
     if reset_ts is not None:
         reset_dt = datetime.fromtimestamp(reset_ts, tz=timezone.utc)
         lines.append(f"  REST rate resets: {reset_dt.strftime('%H:%M:%S UTC')}")
+    opened = api_stats.get("connections_opened")
+    if opened:
+        reused = api_stats.get("connections_reused", 0)
+        lines.append(f"  Connections:      {opened} opened, {reused} reuses")
+    peak = api_stats.get("concurrency_peak")
+    if peak:
+        limit = api_stats.get("concurrency_limit", peak)
+        backoffs = api_stats.get("concurrency_backoffs", 0)
+        lines.append(
+            f"  Concurrency:      {limit} now, peak {peak}, {backoffs} back-offs"
+        )
+    overflow_pages = api_stats.get("graphql_overflow_pages")
+    if overflow_pages:
+        lines.append(f"  PR overflow:      {overflow_pages} extra GraphQL pages")
+    not_modified = api_stats.get("rest_not_modified")
+    if not_modified:
+        lines.append(f"  Not modified:     {not_modified} (304, no rate-limit cost)")
+    deduplicated = api_stats.get("deduplicated_calls")
+    if deduplicated:
+        lines.append(f"  Deduplicated:     {deduplicated} (shared an in-flight call)")
+    hedges = api_stats.get("hedges_sent")
+    if hedges:
+        won = api_stats.get("hedges_won", 0)
+        lines.append(f"  Hedged:           {hedges} slow requests, {won} won by hedge")
+    retries = api_stats.get("retries")
+    if retries or api_stats.get("retries_refused"):
+        refused = api_stats.get("retries_refused", 0)
+        lines.append(
+            f"  Retries:          {retries or 0} ({refused} refused by budget)"
+        )
+    waits = api_stats.get("rate_limit_waits")
+    if waits:
+        waited = api_stats.get("rate_limit_wait_seconds", 0.0)
+        lines.append(f"  Rate-limit waits: {waits} ({waited:.1f}s paced)")
+    degraded = api_stats.get("rate_limit_degraded")
+    if degraded:
+        lines.append(f"  Skipped calls:    {degraded} (rate-limit budget spent)")
     if graphql_rate_limit:
         gql_remaining = graphql_rate_limit.get("remaining")
         gql_reset = graphql_rate_limit.get("resetAt")
@@ -355,6 +440,123 @@ def _org_spec_cache_segment(org: str, scoped: list[str] | None) -> str:
     return org.lower() + ":" + filter_str
 
 
+def _cache_coverage(org_specs, repo_filters, exclude_repos, fetch_state):
+    """Describe which PRs a full-result cache entry for this query holds.
+
+    Recorded with the entry so a later, narrower query can be answered from
+    it (see ``_coverage_subsumes``). A run whose discovery was cut short adds
+    the affected repositories under ``truncated`` before writing.
+    """
+    return {
+        "orgs": {
+            org.lower(): sorted(repo_filters if scoped is None else scoped)
+            for org, scoped in org_specs
+        },
+        "exclude_repos": sorted(set(exclude_repos)),
+        "fetch_state": fetch_state,
+    }
+
+
+def _coverage_subsumes(coverage, wanted):
+    """Return True if an entry with *coverage* holds every PR *wanted* asks for.
+
+    Every wanted owner must be covered with no repo filter, or with filters
+    that include all of the wanted ones (filters are OR-ed, so fewer patterns
+    match fewer repos). The entry may not exclude a repo the query keeps, and
+    its fetch state must be the same or ``all``. An entry whose discovery
+    was truncated misses PRs of its own repositories, so it only answers the
+    identical query.
+    """
+    if coverage.get("truncated"):
+        return {k: v for k, v in coverage.items() if k != "truncated"} == wanted
+    if coverage["fetch_state"] not in (wanted["fetch_state"], "all"):
+        return False
+    if not set(coverage["exclude_repos"]) <= set(wanted["exclude_repos"]):
+        return False
+    for org, filters in wanted["orgs"].items():
+        if org not in coverage["orgs"]:
+            return False
+        covered = coverage["orgs"][org]
+        if covered and not (filters and set(filters) <= set(covered)):
+            return False
+    return True
+
+
+def _pr_matches_fetch_state(pr_detail, fetch_state):
+    merged = bool(pr_detail.get("merged_at") or pr_detail.get("merged"))
+    if fetch_state == "merged":
+        return merged
+    if fetch_state == "closed":
+        return pr_detail.get("state") == "closed" and not merged
+    if fetch_state == "open":
+        return pr_detail.get("state") == "open"
+    return True
+
+
+def _narrow_cached_result(cached, wanted):
+    """Restrict a ``read_pr_cache`` result to the PRs the *wanted* query asks for."""
+
+    def keep(pr_detail):
+        repo = pr_detail.get("base", {}).get("repo", {})
+        owner = (repo.get("owner") or {}).get("login", "").lower()
+        name = repo.get("name", "")
+        return (
+            owner in wanted["orgs"]
+            and _match_repo_filter(name, wanted["orgs"][owner])
+            and not _match_exclude_repos(name, wanted["exclude_repos"])
+            and _pr_matches_fetch_state(pr_detail, wanted["fetch_state"])
+        )
+
+    prs = [pr_detail for pr_detail in cached["prs"] if keep(pr_detail)]
+    kept_ids = {pr_detail.get("id") for pr_detail in prs}
+    narrowed = dict(cached, prs=prs)
+    for key in ("check_statuses", "approval_statuses", "approval_details"):
+        if cached.get(key) is not None:
+            narrowed[key] = {
+                pr_id: value
+                for pr_id, value in cached[key].items()
+                if pr_id in kept_ids
+            }
+    return narrowed
+
+
+def _read_full_cache(org_cache_key, repo_cache_key, coverage, ttl):
+    """Read the full-result cache, answering narrower queries from broader entries.
+
+    The entry for this exact key is used when it covers the query. Failing
+    that, the newest fresh entry whose coverage subsumes *coverage* is
+    filtered down to it, with no network access. Entries without recorded
+    coverage only ever serve their own key, as before.
+    """
+    cached = read_pr_cache(org_cache_key, repo_cache_key, ttl)
+    if cached is not None:
+        if coverage is None or cached.get("coverage") is None:
+            return cached
+        if _coverage_subsumes(cached["coverage"], coverage):
+            return _narrow_cached_result(cached, coverage)
+    if coverage is None:
+        return None
+    own_key = (org_cache_key.lower(), repo_cache_key.lower())
+    for entry in list_pr_cache_coverage(ttl):
+        if (entry["org"], entry["repo_filter"]) == own_key:
+            continue
+        if not _coverage_subsumes(entry["coverage"], coverage):
+            continue
+        superset = read_pr_cache(entry["org"], entry["repo_filter"], ttl)
+        if superset is None:
+            continue
+        narrowed = _narrow_cached_result(superset, coverage)
+        logger.debug(
+            "cache_hit layer=pr_detail_superset key=%s/%s pr_count=%d narrowed=%d",
+            entry["org"],
+            entry["repo_filter"],
+            len(superset["prs"]),
+            len(narrowed["prs"]),
+        )
+        return narrowed
+    return None
+
+
 def _group_prs_by(pr_details, group_by):
     """Group PR details by author login or repo name.
 
@@ -414,22 +616,74 @@ def _extract_repo_name(url):
     return parts[1] if len(parts) >= 2 else ""
 
 
-def _fetch_pr_bundle(url, fetch_checks, fetch_approvals):
+def _cancel_futures(futures):
+    """Cancel any fan-out futures that have not started yet."""
+    for future in futures:
+        if future is not None:
+            future.cancel()
+
+
+def _fetch_pr_bundle(url, fetch_checks, fetch_approvals, pr_detail=None):
     """Fetch a PR's detail plus optional check and approval statuses in one shot.
 
     Propagates RequestException from the detail fetch so the caller can skip
     the PR. Check/approval failures fall back to sentinel values instead.
+    When *pr_detail* was already obtained during discovery, the REST detail
+    fetch is skipped.
+
+    Statuses are normally resolved in batches by ``_fill_bundle_statuses``, so
+    they are only requested here as its per-PR fallback, with *pr_detail* in
+    hand. The status calls then start together on the shared fan-out pool, so
+    the fallback costs about one round trip per PR instead of the sum of all
+    of them.
     """
-    pr_detail = _fetch_pr_detail(url)
+    if pr_detail is None:
+        pr_detail = _fetch_pr_detail(url)
+
+    base = pr_detail.get("base", {})
+    owner = base.get("repo", {}).get("owner", {}).get("login")
+    repo_name = base.get("repo", {}).get("name")
 
     check_status = None
-    if fetch_checks:
-        owner = pr_detail.get("base", {}).get("repo", {}).get("owner", {}).get("login")
-        repo_name = pr_detail.get("base", {}).get("repo", {}).get("name")
-        head_sha = pr_detail.get("head", {}).get("sha")
-        if owner and repo_name and head_sha:
+    check_futures = None
+    head_sha = pr_detail.get("head", {}).get("sha")
+    if fetch_checks and owner and repo_name and head_sha:
+        check_status = cached_check_status(owner, repo_name, head_sha)
+        if check_status is None:
+            check_futures = (
+                submit_fanout(_fetch_check_runs, owner, repo_name, head_sha),
+                submit_fanout(_fetch_commit_statuses, owner, repo_name, head_sha),
+            )
+
+    approval_futures = None
+    if fetch_approvals:
+        pr_number = pr_detail.get("number")
+        base_branch = base.get("ref")
+        if owner and repo_name and pr_number is not None:
+            key = (owner, repo_name, pr_number)
+            reviews_future = submit_fanout(_review_status_from_latest_reviews, *key)
+            decision_future = submit_fanout(_fetch_review_decision, *key)
+            required_future = None
+            if base_branch:
+                required_future = submit_fanout(
+                    get_required_approving_review_count,
+                    owner,
+                    repo_name,
+                    base_branch,
+                )
+            approval_futures = (reviews_future, required_future, decision_future)
+
+    if fetch_checks and check_status is None:
+        if check_futures is not None:
+            runs_future, statuses_future = check_futures
             try:
-                check_status = get_check_status(owner, repo_name, head_sha)
+                check_status = _classify_checks(
+                    runs_future.result(), statuses_future.result()
+                )
+                store_check_status(owner, repo_name, head_sha, check_status)
+            except GitHubDeadlineExceeded:
+                # Not a failed check: the caller reports it as missing.
+                raise
             except requests.exceptions.RequestException as exc:
                 logger.warning(
                     "check_status_fetch_failed pr_id=%s error=%r",
@@ -442,29 +696,37 @@ def _fetch_pr_bundle(url, fetch_checks, fetch_approvals):
 
     approval_detail = None
     if fetch_approvals:
-        owner = pr_detail.get("base", {}).get("repo", {}).get("owner", {}).get("login")
-        repo_name = pr_detail.get("base", {}).get("repo", {}).get("name")
-        pr_number = pr_detail.get("number")
-        base_branch = pr_detail.get("base", {}).get("ref")
-        if owner and repo_name and pr_number is not None:
+        if approval_futures is not None:
+            reviews_future, required_future, decision_future = approval_futures
             try:
-                approval_detail = get_approval_summary(
-                    owner,
-                    repo_name,
-                    pr_number,
-                    base_branch=base_branch,
-                )
+                review_summary = reviews_future.result()
+            except GitHubDeadlineExceeded:
+                _cancel_futures([required_future, decision_future])
+                raise
             except (ValueError, requests.exceptions.RequestException) as exc:
                 logger.warning(
                     "approval_status_fetch_failed pr_id=%s error=%r",
                     pr_detail.get("id"),
                     str(exc),
                 )
+                _cancel_futures([required_future, decision_future])
                 approval_detail = {
                     "status": "pending",
                     "current": 0,
                     "required": None,
                 }
+            else:
+                required_reviews = None
+                if required_future is not None:
+                    try:
+                        required_reviews = required_future.result()
+                    except GitHubDeadlineExceeded:
+                        raise
+                    except requests.exceptions.RequestException:
+                        required_reviews = None
+                approval_detail = _combine_approval_summary(
+                    review_summary, required_reviews, decision_future.result()
+                )
         else:
             approval_detail = {
                 "status": "pending",
@@ -475,6 +737,466 @@ def _fetch_pr_bundle(url, fetch_checks, fetch_approvals):
     return pr_detail, check_status, approval_detail
 
 
+def _bundle_stream_sink(executor, streamed, *, exclude_repos, max_pending):
+    """Return a discovery sink that starts PR bundles as pages are discovered.
+
+    Each newly discovered URL (minus excluded repos and duplicates) is
+    submitted to *executor* straight away and its future recorded in
+    *streamed*, so detail fetches overlap the remaining discovery pages. The
+    bundles fetch details only; statuses are batched as they complete. At
+    most *max_pending* bundles are queued or running at once; beyond that the
+    sink blocks discovery until a worker frees up, which caps memory.
+    """
+    lock = threading.Lock()
+    slots = threading.BoundedSemaphore(max_pending)
+
+    def release_slot(_future):
+        slots.release()
+
+    def sink(urls):
+        for url in urls:
+            if exclude_repos and _match_exclude_repos(
+                _extract_repo_name(url), exclude_repos
+            ):
+                continue
+            with lock:
+                if url in streamed:
+                    continue
+                streamed[url] = None
+            slots.acquire()
+            future = executor.submit(_fetch_pr_bundle, url, False, False)
+            future.add_done_callback(release_slot)
+            with lock:
+                streamed[url] = future
+
+    return sink
+
+
+@contextlib.contextmanager
+def _cancel_on_error(executor):
+    """Cancel *executor*'s queued work if the managed block raises."""
+    try:
+        yield
+    except BaseException:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        raise
+
+
+def _deadline_message(stale_ids, missing_urls, missing_statuses):
+    """Describe what the --deadline left stale or missing, for stderr.
+
+    *missing_statuses* counts the PRs shown with placeholder check or
+    approval statuses.
+    """
+    parts = []
+    if stale_ids:
+        parts.append(f"{len(stale_ids)} PR(s) shown from stale cache (marked stale)")
+    if missing_urls:
+        examples = ", ".join(missing_urls[:3])
+        suffix = " ..." if len(missing_urls) > 3 else ""
+        parts.append(f"{len(missing_urls)} PR(s) missing: {examples}{suffix}")
+    if missing_statuses:
+        parts.append(
+            f"{missing_statuses} PR(s) without check/approval statuses (marked stale)"
+        )
+    return "⏱️ Deadline reached: " + "; ".join(parts)
+
+
+def _truncation_message(truncated_repos):
+    """Warn that the overflow page cap left some repositories' PRs out."""
+    names = sorted(truncated_repos)
+    examples = ", ".join(names[:3])
+    suffix = " ..." if len(names) > 3 else ""
+    limit = _GRAPHQL_PR_PAGE_SIZE * (_GRAPHQL_OVERFLOW_MAX_PAGES + 1)
+    return (
+        f"Warning: {len(names)} repo(s) have more than {limit} matching PRs;"
+        f" only the {limit} most recently updated are shown: {examples}{suffix}"
+    )
+
+
+def _stale_cache_fill(urls, org_cache_key, repo_cache_key):
+    """Look up PRs that missed the deadline in the per-PR, per-repo and full caches.
+
+    Expired entries are used as they are. Returns ``(found, missing)``:
+    *found* has ``prs``, ``checks``, ``approvals`` and ``approval_details``
+    like a per-repo cache hit, and *missing* lists the URLs no cache knows
+    about.
+    """
+    wanted = set(urls)
+    found = {"prs": [], "checks": {}, "approvals": {}, "approval_details": {}}
+    sources = (
+        ("checks", "check_statuses"),
+        ("approvals", "approval_statuses"),
+        ("approval_details", "approval_details"),
+    )
+
+    def take(cached):
+        for pr_detail in cached["prs"]:
+            if pr_detail.get("html_url") not in wanted:
+                continue
+            wanted.discard(pr_detail["html_url"])
+            found["prs"].append(pr_detail)
+            for key, source in sources:
+                value = (cached.get(source) or {}).get(pr_detail["id"])
+                if value is not None:
+                    found[key][pr_detail["id"]] = value
+
+    entries = read_pr_entries(urls, 0, ignore_ttl=True)
+    if entries:
+        take(_pr_entries_as_cached(entries.values()))
+    repos = {}
+    for url in wanted:
+        parts = urlparse(url).path.strip("/").split("/")
+        if len(parts) >= 4:
+            repos[(parts[0], parts[1])] = True
+    for org_name, rname in repos:
+        cached = read_repo_pr_cache(org_name, rname, 0, ignore_ttl=True)
+        if cached is not None:
+            take(cached)
+    if wanted:
+        cached = read_pr_cache(org_cache_key, repo_cache_key, 0, ignore_ttl=True)
+        if cached is not None:
+            take(cached)
+    return found, [url for url in urls if url in wanted]
+
+
+def _pr_entries_as_cached(entries):
+    """Shape per-PR cache entries like a ``read_repo_pr_cache`` result."""
+    cached = {
+        "prs": [],
+        "check_statuses": {},
+        "approval_statuses": {},
+        "approval_details": {},
+    }
+    for entry in entries:
+        pr_id = entry["pr"].get("id")
+        cached["prs"].append(entry["pr"])
+        if entry["check_status"] is not None:
+            cached["check_statuses"][pr_id] = entry["check_status"]
+        if entry["approval_detail"] is not None:
+            cached["approval_statuses"][pr_id] = entry["approval_detail"]["status"]
+            cached["approval_details"][pr_id] = entry["approval_detail"]
+    return cached
+
+
+def _check_target(pr_detail):
+    """Return the ``(owner, repo, sha)`` a PR's checks are resolved for, or None."""
+    base_repo = pr_detail.get("base", {}).get("repo", {})
+    owner = base_repo.get("owner", {}).get("login")
+    repo_name = base_repo.get("name")
+    head_sha = pr_detail.get("head", {}).get("sha")
+    if owner and repo_name and head_sha:
+        return owner, repo_name, head_sha
+    return None
+
+
+def _batch_check_statuses(pr_details):
+    """Resolve check statuses for many PRs with batched GraphQL queries.
+
+    Returns:
+        dict[int, str]: Check status keyed by PR ID. PRs without a resolvable
+        head commit map to ``none``.
+    """
+    targets = {pr_detail["id"]: _check_target(pr_detail) for pr_detail in pr_details}
+    resolved = get_check_statuses(t for t in targets.values() if t is not None)
+    return {
+        pr_id: resolved.get(target, "none") if target is not None else "none"
+        for pr_id, target in targets.items()
+    }
+
+
+def _approval_target(pr_detail):
+    """Return the ``(owner, repo, number, base)`` for a PR's approvals, or None."""
+    base = pr_detail.get("base", {})
+    owner = base.get("repo", {}).get("owner", {}).get("login")
+    repo_name = base.get("repo", {}).get("name")
+    pr_number = pr_detail.get("number")
+    if owner and repo_name and pr_number is not None:
+        return owner, repo_name, pr_number, base.get("ref")
+    return None
+
+
+def _batch_approval_details(pr_details):
+    """Resolve approval summaries for many PRs with batched GraphQL queries.
+
+    Returns:
+        dict[int, dict]: Approval summary keyed by PR ID. PRs without an
+        owner, repo or number map to the pending sentinel.
+    """
+    targets = {pr_detail["id"]: _approval_target(pr_detail) for pr_detail in pr_details}
+    resolved = get_approval_summaries(t for t in targets.values() if t is not None)
+    pending = {"status": "pending", "current": 0, "required": None}
+    return {
+        pr_id: (
+            resolved.get(target[:3], dict(pending))
+            if target is not None
+            else dict(pending)
+        )
+        for pr_id, target in targets.items()
+    }
+
+
+def _fill_bundle_statuses(bundles, checks, approvals, executor):
+    """Resolve the check and approval statuses PR bundles were fetched without.
+
+    Bundles are fetched detail-only, so the statuses of a chunk of fetched
+    PRs resolve together in a few batched GraphQL queries. PRs in a batch that
+    fails fall back to the per-PR REST calls of ``_fetch_pr_bundle``.
+
+    Args:
+        bundles: ``{url: [pr_detail, check_status, approval_detail]}``; None
+            statuses are filled in place.
+        checks: Whether check statuses are wanted.
+        approvals: Whether approval summaries are wanted.
+        executor: Pool the per-PR fallbacks run on.
+
+    Returns:
+        set: IDs of the PRs whose statuses the deadline left unresolved. They
+        get the same placeholders as failed lookups, so callers must mark
+        them.
+    """
+    need_checks = [url for url, bundle in bundles.items() if bundle[1] is None]
+    need_approvals = [url for url, bundle in bundles.items() if bundle[2] is None]
+    fallback_checks = set()
+    fallback_approvals = set()
+    missed = set()
+    if checks and need_checks:
+        try:
+            resolved = _batch_check_statuses([bundles[url][0] for url in need_checks])
+            for url in need_checks:
+                bundles[url][1] = resolved[bundles[url][0]["id"]]
+        except GitHubDeadlineExceeded:
+            # Per-PR calls would fail the same way; skip straight to missing.
+            missed.update(need_checks)
+        except (ValueError, requests.exceptions.RequestException) as exc:
+            logger.warning("check_status_batch_fetch_failed error=%r", str(exc))
+            fallback_checks.update(need_checks)
+    if approvals and need_approvals:
+        try:
+            resolved = _batch_approval_details(
+                [bundles[url][0] for url in need_approvals]
+            )
+            for url in need_approvals:
+                bundles[url][2] = resolved[bundles[url][0]["id"]]
+        except GitHubDeadlineExceeded:
+            missed.update(need_approvals)
+        except (ValueError, requests.exceptions.RequestException) as exc:
+            logger.warning("approval_status_batch_fetch_failed error=%r", str(exc))
+            fallback_approvals.update(need_approvals)
+
+    futures = {
+        executor.submit(
+            _fetch_pr_bundle,
+            url,
+            url in fallback_checks,
+            url in fallback_approvals,
+            pr_detail=bundles[url][0],
+        ): url
+        for url in fallback_checks | fallback_approvals
+    }
+    for future, url in futures.items():
+        try:
+            _, check_status, approval_detail = future.result(
+                timeout=deadline_remaining()
+            )
+        except (TimeoutError, GitHubDeadlineExceeded):
+            future.cancel()
+            missed.add(url)
+            continue
+        if url in fallback_checks:
+            bundles[url][1] = check_status
+        if url in fallback_approvals:
+            bundles[url][2] = approval_detail
+    for bundle in bundles.values():
+        if checks and bundle[1] is None:
+            bundle[1] = "none"
+        if approvals and bundle[2] is None:
+            bundle[2] = {"status": "pending", "current": 0, "required": None}
+    return {bundles[url][0]["id"] for url in missed}
+
+
+def _discover_owner(
+    org, repo_filters, fetch_state, discovery, delta_sync, search_qualifiers=None
+):
+    """Run discovery for one owner with the configured backend.
+
+    *search_qualifiers* are passed to ``search_github_prs`` when *discovery*
+    is ``search``.
+
+    Returns:
+        tuple: ``(urls, details, stamps)`` — PR URLs in discovery order, PR
+        details keyed by URL (``--discovery graphql`` only) and ``updatedAt``
+        keyed by URL (when discovery reads it).
+    """
+    if discovery == "graphql":
+        details = get_github_pr_details(org, repo_filters, fetch_state)
+        return (
+            [detail["html_url"] for detail in details],
+            {detail["html_url"]: detail for detail in details},
+            {detail["html_url"]: detail.get("updated_at") for detail in details},
+        )
+    if discovery == "search":
+        updates = search_github_prs(
+            org, repo_filters, fetch_state, **(search_qualifiers or {})
+        )
+        return list(updates), {}, updates
+    if delta_sync:
+        updates = get_github_pr_updates(org, repo_filters, fetch_state)
+        return list(updates), {}, updates
+    return get_github_prs(org, repo_filters, fetch_state), {}, {}
+
+
+def _discover_owners(
+    owner_jobs,
+    fetch_state,
+    discovery,
+    delta_sync,
+    max_workers,
+    search_qualifiers=None,
+):
+    """Discover every ``(org, repo_filters)`` job, in parallel when several.
+
+    At most *max_workers* owners are in flight at once. Their per-owner
+    progress lines are replaced by one shared line that gains an item as
+    each owner finishes. The first failure (e.g. ``OwnerNotFoundError``)
+    cancels owners that have not started and is re-raised.
+
+    Returns:
+        list[tuple]: ``_discover_owner`` results in *owner_jobs* order.
+    """
+    if len(owner_jobs) == 1:
+        org, repo_filters = owner_jobs[0]
+        return [
+            _discover_owner(
+                org,
+                repo_filters,
+                fetch_state,
+                discovery,
+                delta_sync,
+                search_qualifiers,
+            )
+        ]
+
+    owner_display = ", ".join(org for org, _ in owner_jobs)
+    click.echo(f"Fetching {owner_display} PRs...", nl=False, err=True)
+    results = [None] * len(owner_jobs)
+    with (
+        quiet_discovery_progress(),
+        ThreadPoolExecutor(max_workers=min(max_workers, len(owner_jobs))) as executor,
+    ):
+        future_to_index = {
+            executor.submit(
+                _discover_owner,
+                org,
+                repo_filters,
+                fetch_state,
+                discovery,
+                delta_sync,
+                search_qualifiers,
+            ): index
+            for index, (org, repo_filters) in enumerate(owner_jobs)
+        }
+        for future in as_completed(future_to_index):
+            try:
+                results[future_to_index[future]] = future.result()
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            click.echo(random.choices(BREAKFAST_ITEMS)[0], nl=False, err=True)
+    click.echo("...Done", err=True)
+    return results
+
+
+def _delta_sync_repo(cached, repo_urls, pr_stamps, *, checks, approvals):
+    """Split a repo's discovered PRs into reusable cache entries and stale URLs.
+
+    A cached PR is reused when its ``updated_at`` matches the timestamp seen
+    during discovery and the statuses this run needs are cached. Pending
+    checks are always refreshed because CI progress does not move
+    ``updatedAt``. Cached PRs that discovery no longer returns are evicted.
+
+    Returns:
+        tuple: ``(kept, stale_urls, evicted)`` where *kept* has the shape of a
+        ``read_repo_pr_cache`` result restricted to the reused PRs.
+    """
+    wanted = set(repo_urls)
+    cached_checks = cached["check_statuses"] or {}
+    cached_approvals = cached["approval_statuses"] or {}
+    cached_approval_details = cached["approval_details"] or {}
+    kept = {
+        "prs": [],
+        "check_statuses": {},
+        "approval_statuses": {},
+        "approval_details": {},
+    }
+    reused: set[str] = set()
+    evicted = 0
+    for pr_detail in cached["prs"]:
+        url = pr_detail.get("html_url")
+        if url not in wanted:
+            evicted += 1
+            continue
+        pr_id = pr_detail.get("id")
+        stamp = pr_detail.get("updated_at")
+        if stamp is None or stamp != pr_stamps.get(url):
+            continue
+        if checks and cached_checks.get(pr_id, "pending") == "pending":
+            continue
+        if approvals and pr_id not in cached_approval_details:
+            continue
+        kept["prs"].append(pr_detail)
+        reused.add(url)
+        if pr_id in cached_checks:
+            kept["check_statuses"][pr_id] = cached_checks[pr_id]
+        if pr_id in cached_approvals:
+            kept["approval_statuses"][pr_id] = cached_approvals[pr_id]
+        if pr_id in cached_approval_details:
+            kept["approval_details"][pr_id] = cached_approval_details[pr_id]
+    stale_urls = [url for url in repo_urls if url not in reused]
+    return kept, stale_urls, evicted
+
+
+def _reuse_pr_entries(entries, repo_urls, *, checks, approvals):
+    """Split a repo's discovered PRs into per-PR cache hits and URLs to fetch.
+
+    A cached PR is reused when *entries* (fresh, keyed by URL) has it with
+    the statuses this run needs. Only discovered URLs are looked at, so
+    cached PRs that have left the repo's open set are never returned.
+
+    Returns:
+        tuple: ``(hits, stale_urls)`` where *hits* lists the reused entries.
+    """
+    hits = []
+    stale_urls = []
+    for url in repo_urls:
+        entry = entries.get(url)
+        if (
+            entry is None
+            or (checks and entry["check_status"] is None)
+            or (approvals and entry["approval_detail"] is None)
+        ):
+            stale_urls.append(url)
+        else:
+            hits.append(entry)
+    return hits, stale_urls
+
+
+def _repo_cache_as_pr_entries(cached):
+    """Key a ``read_repo_pr_cache`` result's PRs by URL, like per-PR entries."""
+    checks = cached["check_statuses"] or {}
+    details = cached["approval_details"] or {}
+    return {
+        pr_detail["html_url"]: {
+            "pr": pr_detail,
+            "check_status": checks.get(pr_detail.get("id")),
+            "approval_detail": details.get(pr_detail.get("id")),
+        }
+        for pr_detail in cached["prs"]
+        if pr_detail.get("html_url")
+    }
+
+
 @click.group(invoke_without_command=True, epilog="Made with ❤️ in the UK")
 @click.pass_context
 @click.option(
@@ -616,7 +1338,7 @@ def _fetch_pr_bundle(url, fetch_checks, fetch_approvals):
     default=None,
     help=(
         "Format string for --format template. "
-        "Fields: {repo}, {title}, {author}, {url}, {state}, {number},"
+        "Fields: {repo}, {title}, {author}, {url}, {state}, {stale}, {number},"
         " {created_at}, {updated_at}, {additions}, {deletions},"
         " {changed_files}, {commits}, {review_comments}, {labels},"
         " {requested_reviewers}."
@@ -670,6 +1392,38 @@ def _fetch_pr_bundle(url, fetch_checks, fetch_approvals):
     default=None,
     help="Number of parallel workers for fetching PR data. Default: 64.",
 )
+@click.option(
+    "--discovery",
+    type=click.Choice(["rest", "graphql", "search"], case_sensitive=False),
+    default=None,
+    help=(
+        "How PR details are discovered: 'rest' (default) fetches each PR"
+        " over REST; 'graphql' reads every field from the repository-page"
+        " query, so large owners need far fewer API calls; 'search' finds"
+        " PRs with GitHub search, which is fastest for --mine-only and"
+        " --needs-my-review on large owners."
+    ),
+)
+@click.option(
+    "--on-rate-limit",
+    type=click.Choice(list(RATE_LIMIT_POLICIES), case_sensitive=False),
+    default=None,
+    help=(
+        "What to do when the GitHub rate-limit budget is about to run out and"
+        " the reset is more than a minute away: 'abort' (default) stops with"
+        " an error, 'degrade' skips the remaining calls and shows what was"
+        " fetched, 'wait' sleeps until the limit resets."
+    ),
+)
+@click.option(
+    "--hedge/--no-hedge",
+    default=None,
+    help=(
+        "Send a duplicate of any REST request still unanswered at the usual"
+        " p95 latency and use whichever reply arrives first. Cuts tail latency"
+        " at the cost of a few extra API calls."
+    ),
+)
 @click.option(
     "--max-title-length",
     type=click.IntRange(min=1),
@@ -704,6 +1458,24 @@ def _fetch_pr_bundle(url, fetch_checks, fetch_approvals):
         " Default: 300."
     ),
 )
+@click.option(
+    "--deadline",
+    type=str,
+    default=None,
+    help=(
+        "Stop fetching after this long (seconds, or suffix: 30s, 2m) and show"
+        " what has arrived, marking rows taken from stale cache."
+    ),
+)
+@click.option(
+    "--protection-cache-ttl",
+    type=str,
+    default=None,
+    help=(
+        "How long to cache branch-protection lookups for --approvals"
+        " (seconds, or suffix: 5m, 2h, 30s). Default: 24h."
+    ),
+)
 @click.option(
     "--cache/--no-cache",
     default=None,
@@ -731,6 +1503,14 @@ def _fetch_pr_bundle(url, fetch_checks, fetch_approvals):
         " Requires --cache or cache = true in config."
     ),
 )
+@click.option(
+    "--delta-sync/--no-delta-sync",
+    default=None,
+    help=(
+        "Once the cache expires, re-fetch only PRs whose updatedAt changed"
+        " and drop PRs that are gone. Only applies when the cache is enabled."
+    ),
+)
 @click.option(
     "--fetch-state",
     type=click.Choice(["open", "closed", "merged", "all"], case_sensitive=False),
@@ -966,13 +1746,19 @@ def breakfast(
     status_style,
     limit,
     workers,
+    discovery,
+    on_rate_limit,
+    hedge,
     max_title_length,
     no_update_check,
     offline,
     cache_ttl,
+    deadline,
+    protection_cache_ttl,
     cache,
     refresh,
     refresh_prs,
+    delta_sync,
     fetch_state,
     filter_state,
     filter_check,
@@ -1202,6 +1988,20 @@ def breakfast(
     fetch_state = (
         fetch_state if fetch_state is not None else cfg.get("fetch-state", "open")
     )
+    discovery = str(
+        discovery if discovery is not None else cfg.get("discovery", "rest")
+    ).lower()
+    if discovery not in {"rest", "graphql", "search"}:
+        discovery = "rest"
+    on_rate_limit = str(
+        on_rate_limit
+        if on_rate_limit is not None
+        else cfg.get("on-rate-limit", "abort")
+    ).lower()
+    if on_rate_limit not in RATE_LIMIT_POLICIES:
+        on_rate_limit = "abort"
+    configure_rate_limit_policy(on_rate_limit)
+    hedge = bool(hedge if hedge is not None else cfg.get("hedge", False))
     if status_style not in {"emoji", "ascii"}:
         status_style = "emoji"
     legendary = legendary if legendary is not None else cfg.get("legendary", False)
@@ -1216,6 +2016,9 @@ def breakfast(
     # keys bypass Click, so validate them before they reach ThreadPoolExecutor
     # and the title truncation maths.
     workers = _require_positive_int(workers, "workers", colour)
+    configure_session_pool(workers)
+    configure_adaptive_concurrency(workers)
+    configure_request_hedging(hedge, workers)
     if max_title_length is not None:
         max_title_length = _require_positive_int(
             max_title_length, "max-title-length", colour
@@ -1249,6 +2052,13 @@ def breakfast(
     cache_enabled = cache if cache is not None else cfg.get("cache", False)
     if offline:
         cache_enabled = True
+    # ETag/Last-Modified validators live in the cache directory too.
+    configure_conditional_requests(cache_enabled and not offline)
+    if cache_enabled and not offline:
+        prune_conditional_cache(_CONDITIONAL_CACHE_MAX_AGE)
+    configure_check_cache(cache_enabled and not offline)
+    delta_sync = delta_sync if delta_sync is not None else cfg.get("delta-sync", False)
+    delta_sync = bool(delta_sync) and cache_enabled
 
     if refresh and not cache_enabled:
         click.echo(
@@ -1285,6 +2095,35 @@ def breakfast(
         click.echo(click.style(msg, fg="red", bold=True), err=True, color=colour)
         sys.exit(1)
 
+    raw_deadline = deadline if deadline is not None else cfg.get("deadline")
+    deadline_seconds = None
+    if raw_deadline is not None:
+        try:
+            deadline_seconds = parse_ttl(raw_deadline)
+        except ValueError as exc:
+            logger.error("invalid_deadline value=%r error=%s", raw_deadline, exc)
+            msg = f"Error: invalid --deadline value: {exc}"
+            click.echo(click.style(msg, fg="red", bold=True), err=True, color=colour)
+            sys.exit(1)
+
+    raw_protection_ttl = (
+        protection_cache_ttl
+        if protection_cache_ttl is not None
+        else cfg.get("protection-cache-ttl", DEFAULT_PROTECTION_CACHE_TTL)
+    )
+    try:
+        protection_ttl_seconds = parse_ttl(raw_protection_ttl)
+    except ValueError as exc:
+        logger.error(
+            "invalid_protection_cache_ttl value=%r error=%s", raw_protection_ttl, exc
+        )
+        msg = f"Error: invalid --protection-cache-ttl value: {exc}"
+        click.echo(click.style(msg, fg="red", bold=True), err=True, color=colour)
+        sys.exit(1)
+    configure_protection_cache(
+        protection_ttl_seconds if cache_enabled else None, refresh=refresh
+    )
+
     if show_config:
         click.echo("Resolved config:")
         resolved = {
@@ -1304,10 +2143,16 @@ def breakfast(
             "status-style": status_style,
             "max-title-length": max_title_length,
             "workers": workers,
+            "discovery": discovery,
+            "on-rate-limit": on_rate_limit,
+            "hedge": hedge,
             "cache": cache_enabled,
             "cache-ttl": cache_ttl_seconds,
+            "deadline": deadline_seconds,
+            "protection-cache-ttl": protection_ttl_seconds,
             "refresh": refresh,
             "refresh-prs": refresh_prs,
+            "delta-sync": delta_sync,
             "filter-state": filter_state,
             "filter-check": filter_check,
             "filter-approval": filter_approval,
@@ -1389,6 +2234,36 @@ def breakfast(
         else:
             current_user_login = read_cached_user_login()
     t_acquire = time.monotonic()
+    configure_deadline(deadline_seconds)
+
+    # Each fetch state gets its own entries; "open" keeps the original keys.
+    if fetch_state != "open":
+        repo_cache_key += "|state:" + fetch_state
+
+    # --discovery search narrows the URL list itself, so its cache entries are
+    # keyed by the qualifiers too and never shadow a full discovery run. They
+    # record no coverage, so they never answer other queries either.
+    search_qualifiers = None
+    cache_coverage = None
+    if discovery == "search":
+        # Search ANDs its qualifiers, but --needs-my-review is ORed with
+        # --filter-reviewer on the client, so @me stays out of the query
+        # whenever other reviewers are named and the client filter decides.
+        search_qualifiers = {
+            "mine_only": bool(mine_only),
+            "needs_my_review": bool(needs_my_review) and not filter_reviewer,
+            "labels": tuple(filter_label),
+            "exclude_labels": tuple(exclude_label),
+            "no_drafts": bool(no_drafts),
+            "drafts_only": bool(drafts_only),
+        }
+        repo_cache_key += "|search:" + build_pr_search_query(
+            "", repo_filters, fetch_state, **search_qualifiers
+        )
+    else:
+        cache_coverage = _cache_coverage(
+            org_specs, repo_filters, exclude_repos, fetch_state
+        )
 
     # Cache key encodes each org with its effective scoped filter for determinism
     org_cache_key = "|".join(
@@ -1441,7 +2316,9 @@ def breakfast(
             sys.exit(1)
 
     if pr_details is None and cache_enabled and not refresh and not refresh_prs:
-        cache_result = read_pr_cache(org_cache_key, repo_cache_key, cache_ttl_seconds)
+        cache_result = _read_full_cache(
+            org_cache_key, repo_cache_key, cache_coverage, cache_ttl_seconds
+        )
         if cache_result is not None:
             pr_details = cache_result["prs"]
             cached_check_statuses = cache_result["check_statuses"]
@@ -1458,42 +2335,99 @@ def breakfast(
     approval_statuses = {}
     approval_details = {}
     statuses_from_bundle = False
+    # PR details already returned by --discovery graphql, keyed by PR URL.
+    prefetched_details: dict[str, dict] = {}
+    # updatedAt per PR URL from discovery, used by --delta-sync.
+    pr_stamps: dict[str, str | None] = {}
+
+    # PRs shown from stale cache, or not shown at all, because of --deadline.
+    stale_ids: set = set()
+    deadline_missing: list[str] = []
+    # PRs shown with placeholder statuses because of --deadline.
+    deadline_status_ids: set = set()
+    # "owner/repo" of repositories the overflow page cap cut short.
+    truncated_repos: set = set()
+
+    # Bundles started while discovery is still paging, keyed by PR URL.
+    stream_executor = None
+    streamed: dict = {}
 
     if pr_details is None:
         try:
             # --- Layer 2: GraphQL URL list cache (skip only on --refresh) ---
             prs = None
-            if cache_enabled and not refresh:
+            # --delta-sync needs fresh updatedAt values, so always discover.
+            if cache_enabled and not refresh and not delta_sync:
                 prs = read_graphql_cache(
                     org_cache_key, repo_cache_key, cache_ttl_seconds
                 )
 
             if prs is None:
                 prs = []
-                for org, scoped_filters in org_specs:
-                    effective_filters = (
-                        repo_filters if scoped_filters is None else scoped_filters
-                    )
-                    try:
-                        prs.extend(get_github_prs(org, effective_filters, fetch_state))
-                    except OwnerNotFoundError as exc:
-                        logger.warning(
-                            "graphql_owner_not_found owner=%s error=%r",
-                            org,
-                            str(exc),
+                owner_jobs = [
+                    (org, repo_filters if scoped_filters is None else scoped_filters)
+                    for org, scoped_filters in org_specs
+                ]
+                # Without the per-repo cache deciding what to fetch, each
+                # discovered page flows straight into the detail workers.
+                # --discovery graphql already has the details in hand.
+                sink = contextlib.nullcontext()
+                if discovery != "graphql" and (not cache_enabled or refresh_prs):
+                    stream_executor = ThreadPoolExecutor(max_workers=workers)
+                    sink = discovery_sink(
+                        _bundle_stream_sink(
+                            stream_executor,
+                            streamed,
+                            exclude_repos=exclude_repos,
+                            max_pending=_STREAM_PENDING_PER_WORKER * workers,
                         )
-                        click.echo(
-                            click.style(
-                                f"🍳 Owner not found: '{org}' could not be "
-                                "resolved as a GitHub organization or user account."
-                                " Check the name and your token's access.",
-                                fg="red",
-                                bold=True,
-                            ),
-                            err=True,
-                            color=colour,
+                    )
+                try:
+                    with (
+                        _cancel_on_error(stream_executor),
+                        sink,
+                        discovery_truncation() as truncated_repos,
+                    ):
+                        discovered = _discover_owners(
+                            owner_jobs,
+                            fetch_state,
+                            discovery,
+                            delta_sync,
+                            min(workers, _MAX_CONCURRENT_OWNERS),
+                            search_qualifiers,
                         )
-                        sys.exit(1)
+                except OwnerNotFoundError as exc:
+                    logger.warning(
+                        "graphql_owner_not_found owner=%s error=%r",
+                        exc.login,
+                        str(exc),
+                    )
+                    click.echo(
+                        click.style(
+                            f"🍳 Owner not found: '{exc.login}' could not be "
+                            "resolved as a GitHub organization or user account."
+                            " Check the name and your token's access.",
+                            fg="red",
+                            bold=True,
+                        ),
+                        err=True,
+                        color=colour,
+                    )
+                    sys.exit(1)
+                if truncated_repos:
+                    click.echo(
+                        click.style(_truncation_message(truncated_repos), fg="yellow"),
+                        err=True,
+                        color=colour,
+                    )
+                if truncated_repos and cache_coverage is not None:
+                    cache_coverage = dict(
+                        cache_coverage, truncated=sorted(truncated_repos)
+                    )
+                for urls, details, stamps in discovered:
+                    prs.extend(urls)
+                    prefetched_details.update(details)
+                    pr_stamps.update(stamps)
                 # Deduplicate by URL
                 seen: set[str] = set()
                 unique_prs = []
@@ -1507,6 +2441,9 @@ def breakfast(
             else:
                 org_display = ", ".join(organizations)
                 click.echo(f"Fetching {org_display} PRs...⚡...Done", err=True)
+                # A cached URL list does not say whether its discovery was
+                # truncated, so the entry written from it claims no coverage.
+                cache_coverage = None
 
             if exclude_repos and prs:
                 prs = [
@@ -1515,23 +2452,80 @@ def breakfast(
                     if not _match_exclude_repos(_extract_repo_name(url), exclude_repos)
                 ]
 
-            # --- Layer 2.5: per-repo PR cache ---
+            # --- Layer 2.5: per-PR cache (per-repo for --delta-sync/search) ---
             urls_to_fetch = list(prs) if prs else []
             repo_hit_prs: list = []
             repo_hit_checks: dict = {}
             repo_hit_approvals: dict = {}
             repo_hit_approval_details: dict = {}
+            # Cached PRs reused for repos whose per-repo cache is rewritten.
+            delta_kept_by_repo: dict[tuple[str, str], dict] = {}
+            repos_to_urls: dict[tuple[str, str], list[str]] = {}
+            for url in prs or []:
+                parts = urlparse(url).path.strip("/").split("/")
+                if len(parts) >= 4:
+                    repos_to_urls.setdefault((parts[0], parts[1]), []).append(url)
 
             if cache_enabled and not refresh_prs and prs:
-                repos_to_urls: dict[tuple[str, str], list[str]] = {}
-                for url in prs:
-                    parts = urlparse(url).path.strip("/").split("/")
-                    if len(parts) >= 4:
-                        repos_to_urls.setdefault((parts[0], parts[1]), []).append(url)
-
+                per_repo_layer = delta_sync or discovery == "search"
+                pr_entries = (
+                    {} if per_repo_layer else read_pr_entries(prs, cache_ttl_seconds)
+                )
                 uncached_urls: list[str] = []
                 for (org_name, rname), repo_urls in repos_to_urls.items():
-                    cached = read_repo_pr_cache(org_name, rname, cache_ttl_seconds)
+                    # Search results are a subset of each repo, so only the
+                    # discovered PRs are taken from the repo cache.
+                    if delta_sync or discovery == "search":
+                        cached = read_repo_pr_cache(
+                            org_name, rname, cache_ttl_seconds, ignore_ttl=delta_sync
+                        )
+                        if cached is not None:
+                            cached, stale_urls, evicted = _delta_sync_repo(
+                                cached,
+                                repo_urls,
+                                pr_stamps,
+                                checks=checks,
+                                approvals=approvals,
+                            )
+                            logger.debug(
+                                "delta_sync repo=%s/%s reused=%d refetch=%d"
+                                " evicted=%d",
+                                org_name,
+                                rname,
+                                len(cached["prs"]),
+                                len(stale_urls),
+                                evicted,
+                            )
+                            uncached_urls.extend(stale_urls)
+                            if discovery != "search" and (stale_urls or evicted):
+                                delta_kept_by_repo[(org_name, rname)] = cached
+                    else:
+                        # Reconcile against the discovered URLs: new PRs are
+                        # fetched, cached ones reused, vanished ones dropped.
+                        hits, stale_urls = _reuse_pr_entries(
+                            pr_entries, repo_urls, checks=checks, approvals=approvals
+                        )
+                        # Repo entries written before the per-PR cache existed
+                        # still cover what it does not.
+                        if stale_urls:
+                            repo_cached = read_repo_pr_cache(
+                                org_name, rname, cache_ttl_seconds
+                            )
+                            if repo_cached is not None:
+                                repo_hits, stale_urls = _reuse_pr_entries(
+                                    _repo_cache_as_pr_entries(repo_cached),
+                                    stale_urls,
+                                    checks=checks,
+                                    approvals=approvals,
+                                )
+                                hits.extend(repo_hits)
+                        cached = _pr_entries_as_cached(hits)
+                        if cached["prs"]:
+                            uncached_urls.extend(stale_urls)
+                            if stale_urls:
+                                delta_kept_by_repo[(org_name, rname)] = cached
+                        else:
+                            cached = None
                     if cached is not None:
                         repo_hit_prs.extend(cached["prs"])
                         if cached["check_statuses"]:
@@ -1543,87 +2537,208 @@ def breakfast(
                     else:
                         uncached_urls.extend(repo_urls)
                 urls_to_fetch = uncached_urls
+                logger.debug(
+                    "cache_layer layer=%s hits=%d misses=%d",
+                    "repo_pr" if per_repo_layer else "pr_entry",
+                    len(repo_hit_prs),
+                    len(uncached_urls),
+                )
 
             pr_details = []
             failed_urls = []
             newly_fetched_by_repo: dict[str, dict] = {}
+            fetched_entries: dict[str, dict] = {}
             repo_display = ", ".join(repo_filters) if repo_filters else "all repos"
             click.echo(f"Processing {repo_display} PRs...", nl=False, err=True)
 
             if not urls_to_fetch and repo_hit_prs:
                 click.echo("⚡", nl=False, err=True)
 
-            if urls_to_fetch:
-                max_workers = min(workers, len(urls_to_fetch))
-                with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    future_to_url = {
-                        executor.submit(_fetch_pr_bundle, url, checks, approvals): url
-                        for url in urls_to_fetch
-                    }
-                    for future in as_completed(future_to_url):
-                        url = future_to_url[future]
+            # Bundles streamed for URLs that are no longer wanted are dropped.
+            for url in set(streamed) - set(urls_to_fetch):
+                streamed[url].cancel()
+            if stream_executor is None and urls_to_fetch:
+                stream_executor = ThreadPoolExecutor(
+                    max_workers=min(workers, len(urls_to_fetch))
+                )
+            if stream_executor is not None:
+                executor = stream_executor
+                try:
+                    future_to_url = {}
+                    for url in urls_to_fetch:
+                        if streamed.get(url) is not None:
+                            future_to_url[streamed[url]] = url
+                            continue
+                        # Details only: statuses of the fetched PRs are
+                        # batched by _fill_bundle_statuses below.
+                        bundle_kwargs = {}
+                        if url in prefetched_details:
+                            bundle_kwargs["pr_detail"] = prefetched_details[url]
+                        future = executor.submit(
+                            _fetch_pr_bundle, url, False, False, **bundle_kwargs
+                        )
+                        future_to_url[future] = url
+                    settled = set()
+                    bundles = {}
+                    # Statuses are batched every _GRAPHQL_BATCH_SIZE finished
+                    # bundles, so each batch overlaps the details still in
+                    # flight instead of waiting for the last one.
+                    unresolved = {}
+                    try:
                         try:
-                            pr_detail, check_status, approval_detail = future.result()
-                            pr_details.append(pr_detail)
-                            rname = pr_detail["base"]["repo"]["name"]
-                            url_parts = urlparse(url).path.strip("/").split("/")
-                            org_name = url_parts[0] if len(url_parts) >= 2 else ""
-                            rd = newly_fetched_by_repo.setdefault(
-                                (org_name, rname),
-                                {
-                                    "prs": [],
-                                    "checks": {},
-                                    "approvals": {},
-                                    "approval_details": {},
-                                },
-                            )
-                            rd["prs"].append(pr_detail)
-                            if check_status is not None:
-                                check_statuses[pr_detail["id"]] = check_status
-                                rd["checks"][pr_detail["id"]] = check_status
-                            if approval_detail is not None:
-                                approval_statuses[pr_detail["id"]] = approval_detail[
-                                    "status"
-                                ]
-                                approval_details[pr_detail["id"]] = approval_detail
-                                rd["approvals"][pr_detail["id"]] = approval_detail[
-                                    "status"
-                                ]
-                                rd["approval_details"][
-                                    pr_detail["id"]
-                                ] = approval_detail
-                            click.echo(
-                                random.choices(BREAKFAST_ITEMS)[0],
-                                nl=False,
-                                err=True,
+                            for future in as_completed(
+                                future_to_url, timeout=deadline_remaining()
+                            ):
+                                settled.add(future)
+                                url = future_to_url[future]
+                                try:
+                                    bundles[url] = list(future.result())
+                                    unresolved[url] = bundles[url]
+                                    click.echo(
+                                        random.choices(BREAKFAST_ITEMS)[0],
+                                        nl=False,
+                                        err=True,
+                                    )
+                                except GitHubAuthenticationError as exc:
+                                    executor.shutdown(wait=False, cancel_futures=True)
+                                    click.echo("", err=True)
+                                    _handle_auth_error(
+                                        exc, colour=colour, json_output=json_output
+                                    )
+                                except GitHubRateLimitError as exc:
+                                    click.echo("", err=True)
+                                    _handle_rate_limit(exc, json_output)
+                                except GitHubDeadlineExceeded:
+                                    deadline_missing.append(url)
+                                except requests.exceptions.RequestException as exc:
+                                    logger.warning(
+                                        "pr_detail_fetch_failed url=%s error=%r",
+                                        url,
+                                        str(exc),
+                                    )
+                                    failed_urls.append(url)
+                                if (checks or approvals) and len(
+                                    unresolved
+                                ) >= _GRAPHQL_BATCH_SIZE:
+                                    deadline_status_ids |= _fill_bundle_statuses(
+                                        unresolved, checks, approvals, executor
+                                    )
+                                    unresolved = {}
+                        except TimeoutError:
+                            deadline_missing.extend(
+                                url
+                                for future, url in future_to_url.items()
+                                if future not in settled
                             )
-                        except GitHubAuthenticationError as exc:
-                            executor.shutdown(wait=False, cancel_futures=True)
-                            click.echo("", err=True)
-                            _handle_auth_error(
-                                exc, colour=colour, json_output=json_output
+                        if (checks or approvals) and unresolved:
+                            deadline_status_ids |= _fill_bundle_statuses(
+                                unresolved, checks, approvals, executor
                             )
-                        except GitHubRateLimitError as exc:
-                            click.echo("", err=True)
-                            _handle_rate_limit(exc, json_output)
-                        except requests.exceptions.RequestException as exc:
-                            logger.warning(
-                                "pr_detail_fetch_failed url=%s error=%r", url, str(exc)
-                            )
-                            failed_urls.append(url)
-
-            # Write per-repo cache for repos fetched in this run
-            if cache_enabled and newly_fetched_by_repo:
-                for (org_name, rname), rdata in newly_fetched_by_repo.items():
-                    write_repo_pr_cache(
-                        org_name,
-                        rname,
-                        rdata["prs"],
-                        check_statuses=rdata["checks"] or None,
-                        approval_statuses=rdata["approvals"] or None,
-                        approval_details=rdata["approval_details"] or None,
+                    except GitHubAuthenticationError as exc:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        click.echo("", err=True)
+                        _handle_auth_error(exc, colour=colour, json_output=json_output)
+                    except GitHubRateLimitError as exc:
+                        click.echo("", err=True)
+                        _handle_rate_limit(exc, json_output)
+                    for url, (
+                        pr_detail,
+                        check_status,
+                        approval_detail,
+                    ) in bundles.items():
+                        pr_details.append(pr_detail)
+                        rname = pr_detail["base"]["repo"]["name"]
+                        url_parts = urlparse(url).path.strip("/").split("/")
+                        org_name = url_parts[0] if len(url_parts) >= 2 else ""
+                        rd = newly_fetched_by_repo.setdefault(
+                            (org_name, rname),
+                            {
+                                "prs": [],
+                                "checks": {},
+                                "approvals": {},
+                                "approval_details": {},
+                            },
+                        )
+                        rd["prs"].append(pr_detail)
+                        fetched_entries[url] = {
+                            "pr": pr_detail,
+                            "check_status": check_status,
+                            "approval_detail": approval_detail,
+                        }
+                        if check_status is not None:
+                            check_statuses[pr_detail["id"]] = check_status
+                            rd["checks"][pr_detail["id"]] = check_status
+                        if approval_detail is not None:
+                            approval_statuses[pr_detail["id"]] = approval_detail[
+                                "status"
+                            ]
+                            approval_details[pr_detail["id"]] = approval_detail
+                            rd["approvals"][pr_detail["id"]] = approval_detail["status"]
+                            rd["approval_details"][pr_detail["id"]] = approval_detail
+                finally:
+                    # Past the deadline, queued bundles are cancelled and running
+                    # ones are left to finish in the background, not awaited.
+                    executor.shutdown(
+                        wait=not deadline_missing, cancel_futures=bool(deadline_missing)
                     )
 
+            # Stale copies stand in for PRs that missed the deadline. Results
+            # cut short by the deadline are never written back to the cache.
+            deadline_spent = deadline_remaining() == 0
+            if deadline_missing and cache_enabled:
+                found, deadline_missing = _stale_cache_fill(
+                    deadline_missing, org_cache_key, repo_cache_key
+                )
+                stale_ids.update(pr_detail["id"] for pr_detail in found["prs"])
+                repo_hit_prs.extend(found["prs"])
+                repo_hit_checks.update(found["checks"])
+                repo_hit_approvals.update(found["approvals"])
+                repo_hit_approval_details.update(found["approval_details"])
+
+            # A repo's cache is rewritten with its reused PRs too, so the
+            # refetched ones don't replace them and evictions persist.
+            for repo_key, kept in delta_kept_by_repo.items():
+                rd = newly_fetched_by_repo.setdefault(
+                    repo_key,
+                    {"prs": [], "checks": {}, "approvals": {}, "approval_details": {}},
+                )
+                rd["prs"].extend(kept["prs"])
+                rd["checks"].update(kept["check_statuses"])
+                rd["approvals"].update(kept["approval_statuses"])
+                rd["approval_details"].update(kept["approval_details"])
+
+            # Write per-repo cache for repos fetched in this run. Search
+            # discovery only saw part of each repo, so it leaves them alone.
+            if (
+                cache_enabled
+                and newly_fetched_by_repo
+                and discovery != "search"
+                and not deadline_spent
+            ):
+                # One transaction, so a failed write leaves every repo as it was.
+                write_repo_pr_caches(
+                    {
+                        repo_key: {
+                            "prs": rdata["prs"],
+                            "check_statuses": rdata["checks"] or None,
+                            "approval_statuses": rdata["approvals"] or None,
+                            "approval_details": rdata["approval_details"] or None,
+                        }
+                        for repo_key, rdata in newly_fetched_by_repo.items()
+                    }
+                )
+
+            # Cache each fetched PR on its own and drop cached PRs that left
+            # their repos. Search only saw part of each repo, so drops none.
+            # Entries nobody has refreshed for several TTLs go too, which
+            # covers repos that no longer have any PRs to list.
+            if cache_enabled and not deadline_spent:
+                write_pr_entries(
+                    fetched_entries,
+                    vanished_from=repos_to_urls if discovery != "search" else None,
+                    max_age=cache_ttl_seconds * _PR_ENTRY_MAX_AGE_TTLS,
+                )
+
             # Merge per-repo cache hits into the main collections
             pr_details.extend(repo_hit_prs)
             check_statuses.update(repo_hit_checks)
@@ -1646,7 +2761,7 @@ def breakfast(
                     f" after retries: {examples}{suffix}"
                 )
                 click.echo(click.style(msg, fg="yellow"), err=True, color=colour)
-            if cache_enabled:
+            if cache_enabled and not deadline_spent:
                 needs_cache_write = True
 
         except GitHubAuthenticationError as exc:
@@ -1678,6 +2793,8 @@ def breakfast(
             click.echo(click.style(msg, fg="red", bold=True), err=True, color=colour)
             sys.exit(1)
         except (
+            GitHubDeadlineExceeded,
+            GitHubRateLimitBudgetExhausted,
             requests.exceptions.ConnectionError,
             requests.exceptions.Timeout,
         ) as exc:
@@ -1700,18 +2817,36 @@ def breakfast(
                     datetime.now(timezone.utc) - fetched_at
                 ).total_seconds()
                 formatted_age = format_cache_age(cache_age_seconds)
+                if isinstance(exc, GitHubDeadlineExceeded):
+                    stale_ids.update(pr_detail["id"] for pr_detail in pr_details)
+                    banner = "⏱️ Deadline reached: Displaying cached data from "
+                else:
+                    banner = "🔌 Offline Mode: Displaying cached data from "
                 # Ensure we end the progress line if we started it
                 click.echo("", err=True)
                 click.echo(
                     click.style(
-                        "🔌 Offline Mode: Displaying cached data from "
-                        f"{formatted_age}.",
+                        f"{banner}{formatted_age}.",
                         fg="yellow",
                         bold=True,
                     ),
                     err=True,
                     color=colour,
                 )
+            elif isinstance(exc, GitHubDeadlineExceeded):
+                logger.warning("deadline_reached stage=discovery cached=false")
+                click.echo("", err=True)
+                msg = (
+                    "🥞 The --deadline passed before any PRs were found,"
+                    " and there is no cached data to show."
+                )
+                click.echo(
+                    click.style(msg, fg="red", bold=True), err=True, color=colour
+                )
+                sys.exit(1)
+            elif isinstance(exc, GitHubRateLimitBudgetExhausted):
+                click.echo("", err=True)
+                _handle_rate_limit(exc, json_output)
             else:
                 logger.exception(
                     "graphql_fetch_failed org_cache_key=%s error=%r",
@@ -1732,8 +2867,14 @@ def breakfast(
             repo_display = ", ".join(repo_filters) if repo_filters else "all repos"
             click.echo(f"Processing {repo_display} PRs...⚡...Done", err=True)
 
+    # Checks and approvals for cache-hit PRs share one pool, so both kinds of
+    # request are in flight together rather than in back-to-back phases.
+    status_executor = None
+    check_futures = []
+    approval_futures = []
+
     # Fetch check statuses for cache-hit paths where statuses are absent.
-    # In the live-fetch path statuses are already populated by _fetch_pr_bundle.
+    # In the live-fetch path _fill_bundle_statuses has already resolved them.
     if checks and pr_details and not statuses_from_bundle:
         if cached_check_statuses is not None:
             check_statuses = cached_check_statuses
@@ -1746,34 +2887,28 @@ def breakfast(
             for pr_detail in pr_details:
                 check_statuses[pr_detail["id"]] = "none"
         else:
-            max_workers = min(workers, len(pr_details))
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                check_futures = []
+            needs_cache_write = True
+            try:
+                check_statuses = _batch_check_statuses(pr_details)
+            except GitHubDeadlineExceeded:
+                for pr_detail in pr_details:
+                    deadline_status_ids.add(pr_detail["id"])
+                    check_statuses[pr_detail["id"]] = "none"
+            except (ValueError, requests.exceptions.RequestException) as exc:
+                # The batch failed, so fall back to per-PR REST calls.
+                logger.warning("check_status_batch_fetch_failed error=%r", str(exc))
+                status_executor = ThreadPoolExecutor(max_workers=workers)
                 for pr_detail in pr_details:
                     owner = pr_detail["base"]["repo"]["owner"]["login"]
                     repo_name = pr_detail["base"]["repo"]["name"]
                     sha = pr_detail["head"]["sha"]
-                    future = executor.submit(get_check_status, owner, repo_name, sha)
-                    check_futures.append((pr_detail["id"], future))
-            for pr_id, future in check_futures:
-                try:
-                    check_statuses[pr_id] = future.result()
-                except (
-                    KeyError,
-                    ValueError,
-                    AttributeError,
-                    requests.exceptions.RequestException,
-                ) as exc:
-                    logger.warning(
-                        "check_status_fetch_failed pr_id=%s error=%r",
-                        pr_id,
-                        str(exc),
+                    future = status_executor.submit(
+                        get_check_status, owner, repo_name, sha
                     )
-                    check_statuses[pr_id] = "none"
-            needs_cache_write = True
+                    check_futures.append((pr_detail["id"], future))
 
     # Fetch approval statuses for cache-hit paths where statuses are absent.
-    # In the live-fetch path statuses are already populated by _fetch_pr_bundle.
+    # In the live-fetch path _fill_bundle_statuses has already resolved them.
     if approvals and pr_details and not statuses_from_bundle:
         if cached_approval_statuses is not None and cached_approval_details is not None:
             approval_statuses = cached_approval_statuses
@@ -1798,23 +2933,70 @@ def breakfast(
                     "required": None,
                 }
         else:
-            max_workers = min(workers, len(pr_details))
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                approval_futures = []
+            needs_cache_write = True
+            try:
+                approval_details = _batch_approval_details(pr_details)
+                approval_statuses = {
+                    pr_id: detail["status"]
+                    for pr_id, detail in approval_details.items()
+                }
+            except GitHubDeadlineExceeded:
+                for pr_detail in pr_details:
+                    deadline_status_ids.add(pr_detail["id"])
+                    approval_statuses[pr_detail["id"]] = "pending"
+                    approval_details[pr_detail["id"]] = {
+                        "status": "pending",
+                        "current": 0,
+                        "required": None,
+                    }
+            except (ValueError, requests.exceptions.RequestException) as exc:
+                # The batch failed, so fall back to per-PR REST calls.
+                logger.warning("approval_status_batch_fetch_failed error=%r", str(exc))
+                if status_executor is None:
+                    status_executor = ThreadPoolExecutor(max_workers=workers)
                 for pr_detail in pr_details:
                     owner = pr_detail["base"]["repo"]["owner"]["login"]
                     repo_name = pr_detail["base"]["repo"]["name"]
                     pr_number = pr_detail["number"]
                     base_branch = pr_detail.get("base", {}).get("ref")
-                    future = executor.submit(
+                    future = status_executor.submit(
                         get_approval_summary, owner, repo_name, pr_number, base_branch
                     )
                     approval_futures.append((pr_detail["id"], future))
+
+    if status_executor is not None:
+        try:
+            for pr_id, future in check_futures:
+                try:
+                    check_statuses[pr_id] = future.result(timeout=deadline_remaining())
+                except (TimeoutError, GitHubDeadlineExceeded):
+                    deadline_status_ids.add(pr_id)
+                    check_statuses[pr_id] = "none"
+                except (
+                    KeyError,
+                    ValueError,
+                    AttributeError,
+                    requests.exceptions.RequestException,
+                ) as exc:
+                    logger.warning(
+                        "check_status_fetch_failed pr_id=%s error=%r",
+                        pr_id,
+                        str(exc),
+                    )
+                    check_statuses[pr_id] = "none"
             for pr_id, future in approval_futures:
                 try:
-                    approval_detail = future.result()
+                    approval_detail = future.result(timeout=deadline_remaining())
                     approval_statuses[pr_id] = approval_detail["status"]
                     approval_details[pr_id] = approval_detail
+                except (TimeoutError, GitHubDeadlineExceeded):
+                    deadline_status_ids.add(pr_id)
+                    approval_statuses[pr_id] = "pending"
+                    approval_details[pr_id] = {
+                        "status": "pending",
+                        "current": 0,
+                        "required": None,
+                    }
                 except (ValueError, requests.exceptions.RequestException) as exc:
                     logger.warning(
                         "approval_status_fetch_failed pr_id=%s error=%r",
@@ -1827,7 +3009,33 @@ def breakfast(
                         "current": 0,
                         "required": None,
                     }
-            needs_cache_write = True
+        finally:
+            status_executor.shutdown(
+                wait=not deadline_status_ids,
+                cancel_futures=bool(deadline_status_ids),
+            )
+    if deadline_status_ids:
+        needs_cache_write = False
+
+    if stale_ids or deadline_missing or deadline_status_ids:
+        logger.warning(
+            "deadline_reached stale=%d missing=%d statuses_missing=%d",
+            len(stale_ids),
+            len(deadline_missing),
+            len(deadline_status_ids),
+        )
+        click.echo(
+            click.style(
+                _deadline_message(
+                    stale_ids, deadline_missing, len(deadline_status_ids)
+                ),
+                fg="yellow",
+            ),
+            err=True,
+            color=colour,
+        )
+    # Rows with placeholder statuses are marked like rows from stale cache.
+    stale_ids |= deadline_status_ids
 
     logger.info(
         "data_acquired pr_count=%d elapsed_ms=%d",
@@ -1843,6 +3051,7 @@ def breakfast(
             check_statuses=check_statuses or None,
             approval_statuses=approval_statuses or None,
             approval_details=approval_details or None,
+            coverage=cache_coverage,
         )
         if refresh or refresh_prs:
             click.echo("🔄 Cache refreshed.", err=True)
@@ -1954,6 +3163,7 @@ def breakfast(
             approval_details=approval_details,
             reviewers=reviewers,
             show_labels=show_labels,
+            stale_ids=stale_ids,
         )
     elif fmt == "markdown":
         render_markdown(
@@ -1969,6 +3179,7 @@ def breakfast(
             status_style=status_style,
             reviewers=reviewers,
             show_labels=show_labels,
+            stale_ids=stale_ids,
         )
     elif fmt == "csv":
         render_csv(
@@ -1981,12 +3192,14 @@ def breakfast(
             approval_details=approval_details,
             reviewers=reviewers,
             show_labels=show_labels,
+            stale_ids=stale_ids,
         )
     elif fmt == "template":
         render_template(
             pr_details,
             template_str=template_str,
             colour=colour,
+            stale_ids=stale_ids,
         )
     else:
         render_table(
@@ -2010,6 +3223,7 @@ def breakfast(
             max_title_length=max_title_length,
             column_specs=column_specs,
             stdout_is_tty=_stdout_is_tty(),
+            stale_ids=stale_ids,
         )
 
     _finish_run(
@@ -224,6 +224,24 @@ _DEFAULT_CONFIG_CONTENT = """\
 # Equivalent to: --cache-ttl <value>
 # cache-ttl = "5m"
 
+# Stop fetching after this long and show what has arrived. PRs that missed
+# it come from the (possibly expired) cache and are marked stale; the rest
+# are listed as missing. Accepts seconds or a suffix: 30s, 2m.
+# Equivalent to: --deadline <value>
+# deadline = "10s"
+
+# How long branch-protection lookups (required approvals) stay cached.
+# Negative results (no rule, or no access for this token) are cached too.
+# Only relevant when cache = true and approvals are shown.
+# Equivalent to: --protection-cache-ttl <value>
+# protection-cache-ttl = "24h"
+
+# After the cache expires, re-fetch only PRs whose updatedAt changed since
+# they were cached, and drop PRs that are no longer returned.
+# Only relevant when cache = true.
+# Equivalent to: --delta-sync
+# delta-sync = false
+
 # Exclude draft PRs from results
 # no-drafts = true
 
@@ -235,9 +253,34 @@ _DEFAULT_CONFIG_CONTENT = """\
 
 # Number of parallel workers used to fetch PR details, check statuses, and
 # approval statuses. Higher values fetch faster but consume more API rate limit.
+# This is an upper bound: the number of requests in flight starts lower and
+# adapts to how quickly and cleanly GitHub responds.
 # Equivalent to: --workers <n>
 # workers = 64
 
+# How PR details are discovered. "rest" lists PR URLs with GraphQL and then
+# fetches each PR over REST. "graphql" pulls every displayed field in the
+# repository-page query itself, turning one call per PR into one per page.
+# "search" finds PRs with GitHub search (author:@me, review-requested:@me,
+# labels, drafts), so personal views of a large org skip the repo scan.
+# Choices: rest, graphql, search.
+# Equivalent to: --discovery <value>
+# discovery = "rest"
+
+# Every request draws on a shared rate-limit budget that paces workers once it
+# runs low. This picks what happens when it is nearly spent and the reset is
+# more than a minute away: "abort" stops with an error, "degrade" skips the
+# remaining calls and shows what was fetched, "wait" sleeps until the reset.
+# Choices: abort, degrade, wait.
+# Equivalent to: --on-rate-limit <value>
+# on-rate-limit = "abort"
+
+# Send a duplicate of any REST request that is still unanswered at the usual
+# p95 latency and use whichever reply arrives first. At most 5% of requests
+# are hedged.
+# Equivalent to: --hedge
+# hedge = false
+
 
 # -----------------------------------------------------------------------------
 # Diagnostics
@@ -10,21 +10,91 @@ _MAX_GRAPHQL_ERROR_MESSAGE_LENGTH = 120
 _MAX_STORED_GRAPHQL_ERRORS = 10
 _MAX_RETRIES = 3
 _RETRY_STATUSES = {502, 503, 504}
+_RETRY_BASE_DELAY = 2.0
+_RETRY_MAX_DELAY = 30.0
+_RETRY_BUDGET_RATIO = 0.2
+_RETRY_BUDGET_MIN = 20
+_SECONDARY_RATE_LIMIT_WAIT = 60
 _REQUEST_TIMEOUT = (5, 30)
 _GRAPHQL_REPOSITORY_PAGE_SIZE = 25
+_GRAPHQL_BATCH_SIZE = 50
+_GRAPHQL_PR_PAGE_SIZE = 100
+_GRAPHQL_OVERFLOW_WORKERS = 4
+_GRAPHQL_OVERFLOW_MAX_PAGES = 50
+_MAX_CONCURRENT_OWNERS = 4
+_STREAM_PENDING_PER_WORKER = 2
+_GRAPHQL_SEARCH_RESULT_LIMIT = 1000
+_DEFAULT_HTTP_POOL_SIZE = 64
+_RATE_LIMIT_PACE_FRACTION = 0.1
+_RATE_LIMIT_RESERVE = 5
+_RATE_LIMIT_MAX_WAIT = 60
+_CONGESTION_STATUSES = {429, 502, 503, 504}
+_ADAPTIVE_INITIAL_CONCURRENCY = 8
+_ADAPTIVE_DECREASE_FACTOR = 0.5
+_ADAPTIVE_LATENCY_FACTOR = 3.0
+_ADAPTIVE_BACKOFF_COOLDOWN = 1.0
+_HEDGE_MAX_FRACTION = 0.05
+_HEDGE_QUANTILE = 0.95
+_HEDGE_WINDOW = 200
+_HEDGE_MIN_SAMPLES = 20
 
 # ── Cache Configuration ────────────────────────────────────────────────────
 
 DEFAULT_CACHE_TTL = 300
+DEFAULT_PROTECTION_CACHE_TTL = 86400
+# Per-PR cache entries untouched for this many TTLs are deleted on write.
+_PR_ENTRY_MAX_AGE_TTLS = 4
+_PENDING_CHECK_CACHE_TTL = 60
+# Stored REST validators unused for this long are deleted at startup.
+_CONDITIONAL_CACHE_MAX_AGE = 7 * 86400
+_FAILED_CHECK_CACHE_TTL = 3600
+_CHECK_PAGE_SIZE = 100
 CACHE_DIR_ENV_VAR = "BREAKFAST_CACHE_DIR"
 CACHE_DISABLED_ENV_VAR = "BREAKFAST_NO_CACHE"
 _SUFFIX_MAP = {"s": 1, "m": 60, "h": 3600}
 
+# Fields of a REST pull-request payload that breakfast keeps after fetching.
+# None keeps a value whole; a nested dict keeps only those keys, applied to
+# each item of a list. Bump _PR_DETAIL_SCHEMA_VERSION whenever a field is
+# added or removed, so cached PRs projected with the old set are dropped.
+_PR_DETAIL_SCHEMA_VERSION = "1"
+_PR_DETAIL_PROJECTION = {
+    "id": None,
+    "number": None,
+    "html_url": None,
+    "title": None,
+    "state": None,
+    "draft": None,
+    "merged": None,
+    "created_at": None,
+    "updated_at": None,
+    "closed_at": None,
+    "merged_at": None,
+    "additions": None,
+    "deletions": None,
+    "changed_files": None,
+    "commits": None,
+    "comments": None,
+    "review_comments": None,
+    "mergeable": None,
+    "mergeable_state": None,
+    "user": {"login": None, "html_url": None},
+    "labels": {"name": None, "color": None},
+    "requested_reviewers": {"login": None, "html_url": None},
+    "requested_teams": {"slug": None, "name": None},
+    "head": {"ref": None, "sha": None},
+    "base": {
+        "ref": None,
+        "repo": {"name": None, "html_url": None, "owner": {"login": None}},
+    },
+}
+
 # ── Legendary PRs & Table Rendering ────────────────────────────────────────
 
 _LEGENDARY_COMMENT_THRESHOLD = 100
 _LEGENDARY_AGE_THRESHOLD_DAYS = 30
 _LEGENDARY_EMOJI = "⚔️"
+_STALE_MARKER = "(stale)"
 
 _COLUMN_DISPLAY_NAMES: dict[str, str] = {
     "org": "Org",
@@ -18,6 +18,7 @@ from .constants import (
     _LEGENDARY_AGE_THRESHOLD_DAYS,
     _LEGENDARY_COMMENT_THRESHOLD,
     _LEGENDARY_EMOJI,
+    _STALE_MARKER,
 )
 from .ui import (
     apply_seasonal_colour,
@@ -412,6 +413,7 @@ def render_json(
     approval_details,
     reviewers=False,
     show_labels=False,
+    stale_ids=None,
 ):
     from .logger import logger
 
@@ -450,6 +452,8 @@ def render_json(
                 entry["approval_current"] = approval_detail["current"]
             if approval_detail.get("required") is not None:
                 entry["approval_required"] = approval_detail["required"]
+        if stale_ids:
+            entry["stale"] = pr_detail["id"] in stale_ids
         json_data.append(entry)
     click.echo(json.dumps(json_data, indent=2))
     logger.info(
@@ -470,6 +474,7 @@ def render_markdown(
     status_style,
     reviewers=False,
     show_labels=False,
+    stale_ids=None,
 ):
     from .logger import logger
 
@@ -484,6 +489,8 @@ def render_markdown(
         state_str = pr_detail["state"]
         if pr_detail.get("draft"):
             state_str = "draft"
+        if stale_ids and pr_detail["id"] in stale_ids:
+            state_str = f"{state_str} {_STALE_MARKER}"
         adds = pr_detail.get("additions", 0)
         subs = pr_detail.get("deletions", 0)
         row = {
@@ -568,6 +575,7 @@ def render_csv(
     approval_details,
     reviewers=False,
     show_labels=False,
+    stale_ids=None,
 ):
     from .logger import logger
 
@@ -602,6 +610,8 @@ def render_csv(
         fieldnames.append("approval")
         fieldnames.append("approval_current")
         fieldnames.append("approval_required")
+    if stale_ids:
+        fieldnames.append("stale")
     writer = csv.DictWriter(buf, fieldnames=fieldnames, extrasaction="ignore")
     writer.writeheader()
     for pr_detail in pr_details:
@@ -636,6 +646,8 @@ def render_csv(
             row["approval"] = approval_statuses.get(pr_detail["id"], "pending")
             row["approval_current"] = approval_detail.get("current", "")
             row["approval_required"] = approval_detail.get("required", "")
+        if stale_ids:
+            row["stale"] = pr_detail["id"] in stale_ids
         writer.writerow(row)
     click.echo(buf.getvalue(), nl=False)
     logger.info(
@@ -643,7 +655,7 @@ def render_csv(
     )
 
 
-def _template_fields(pr_detail):
+def _template_fields(pr_detail, stale=False):
     """Build the substitution map exposed to --template for one PR."""
     return {
         "repo": pr_detail["base"]["repo"]["name"],
@@ -651,6 +663,8 @@ def _template_fields(pr_detail):
         "author": pr_detail.get("user", {}).get("login", ""),
         "url": pr_detail.get("html_url", ""),
         "state": pr_detail.get("state", ""),
+        # Templates are free-form, so staleness is only shown where asked for.
+        "stale": _STALE_MARKER if stale else "",
         # 0, not "": a str default would pass the int-typed probe and then
         # crash on "{number:d}" for the one PR that happens to lack a number.
         "number": pr_detail.get("number", 0),
@@ -785,7 +799,7 @@ def _fail_template(exc, template_str, colour):
     error_exit(_template_error_message(exc), colour)
 
 
-def render_template(pr_details, template_str, colour):
+def render_template(pr_details, template_str, colour, stale_ids=None):
     from .logger import logger
 
     logger.info("render format=template row_count=%d", len(pr_details))
@@ -821,7 +835,9 @@ def render_template(pr_details, template_str, colour):
         # Reading the PR apart from formatting it: a gap in GitHub's payload is
         # not a fault in the user's template, and must not be reported as one.
         try:
-            fields = _template_fields(pr_detail)
+            fields = _template_fields(
+                pr_detail, stale=bool(stale_ids) and pr_detail["id"] in stale_ids
+            )
         except (KeyError, TypeError) as exc:
             logger.error("template_field_extraction_failed error=%s", exc)
             error_exit(f"Error: could not read PR data for the template: {exc}", colour)
@@ -857,6 +873,7 @@ def render_table(
     reviewers=False,
     show_labels=False,
     stdout_is_tty=None,
+    stale_ids=None,
 ):
     from .logger import logger
 
@@ -878,6 +895,8 @@ def render_table(
         state_label = format_pr_state(pr_detail["state"], pr_detail.get("draft", False))
         if legendary and is_legendary(pr_detail):
             state_label = state_label + " " + _LEGENDARY_EMOJI
+        if stale_ids and pr_detail["id"] in stale_ids:
+            state_label = state_label + " " + click.style(_STALE_MARKER, fg="yellow")
 
         repo = pr_detail["base"]["repo"]
         repo_url = repo.get("html_url") or pr_detail["html_url"].split("/pull/")[0]
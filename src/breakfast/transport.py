@@ -0,0 +1,648 @@
+"""Request scheduling primitives shared by the GitHub REST and GraphQL helpers."""
+
+import collections
+import copy
+import datetime
+import email.utils
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from .logger import logger
+
+RATE_LIMIT_POLICIES = ("wait", "degrade", "abort")
+
+
+def _parse_int_header(value):
+    """Return *value* as an int when it is a well-formed header value."""
+    if isinstance(value, bool) or not isinstance(value, (str, int)):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def is_secondary_rate_limit(response):
+    """Return True when *response* is GitHub's secondary-rate-limit 403.
+
+    GitHub sends these with the primary quota still available, so the only
+    reliable marker is the message in the body.
+    """
+    if getattr(response, "status_code", None) != 403:
+        return False
+    text = getattr(response, "text", None)
+    return isinstance(text, str) and "secondary rate limit" in text.lower()
+
+
+class RateLimitScheduler:
+    """Shared view of GitHub's rate-limit budgets that every request passes.
+
+    Budgets are tracked per rate-limit resource (``core`` for REST,
+    ``graphql`` for GraphQL points, ``search`` for the search API) from the
+    ``X-RateLimit-*`` headers GitHub returns on every response. Before a
+    request is sent, :meth:`acquire` reserves one unit of the budget so
+    concurrent workers cannot collectively overspend it, and once the budget
+    falls below ``pace_fraction`` of its limit the remaining units are spread
+    evenly over the time left until reset.
+
+    When the budget is down to ``reserve`` units (or pacing would stall a
+    worker for longer than ``max_wait`` seconds) the scheduler consults the
+    configured policy: ``wait`` sleeps until the window resets, ``degrade``
+    and ``abort`` are returned to the caller to act on. A wait of at most
+    ``max_wait`` seconds is always taken rather than giving up.
+    """
+
+    def __init__(
+        self,
+        *,
+        pace_fraction,
+        reserve,
+        max_wait,
+        policy="abort",
+        clock=time.time,
+        sleep=time.sleep,
+    ):
+        self.pace_fraction = pace_fraction
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self.policy = policy
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._budgets = {}
+        self._next_slot = {}
+        self.waits = 0
+        self.waited_seconds = 0.0
+
+    def reset(self):
+        """Forget every tracked budget and the wait counters."""
+        with self._lock:
+            self._budgets.clear()
+            self._next_slot.clear()
+            self.waits = 0
+            self.waited_seconds = 0.0
+
+    def _update(self, resource, limit, remaining, reset_at):
+        budget = self._budgets.get(resource)
+        if budget is None or reset_at > budget["reset"]:
+            self._budgets[resource] = {
+                "limit": max(limit or 0, remaining),
+                "remaining": remaining,
+                "reset": reset_at,
+            }
+            self._next_slot.pop(resource, None)
+            return
+        if reset_at == budget["reset"]:
+            # Responses can arrive out of order; within one window the
+            # budget only shrinks, so keep the lowest figure seen.
+            budget["remaining"] = min(budget["remaining"], remaining)
+            if limit:
+                budget["limit"] = limit
+
+    def record(self, resource, headers):
+        """Update a budget from a response's ``X-RateLimit-*`` headers."""
+        remaining = _parse_int_header(headers.get("X-RateLimit-Remaining"))
+        reset_at = _parse_int_header(headers.get("X-RateLimit-Reset"))
+        if remaining is None or reset_at is None:
+            return
+        limit = _parse_int_header(headers.get("X-RateLimit-Limit"))
+        header_resource = headers.get("X-RateLimit-Resource")
+        if isinstance(header_resource, str) and header_resource:
+            resource = header_resource
+        with self._lock:
+            self._update(resource, limit, remaining, reset_at)
+
+    def record_graphql(self, rate_limit):
+        """Update the GraphQL budget from a ``rateLimit`` query object."""
+        try:
+            remaining = int(rate_limit["remaining"])
+            reset_at = int(
+                datetime.datetime.fromisoformat(
+                    str(rate_limit["resetAt"]).replace("Z", "+00:00")
+                ).timestamp()
+            )
+        except (KeyError, TypeError, ValueError):
+            return
+        limit = _parse_int_header(rate_limit.get("limit"))
+        with self._lock:
+            self._update("graphql", limit, remaining, reset_at)
+
+    def budget(self, resource):
+        """Return a copy of the tracked budget for *resource*, or None."""
+        with self._lock:
+            budget = self._budgets.get(resource)
+            return dict(budget) if budget is not None else None
+
+    def acquire(self, resource, timeout=None):
+        """Reserve budget for one request, pacing or waiting as needed.
+
+        Args:
+            resource: Rate-limit resource the request is charged against.
+            timeout: Longest the caller can afford to sleep, or None for no
+                bound. A wait that would outlast it is not started and no
+                budget is reserved.
+
+        Returns:
+            None when the request may proceed, ``"deadline"`` when the wait
+            would outlast *timeout*, otherwise the policy decision
+            (``"degrade"`` or ``"abort"``) the caller must act on.
+        """
+        while True:
+            with self._lock:
+                budget = self._budgets.get(resource)
+                if budget is None:
+                    return None
+                now = self._clock()
+                until_reset = budget["reset"] - now
+                if until_reset <= 0:
+                    # The window has rolled over; the next response re-seeds it.
+                    del self._budgets[resource]
+                    self._next_slot.pop(resource, None)
+                    return None
+                available = budget["remaining"] - self.reserve
+                delay = until_reset
+                exhausted = available <= 0
+                slot = None
+                if not exhausted:
+                    delay = 0.0
+                    if budget["remaining"] < budget["limit"] * self.pace_fraction:
+                        spacing = until_reset / available
+                        slot = max(now, self._next_slot.get(resource, now))
+                        delay = slot - now
+                if delay > self.max_wait and self.policy != "wait":
+                    logger.warning(
+                        "rate_limit_budget_exhausted resource=%s remaining=%d"
+                        " reset_in=%.0f policy=%s",
+                        resource,
+                        budget["remaining"],
+                        until_reset,
+                        self.policy,
+                    )
+                    return self.policy
+                if timeout is not None and delay > timeout:
+                    return "deadline"
+                if slot is not None:
+                    self._next_slot[resource] = slot + spacing
+                if not exhausted:
+                    budget["remaining"] -= 1
+                if delay > 0:
+                    self.waits += 1
+                    self.waited_seconds += delay
+            if delay > 0:
+                logger.info(
+                    "rate_limit_wait resource=%s seconds=%.2f exhausted=%s",
+                    resource,
+                    delay,
+                    exhausted,
+                )
+                self._sleep(delay)
+            if not exhausted:
+                return None
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on the number of requests in flight at once.
+
+    Workers call :meth:`acquire` before sending a request and :meth:`release`
+    with its outcome afterwards. The limit starts at ``initial`` and doubles
+    per round of healthy responses (slow start) until the first sign of
+    congestion, after which it grows by one per round. A healthy response is
+    one that was not a congestion signal and whose latency stayed within
+    ``latency_factor`` times the baseline for that kind of request. The
+    baseline follows the fastest recent latency: a faster response resets
+    it, and every slower one pulls it up by ``baseline_decay`` of the gap,
+    so one unusually quick reply early in a run does not make every later
+    response look degraded. A congestion signal (secondary-limit 403, 429,
+    5xx, ``Retry-After``, timeouts) multiplies the limit by
+    ``decrease_factor``, at most once per ``cooldown`` seconds so one burst
+    of failures counts as one event. The
+    limit never exceeds ``max_limit``, which is the configured worker count.
+    """
+
+    def __init__(
+        self,
+        max_limit,
+        *,
+        initial,
+        min_limit=1,
+        decrease_factor=0.5,
+        latency_factor=3.0,
+        cooldown=1.0,
+        baseline_decay=0.05,
+        clock=time.monotonic,
+    ):
+        self.max_limit = max(1, int(max_limit))
+        self.min_limit = max(1, min(int(min_limit), self.max_limit))
+        self.decrease_factor = decrease_factor
+        self.latency_factor = latency_factor
+        self.cooldown = cooldown
+        self.baseline_decay = baseline_decay
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._limit = float(min(max(int(initial), self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._slow_start = True
+        self._baseline = {}
+        self._last_decrease = None
+        self._started = clock()
+        self.peak = int(self._limit)
+        self.backoffs = 0
+
+    @property
+    def limit(self):
+        """Current whole-number concurrency limit."""
+        return int(self._limit)
+
+    def acquire(self, timeout=None):
+        """Block until a request slot is free under the current limit.
+
+        Args:
+            timeout: Longest to wait in seconds, or None to wait for as long
+                as it takes.
+
+        Returns:
+            True once a slot is held, False if *timeout* ran out first.
+        """
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self._in_flight < int(self._limit), timeout
+            ):
+                return False
+            self._in_flight += 1
+            return True
+
+    def abandon(self):
+        """Return a slot whose request was never sent, leaving the limit."""
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def release(self, kind, latency, congested):
+        """Return a slot and adjust the limit from the request's outcome.
+
+        Args:
+            kind: Request family (e.g. ``"rest:pulls"``), so latency
+                baselines for cheap and expensive calls are kept apart.
+            latency: Seconds the request took.
+            congested: Whether the response signalled server-side pressure.
+        """
+        with self._cond:
+            self._in_flight -= 1
+            before = int(self._limit)
+            reason = None
+            if congested:
+                now = self._clock()
+                if (
+                    self._last_decrease is None
+                    or now - self._last_decrease >= self.cooldown
+                ):
+                    self._last_decrease = now
+                    self._slow_start = False
+                    self._limit = max(
+                        self.min_limit, self._limit * self.decrease_factor
+                    )
+                    self.backoffs += 1
+                    reason = "backoff"
+            else:
+                baseline = self._baseline.get(kind)
+                if baseline is None or latency < baseline:
+                    baseline = latency
+                else:
+                    baseline += (latency - baseline) * self.baseline_decay
+                self._baseline[kind] = baseline
+                if latency <= baseline * self.latency_factor:
+                    step = 1.0 if self._slow_start else 1.0 / self._limit
+                    self._limit = min(self.max_limit, self._limit + step)
+                    reason = "increase"
+            after = int(self._limit)
+            self.peak = max(self.peak, after)
+            self._cond.notify_all()
+        if reason and after != before:
+            logger.info(
+                "concurrency_limit limit=%d previous=%d reason=%s elapsed_s=%.2f",
+                after,
+                before,
+                reason,
+                self._clock() - self._started,
+            )
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is retried.
+
+    Shared by REST and GraphQL so both honour the same server hints and draw
+    on one retry budget:
+
+    * ``Retry-After`` (seconds or an HTTP date) is obeyed, as is
+      ``X-RateLimit-Reset`` on a 403 that reports an exhausted limit. A small
+      random spread is added so workers do not all return at the same instant.
+      Waits longer than ``max_wait`` are not retried.
+    * Without a server hint, delays use full jitter: a uniform draw between
+      zero and ``base_delay * 2 ** attempt``, capped at ``max_delay``.
+    * Every first attempt deposits ``budget_ratio`` tokens into a budget that
+      starts at ``budget_min`` and every retry spends one. Once the budget is
+      empty, failures are returned to the caller instead of retried, so one
+      struggling endpoint cannot keep the whole pool busy with retries.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_retries,
+        base_delay,
+        max_delay,
+        max_wait,
+        retry_statuses,
+        secondary_limit_wait,
+        budget_ratio,
+        budget_min,
+        clock=time.time,
+        jitter=random.uniform,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_wait = max_wait
+        self.retry_statuses = frozenset(retry_statuses)
+        self.secondary_limit_wait = secondary_limit_wait
+        self.budget_ratio = budget_ratio
+        self.budget_min = budget_min
+        self._clock = clock
+        self._jitter = jitter
+        self._lock = threading.Lock()
+        self._tokens = float(budget_min)
+        self.retries = 0
+        self.refused = 0
+
+    def reset(self):
+        """Refill the retry budget and clear the counters."""
+        with self._lock:
+            self._tokens = float(self.budget_min)
+            self.retries = 0
+            self.refused = 0
+
+    def record_request(self):
+        """Credit the retry budget for one new (non-retry) request."""
+        with self._lock:
+            self._tokens += self.budget_ratio
+
+    def _server_delay(self, response):
+        headers = getattr(response, "headers", None) or {}
+        retry_after = headers.get("Retry-After")
+        if isinstance(retry_after, str) and retry_after.strip():
+            value = retry_after.strip()
+            if value.isdigit():
+                return float(value)
+            try:
+                when = email.utils.parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            return max(0.0, when.timestamp() - self._clock())
+        if headers.get("X-RateLimit-Remaining") == "0":
+            reset_at = _parse_int_header(headers.get("X-RateLimit-Reset"))
+            if reset_at is not None and reset_at > self._clock():
+                return reset_at - self._clock()
+        if is_secondary_rate_limit(response):
+            # GitHub asks for at least a minute when it gives no hint.
+            return float(self.secondary_limit_wait)
+        return None
+
+    def delay_for(self, attempt, response=None):
+        """Return seconds to wait before retrying, or None to give up.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed.
+            response: The failed response, or None for a transport error
+                (connection reset, timeout) which is always retryable.
+        """
+        if attempt >= self.max_retries:
+            return None
+        server_delay = None
+        if response is not None:
+            status = response.status_code
+            if status not in self.retry_statuses and status not in (403, 429):
+                return None
+            server_delay = self._server_delay(response)
+            if status == 403 and server_delay is None:
+                # A plain 403 is a permission error, not back-pressure.
+                return None
+        if server_delay is None:
+            ceiling = min(self.max_delay, self.base_delay * 2**attempt)
+            delay = self._jitter(0, ceiling)
+        elif server_delay > self.max_wait:
+            return None
+        else:
+            delay = server_delay + self._jitter(0, self.base_delay)
+        with self._lock:
+            if self._tokens < 1:
+                self.refused += 1
+                refused = True
+            else:
+                self._tokens -= 1
+                self.retries += 1
+                refused = False
+        if refused:
+            logger.warning("retry_budget_exhausted attempt=%d", attempt + 1)
+            return None
+        return delay
+
+
+def _close_response(future):
+    """Release the connection held by a hedged request that lost the race."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    response, _latency = future.result()
+    close = getattr(response, "close", None)
+    if callable(close):
+        close()
+
+
+class RequestHedger:
+    """Duplicates slow idempotent requests once they outlive the usual latency.
+
+    Latencies of completed requests are kept in a sliding window. Once it
+    holds ``min_samples`` of them, a request still unanswered after the
+    ``quantile`` latency (p95 by default) gets a duplicate on another pooled
+    connection, and whichever reply arrives first is used. Hedges are capped
+    at ``max_fraction`` of all requests so a uniformly slow GitHub is not hit
+    twice as hard. Requests run on a private thread pool so the caller can
+    stop waiting for the slower copy.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers,
+        max_fraction,
+        quantile=0.95,
+        window=200,
+        min_samples=20,
+        min_delay=0.05,
+    ):
+        self.max_fraction = max_fraction
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self._samples = collections.deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(2, int(max_workers)),
+            thread_name_prefix="breakfast-hedge",
+        )
+        self._requests = 0
+        self.hedges = 0
+        self.wins = 0
+
+    def shutdown(self):
+        """Stop the hedging thread pool without waiting for stragglers."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def observe(self, latency):
+        """Add one completed request's latency to the sliding window."""
+        with self._lock:
+            self._samples.append(latency)
+
+    def hedge_delay(self):
+        """Return how long to wait before hedging, or None if too few samples."""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(self.quantile * len(ordered)))
+        return max(self.min_delay, ordered[index])
+
+    def _take_hedge(self):
+        with self._lock:
+            if self.hedges + 1 > self.max_fraction * self._requests:
+                return False
+            self.hedges += 1
+            return True
+
+    @staticmethod
+    def _timed(send, prepare=None):
+        if prepare is not None:
+            prepare()
+        t0 = time.monotonic()
+        response = send()
+        return response, time.monotonic() - t0
+
+    def call(self, send, prepare_hedge=None):
+        """Run ``send()``, hedging it once if it is slower than usual.
+
+        Args:
+            send: Zero-argument callable performing an idempotent request.
+            prepare_hedge: Optional callable run before the duplicate is sent,
+                e.g. to reserve rate-limit budget; if it raises, only the
+                original request is used.
+
+        Returns:
+            The first response to arrive. If one copy fails the other is
+            awaited; if both fail the first error is raised.
+        """
+        with self._lock:
+            self._requests += 1
+        delay = self.hedge_delay()
+        if delay is None:
+            response, latency = self._timed(send)
+            self.observe(latency)
+            return response
+        primary = self._executor.submit(self._timed, send)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._take_hedge():
+            response, latency = primary.result()
+            self.observe(latency)
+            return response
+        logger.debug("request_hedged after_s=%.3f", delay)
+        hedge = self._executor.submit(self._timed, send, prepare_hedge)
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response, latency = future.result()
+                except Exception as exc:
+                    error = error or exc
+                    continue
+                if future is hedge:
+                    with self._lock:
+                        self.wins += 1
+                self.observe(latency)
+                for other in (done | pending) - {future}:
+                    other.add_done_callback(_close_response)
+                return response
+        raise error
+
+
+class SingleFlight:
+    """Collapse concurrent identical calls into one in-flight execution.
+
+    The first caller for a key runs the call; callers arriving with the same
+    key while it is still running wait for that outcome instead of repeating
+    the request. Nothing is kept once the call finishes, so this is not a
+    cache: a later call with the same key goes out again.
+
+    Attributes:
+        shared: Number of calls answered by another caller's request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.shared = 0
+
+    def reset(self):
+        """Zero the shared-call counter."""
+        with self._lock:
+            self.shared = 0
+
+    def do(self, key, fn, *args, timeout=None, **kwargs):
+        """Run ``fn(*args, **kwargs)`` unless an identical call is in flight.
+
+        Args:
+            key: Hashable identity of the call.
+            fn: Callable performing the request.
+            timeout: Longest a caller joining an in-flight call waits for it,
+                or None for no bound. The caller that runs the call is not
+                affected.
+
+        Returns:
+            The call's result. Callers that joined an in-flight call get
+            deep copies of a snapshot the leader took before handing the
+            result to its own caller, so neither side can see the other
+            mutate it. If the call raised, every caller sees the same
+            exception.
+
+        Raises:
+            TimeoutError: A joining caller's *timeout* ran out first.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {"future": Future(), "followers": 0}
+            else:
+                call["followers"] += 1
+                self.shared += 1
+        future = call["future"]
+        if not leader:
+            logger.debug("single_flight_shared key=%r", key)
+            if not wait([future], timeout).done:
+                raise TimeoutError(f"timed out waiting for in-flight call {key!r}")
+            return copy.deepcopy(future.result())
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            with self._lock:
+                del self._calls[key]
+            future.set_exception(exc)
+            raise
+        # Once the key is gone no caller can join, so the snapshot is only
+        # taken when someone is waiting for it.
+        with self._lock:
+            del self._calls[key]
+            followers = call["followers"]
+        future.set_result(copy.deepcopy(result) if followers else None)
+        return result
@@ -8,10 +8,45 @@ def isolate_cache(tmp_path, monkeypatch):
     """Redirect the PR cache to a per-test temp dir so tests don't share cache state."""
     monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path / "breakfast_cache")
     api.get_required_approving_review_count.cache_clear()
+    yield
+    cache.close_store()
+
+
+@pytest.fixture(autouse=True)
+def isolate_session():
+    """Give every test a fresh session and fresh request-scheduling state."""
+    api.close_session()
+    api.configure_adaptive_concurrency(api._DEFAULT_HTTP_POOL_SIZE)
+    api.configure_conditional_requests(False)
+    api.configure_rate_limit_policy("abort")
+    api.reset_rate_limit_budget()
+    api.reset_retry_budget()
+    api.configure_request_hedging(False)
+    api.configure_protection_cache(None)
+    api.configure_check_cache(False)
+    api.configure_deadline(None)
+    yield
+    api.close_session()
+    api.configure_conditional_requests(False)
+    api.configure_rate_limit_policy("abort")
+    api.reset_rate_limit_budget()
+    api.reset_retry_budget()
+    api.configure_request_hedging(False)
+    api.configure_protection_cache(None)
+    api.configure_check_cache(False)
+    api.configure_deadline(None)
 
 
 @pytest.fixture(autouse=True)
 def wrap_monkeypatch(monkeypatch):
+    """Route ``api.requests.get/post`` fakes through the pooled session.
+
+    Request functions call ``get``/``post`` on the shared session rather than
+    the module-level helpers, so a fake installed on ``api.requests`` is
+    installed on the session as well. The session's default headers are merged
+    into each call, as ``requests.Session`` would, and keyword arguments the
+    fake does not accept (e.g. ``timeout``) are dropped.
+    """
     original_setattr = monkeypatch.setattr
 
     def custom_setattr(target, name, value, *args, **kwargs):
@@ -19,21 +54,30 @@ def wrap_monkeypatch(monkeypatch):
             original_value = value
             import inspect
 
+            session = api._get_session()
+
             def wrapped(*w_args, **w_kwargs):
                 if not callable(original_value):
                     return original_value
+                headers = dict(session.headers)
+                headers.update(w_kwargs.get("headers") or {})
+                w_kwargs["headers"] = headers
                 try:
                     sig = inspect.signature(original_value)
                     has_kwargs = any(
                         p.kind == p.VAR_KEYWORD for p in sig.parameters.values()
                     )
-                    has_timeout = "timeout" in sig.parameters
-                    if not (has_kwargs or has_timeout):
-                        w_kwargs.pop("timeout", None)
+                    if not has_kwargs:
+                        for key in list(w_kwargs):
+                            if key not in sig.parameters:
+                                w_kwargs.pop(key)
                 except (ValueError, TypeError):
                     pass
                 return original_value(*w_args, **w_kwargs)
 
+            # ``requests`` is shared with other modules (e.g. the updater), so
+            # keep patching the module too.
+            original_setattr(session, name, wrapped, *args, **kwargs)
             value = wrapped
         return original_setattr(target, name, value, *args, **kwargs)
 
@@ -1,7 +1,9 @@
+import time
+
 import pytest
 import requests
 
-from breakfast import api
+from breakfast import api, cache
 
 
 def test_make_github_api_request_retries_on_connection_error(monkeypatch):
@@ -385,6 +387,293 @@ def test_get_github_prs_skips_null_repo_nodes(monkeypatch):
     assert prs == ["https://example.com/valid-repo/1"]
 
 
+def test_get_github_pr_updates_returns_updated_at_per_url(monkeypatch):
+    queries = []
+
+    def fake_graphql(query, _variables):
+        queries.append(query)
+        return _single_page_response(
+            [
+                {
+                    "name": "repo",
+                    "pullRequests": {
+                        "nodes": [
+                            {
+                                "url": "https://github.com/org/repo/pull/1",
+                                "updatedAt": "t1",
+                            },
+                            {
+                                "url": "https://github.com/org/repo/pull/2",
+                                "updatedAt": "t2",
+                            },
+                        ]
+                    },
+                },
+                {
+                    "name": "skipped",
+                    "pullRequests": {
+                        "nodes": [
+                            {
+                                "url": "https://github.com/org/skipped/pull/3",
+                                "updatedAt": "t3",
+                            }
+                        ]
+                    },
+                },
+            ]
+        )
+
+    monkeypatch.setattr(api, "make_github_graphql_request", fake_graphql)
+    monkeypatch.setattr(api, "BREAKFAST_ITEMS", ["*"])
+
+    updates = api.get_github_pr_updates("org", ["repo"])
+
+    assert updates == {
+        "https://github.com/org/repo/pull/1": "t1",
+        "https://github.com/org/repo/pull/2": "t2",
+    }
+    assert "updatedAt" in queries[0]
+
+
+def test_get_github_prs_follows_pull_request_cursor_past_first_page(monkeypatch):
+    calls = []
+
+    def fake_graphql(query, variables):
+        calls.append(variables)
+        if "repositoryOwner" in query:
+            return _single_page_response(
+                [
+                    {
+                        "name": "monorepo",
+                        "pullRequests": {
+                            "nodes": [{"url": "pr-1"}],
+                            "pageInfo": {"endCursor": "c1", "hasNextPage": True},
+                        },
+                    },
+                    {
+                        "name": "ignored",
+                        "pullRequests": {
+                            "nodes": [{"url": "pr-x"}],
+                            "pageInfo": {"endCursor": "cx", "hasNextPage": True},
+                        },
+                    },
+                ]
+            )
+        has_next = variables["cursor"] == "c1"
+        return {
+            "data": {
+                "repository": {
+                    "pullRequests": {
+                        "nodes": [{"url": f"pr-after-{variables['cursor']}"}],
+                        "pageInfo": {"endCursor": "c2", "hasNextPage": has_next},
+                    }
+                }
+            }
+        }
+
+    monkeypatch.setattr(api, "make_github_graphql_request", fake_graphql)
+    monkeypatch.setattr(api, "BREAKFAST_ITEMS", ["*"])
+    before = api.get_api_stats()["graphql_overflow_pages"]
+
+    prs = api.get_github_prs("org", ["monorepo"])
+
+    assert prs == ["pr-1", "pr-after-c1", "pr-after-c2"]
+    assert calls[1:] == [
+        {"owner": "org", "name": "monorepo", "cursor": "c1"},
+        {"owner": "org", "name": "monorepo", "cursor": "c2"},
+    ]
+    assert api.get_api_stats()["graphql_overflow_pages"] == before + 2
+
+
+def test_overflow_pages_are_capped_per_repository(monkeypatch, caplog):
+    calls = []
+
+    def fake_graphql(query, variables):
+        calls.append(variables)
+        return {
+            "data": {
+                "repository": {
+                    "pullRequests": {
+                        "nodes": [{"url": f"pr-{len(calls)}"}],
+                        "pageInfo": {"endCursor": "next", "hasNextPage": True},
+                    }
+                }
+            }
+        }
+
+    monkeypatch.setattr(api, "make_github_graphql_request", fake_graphql)
+    monkeypatch.setattr(api, "_GRAPHQL_OVERFLOW_MAX_PAGES", 3)
+    repo = {
+        "name": "monorepo",
+        "pullRequests": {"pageInfo": {"endCursor": "c1", "hasNextPage": True}},
+    }
+
+    with caplog.at_level("WARNING", logger="breakfast"):
+        nodes, pages, truncated = api._fetch_remaining_pull_requests(
+            "org", repo, "query"
+        )
+
+    assert pages == 3
+    assert truncated is True
+    assert [node["url"] for node in nodes] == ["pr-1", "pr-2", "pr-3"]
+    assert "graphql_pr_overflow_truncated" in caplog.text
+
+
+def test_discovery_truncation_collects_capped_repositories(monkeypatch):
+    queries = []
+
+    def fake_graphql(query, variables):
+        queries.append(query)
+        if "repositoryOwner" in query:
+            return _single_page_response(
+                [
+                    {
+                        "name": "monorepo",
+                        "pullRequests": {
+                            "nodes": [{"url": "pr-1"}],
+                            "pageInfo": {"endCursor": "c1", "hasNextPage": True},
+                        },
+                    }
+                ]
+            )
+        return {
+            "data": {
+                "repository": {
+                    "pullRequests": {
+                        "nodes": [{"url": "pr-2"}],
+                        "pageInfo": {"endCursor": "c2", "hasNextPage": True},
+                    }
+                }
+            }
+        }
+
+    monkeypatch.setattr(api, "make_github_graphql_request", fake_graphql)
+    monkeypatch.setattr(api, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(api, "_GRAPHQL_OVERFLOW_MAX_PAGES", 1)
+
+    with api.discovery_truncation() as truncated:
+        prs = api.get_github_prs("org", None)
+
+    assert prs == ["pr-1", "pr-2"]
+    assert truncated == {"org/monorepo"}
+    # Both the first page and the overflow pages read newest PRs first.
+    assert all("direction: DESC" in query for query in queries)
+
+
+def test_quiet_discovery_progress_suppresses_fetch_line(monkeypatch, capsys):
+    monkeypatch.setattr(
+        api,
+        "make_github_graphql_request",
+        lambda _q, _v: _single_page_graphql(["https://github.com/org/repo/pull/1"]),
+    )
+
+    with api.quiet_discovery_progress():
+        prs = api.get_github_prs("org", None)
+    assert capsys.readouterr().err == ""
+
+    api.get_github_prs("org", None)
+    assert "Fetching org PRs..." in capsys.readouterr().err
+    assert prs == ["https://github.com/org/repo/pull/1"]
+
+
+def test_match_repo_filter_exact_name():
+    assert api._match_repo_filter("My-App", ["=my-app"]) is True
+    assert api._match_repo_filter("my-app-legacy", ["=my-app"]) is False
+
+
+def _named_repo(name, urls):
+    return {
+        "name": name,
+        "pullRequests": {
+            "nodes": [{"url": url} for url in urls],
+            "pageInfo": {"endCursor": None, "hasNextPage": False},
+        },
+    }
+
+
+def test_get_github_prs_looks_up_exact_names_without_scanning(monkeypatch):
+    calls = []
+
+    def fake_graphql(query, variables):
+        calls.append((query, variables))
+        return {
+            "data": {
+                "repositoryOwner": {
+                    "r0": _named_repo("api", ["https://github.com/org/api/pull/1"]),
+                    "r1": _named_repo("web", ["https://github.com/org/web/pull/2"]),
+                }
+            }
+        }
+
+    monkeypatch.setattr(api, "make_github_graphql_request", fake_graphql)
+
+    prs = api.get_github_prs("org", ["=api", "=web", "=API"])
+
+    assert prs == [
+        "https://github.com/org/api/pull/1",
+        "https://github.com/org/web/pull/2",
+    ]
+    assert len(calls) == 1
+    query, variables = calls[0]
+    assert "repositories(" not in query
+    assert variables == {"owner": "org", "n0": "API", "n1": "web"}
+
+
+def test_get_github_prs_skips_exact_names_github_cannot_resolve(monkeypatch):
+    def fake_graphql(_query, _variables):
+        raise api.GitHubGraphQLError(
+            [{"type": "NOT_FOUND", "path": ["repositoryOwner", "r1"]}],
+            data={
+                "repositoryOwner": {
+                    "r0": _named_repo("api", ["https://github.com/org/api/pull/1"]),
+                    "r1": None,
+                }
+            },
+        )
+
+    monkeypatch.setattr(api, "make_github_graphql_request", fake_graphql)
+
+    assert api.get_github_prs("org", ["=api", "=gone"]) == [
+        "https://github.com/org/api/pull/1"
+    ]
+
+
+def test_get_github_prs_exact_names_raise_owner_not_found(monkeypatch):
+    monkeypatch.setattr(
+        api,
+        "make_github_graphql_request",
+        lambda _q, _v: {"data": {"repositoryOwner": None}},
+    )
+
+    with pytest.raises(api.OwnerNotFoundError):
+        api.get_github_prs("ghost", ["=api"])
+
+
+def test_get_github_prs_mixed_filters_still_scan(monkeypatch):
+    queries = []
+
+    def fake_graphql(query, _variables):
+        queries.append(query)
+        return _single_page_response(
+            [
+                _named_repo("api", ["https://github.com/org/api/pull/1"]),
+                _named_repo("api-docs", ["https://github.com/org/api-docs/pull/2"]),
+                _named_repo("web-app", ["https://github.com/org/web-app/pull/3"]),
+            ]
+        )
+
+    monkeypatch.setattr(api, "make_github_graphql_request", fake_graphql)
+    monkeypatch.setattr(api, "BREAKFAST_ITEMS", ["*"])
+
+    prs = api.get_github_prs("org", ["=api", "web"])
+
+    assert prs == [
+        "https://github.com/org/api/pull/1",
+        "https://github.com/org/web-app/pull/3",
+    ]
+    assert "repositories(" in queries[0]
+
+
 def test_get_github_prs_raises_owner_not_found_when_null(monkeypatch):
     response = {"data": {"repositoryOwner": None}}
     monkeypatch.setattr(api, "make_github_graphql_request", lambda _q, _v: response)
@@ -787,6 +1076,101 @@ def test_get_required_approving_review_count(monkeypatch):
     assert api.get_required_approving_review_count("org", "repo", "main") == 2
 
 
+def test_required_approving_review_count_is_cached_on_disk(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        api,
+        "make_github_api_request",
+        lambda path: calls.append(path) or {"required_approving_review_count": 2},
+    )
+    api.configure_protection_cache(3600)
+
+    assert api.get_required_approving_review_count("org", "repo", "main") == 2
+    # A later run starts with an empty in-process memo.
+    api.get_required_approving_review_count.cache_clear()
+    assert api.get_required_approving_review_count("org", "repo", "main") == 2
+    assert len(calls) == 1
+
+
+def test_required_approving_review_count_caches_forbidden_as_none(monkeypatch):
+    calls = []
+
+    def forbidden(path):
+        calls.append(path)
+        response = requests.Response()
+        response.status_code = 403
+        raise requests.exceptions.HTTPError(response=response)
+
+    monkeypatch.setattr(api, "make_github_api_request", forbidden)
+    api.configure_protection_cache(3600)
+
+    assert api.get_required_approving_review_count("org", "repo", "main") is None
+    api.get_required_approving_review_count.cache_clear()
+    assert api.get_required_approving_review_count("org", "repo", "main") is None
+    assert len(calls) == 1
+
+
+def test_required_approving_review_count_does_not_cache_errors(monkeypatch):
+    def unavailable(path):
+        response = requests.Response()
+        response.status_code = 500
+        raise requests.exceptions.HTTPError(response=response)
+
+    monkeypatch.setattr(api, "make_github_api_request", unavailable)
+    api.configure_protection_cache(3600)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        api.get_required_approving_review_count("org", "repo", "main")
+    assert (
+        cache.read_protection_cache(
+            "org", "repo", "main", 3600, api._token_cache_scope()
+        )
+        is None
+    )
+
+
+def test_protection_cache_refresh_skips_reads_but_rewrites(monkeypatch):
+    scope = api._token_cache_scope()
+    cache.write_protection_cache("org", "repo", "main", None, scope)
+    monkeypatch.setattr(
+        api,
+        "make_github_api_request",
+        lambda path: {"required_approving_review_count": 3},
+    )
+    api.configure_protection_cache(3600, refresh=True)
+
+    assert api.get_required_approving_review_count("org", "repo", "main") == 3
+    assert cache.read_protection_cache("org", "repo", "main", 3600, scope) == {
+        "required": 3
+    }
+
+
+def test_protection_cache_is_not_shared_between_tokens(monkeypatch):
+    calls = []
+
+    def forbidden(path):
+        calls.append(path)
+        response = requests.Response()
+        response.status_code = 404
+        raise requests.exceptions.HTTPError(response=response)
+
+    monkeypatch.setattr(api, "make_github_api_request", forbidden)
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "limited-token")
+    api.configure_protection_cache(3600)
+    assert api.get_required_approving_review_count("org", "repo", "main") is None
+
+    # An admin token must not be answered with the limited token's 404.
+    api.get_required_approving_review_count.cache_clear()
+    monkeypatch.setattr(
+        api,
+        "make_github_api_request",
+        lambda path: {"required_approving_review_count": 2},
+    )
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "admin-token")
+    assert api.get_required_approving_review_count("org", "repo", "main") == 2
+    assert len(calls) == 1
+
+
 def test_get_approval_summary_includes_counts_for_multi_review_branch(monkeypatch):
     monkeypatch.setattr(
         api,
@@ -1414,6 +1798,36 @@ def test_fetch_pr_detail_trailing_slash(monkeypatch):
     assert calls == ["/repos/org/repo/pulls/7"]
 
 
+def test_fetch_pr_detail_projects_payload(monkeypatch):
+    """Only the fields breakfast reads are kept from the REST payload."""
+    payload = {
+        "id": 1,
+        "number": 42,
+        "body": "A long description",
+        "_links": {"self": {"href": "https://api.github.com/x"}},
+        "user": {"login": "alice", "avatar_url": "https://x/a.png"},
+        "base": {
+            "ref": "main",
+            "sha": "def456",
+            "repo": {
+                "name": "myrepo",
+                "hooks_url": "https://api.github.com/h",
+                "owner": {"login": "myorg", "type": "Organization"},
+            },
+        },
+    }
+    monkeypatch.setattr(api, "make_github_api_request", lambda _path: payload)
+    assert api._fetch_pr_detail("https://github.com/myorg/myrepo/pull/42") == {
+        "id": 1,
+        "number": 42,
+        "user": {"login": "alice"},
+        "base": {
+            "ref": "main",
+            "repo": {"name": "myrepo", "owner": {"login": "myorg"}},
+        },
+    }
+
+
 def test_fetch_pr_detail_invalid_url_raises():
     """A URL with too few path segments raises ValueError."""
     import pytest
@@ -1569,3 +1983,1275 @@ def test_resolve_github_token_info(monkeypatch):
 
     monkeypatch.delenv("GITHUB_TOKEN", raising=False)
     assert api._resolve_github_token_info() == (None, None)
+
+
+# ---------------------------------------------------------------------------
+# Pooled keep-alive session
+# ---------------------------------------------------------------------------
+
+
+def test_get_session_is_shared_and_carries_auth_headers(monkeypatch):
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+
+    session = api._get_session()
+
+    assert api._get_session() is session
+    assert session.headers["Authorization"] == "token token-123"
+    assert session.headers["Accept"] == "application/vnd.github.v3+json"
+
+
+def test_get_session_refreshes_auth_header_when_token_changes(monkeypatch):
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "old-token")
+    session = api._get_session()
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "new-token")
+
+    assert api._get_session() is session
+    assert session.headers["Authorization"] == "token new-token"
+
+
+def test_configure_session_pool_sizes_adapter_to_workers():
+    api.configure_session_pool(16)
+    try:
+        adapter = api._get_session().get_adapter(api.GITHUB_API_URL)
+        assert adapter._pool_maxsize == 16
+    finally:
+        api.configure_session_pool(api._DEFAULT_HTTP_POOL_SIZE)
+
+
+def test_make_github_graphql_request_overrides_auth_scheme(monkeypatch):
+    calls = {}
+
+    class DummyResponse:
+        status_code = 200
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"data": {"ok": True}}
+
+    def fake_post(url, json, headers):
+        calls["headers"] = headers
+        return DummyResponse()
+
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(api.requests, "post", fake_post)
+
+    api.make_github_graphql_request("{ viewer { login } }")
+
+    assert calls["headers"]["Authorization"] == "Bearer token-123"
+
+
+def test_get_api_stats_reports_connection_reuse(monkeypatch):
+    class FakePool:
+        num_connections = 2
+        num_requests = 9
+
+    session = api._get_session()
+    adapter = session.get_adapter(api.GITHUB_API_URL)
+    monkeypatch.setattr(adapter.poolmanager, "pools", {"api.github.com": FakePool()})
+
+    stats = api.get_api_stats()
+
+    assert stats["connections_opened"] == 2
+    assert stats["connections_reused"] == 7
+
+
+def test_get_api_stats_without_session_reports_zero_connections():
+    stats = api.get_api_stats()
+
+    assert stats["connections_opened"] == 0
+    assert stats["connections_reused"] == 0
+
+
+class _ConditionalResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self._body = body
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._body
+
+
+def test_make_github_api_request_revalidates_with_stored_etag(monkeypatch):
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    api.configure_conditional_requests(True)
+    sent = []
+    responses = [
+        _ConditionalResponse(200, {"title": "PR"}, {"ETag": '"v1"'}),
+        _ConditionalResponse(304),
+    ]
+
+    def fake_get(url, headers, timeout):
+        sent.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(api.requests, "get", fake_get)
+    before = api.get_api_stats()["rest_not_modified"]
+
+    assert api.make_github_api_request("/repos/org/repo/pulls/1") == {"title": "PR"}
+    assert api.make_github_api_request("/repos/org/repo/pulls/1") == {"title": "PR"}
+
+    assert "If-None-Match" not in sent[0]
+    assert sent[1]["If-None-Match"] == '"v1"'
+    assert api.get_api_stats()["rest_not_modified"] == before + 1
+
+
+def test_make_github_api_request_sends_if_modified_since(monkeypatch):
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    api.configure_conditional_requests(True)
+    stamp = "Tue, 01 Sep 2026 10:00:00 GMT"
+    sent = []
+    responses = [
+        _ConditionalResponse(200, [1], {"Last-Modified": stamp}),
+        _ConditionalResponse(200, [2], {"Last-Modified": stamp}),
+    ]
+
+    def fake_get(url, headers, timeout):
+        sent.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(api.requests, "get", fake_get)
+
+    api.make_github_api_request("/repos/org/repo/pulls/1/reviews")
+    assert api.make_github_api_request("/repos/org/repo/pulls/1/reviews") == [2]
+    assert sent[1]["If-Modified-Since"] == stamp
+
+
+def test_make_github_api_request_skips_validators_when_disabled(monkeypatch):
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    sent = []
+
+    def fake_get(url, headers, timeout):
+        sent.append(headers)
+        return _ConditionalResponse(200, {"n": 1}, {"ETag": '"v1"'})
+
+    monkeypatch.setattr(api.requests, "get", fake_get)
+
+    api.make_github_api_request("/repos/org/repo")
+    api.make_github_api_request("/repos/org/repo")
+
+    assert all("If-None-Match" not in headers for headers in sent)
+    scope = api._token_cache_scope()
+    assert cache.read_conditional_entry("/repos/org/repo", scope) is None
+
+
+def test_make_github_api_request_keeps_validators_per_token(monkeypatch):
+    api.configure_conditional_requests(True)
+    sent = []
+
+    def fake_get(url, headers, timeout):
+        sent.append(headers)
+        return _ConditionalResponse(200, {"n": 1}, {"ETag": '"v1"'})
+
+    monkeypatch.setattr(api.requests, "get", fake_get)
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-a")
+    api.make_github_api_request("/repos/org/private")
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-b")
+    api.make_github_api_request("/repos/org/private")
+
+    # token-b must fetch for itself rather than revalidate token-a's body.
+    assert "If-None-Match" not in sent[1]
+
+
+# ---------------------------------------------------------------------------
+# GraphQL detail discovery
+# ---------------------------------------------------------------------------
+
+
+def _graphql_pr_node(**overrides):
+    node = {
+        "url": "https://github.com/org/app/pull/7",
+        "databaseId": 7007,
+        "number": 7,
+        "title": "Add pancakes",
+        "state": "OPEN",
+        "isDraft": False,
+        "merged": False,
+        "createdAt": "2026-01-10T00:00:00Z",
+        "updatedAt": "2026-01-12T00:00:00Z",
+        "closedAt": None,
+        "mergedAt": None,
+        "additions": 12,
+        "deletions": 3,
+        "changedFiles": 2,
+        "mergeable": "MERGEABLE",
+        "mergeStateStatus": "CLEAN",
+        "headRefName": "feature/pancakes",
+        "headRefOid": "abc123",
+        "baseRefName": "main",
+        "author": {"login": "alice", "url": "https://github.com/alice"},
+        "commits": {"totalCount": 4},
+        "comments": {"totalCount": 5},
+        "reviewThreads": {"totalCount": 6},
+        "labels": {"nodes": [{"name": "bug", "color": "d73a4a"}]},
+        "reviewRequests": {
+            "nodes": [
+                {"requestedReviewer": {"login": "bob", "url": "https://x/bob"}},
+                {"requestedReviewer": {"slug": "core", "name": "Core"}},
+            ]
+        },
+    }
+    node.update(overrides)
+    return node
+
+
+_GRAPHQL_REPO = {
+    "name": "app",
+    "url": "https://github.com/org/app",
+    "owner": {"login": "org"},
+}
+
+
+def test_normalize_graphql_pr_matches_rest_shape():
+    detail = api._normalize_graphql_pr(_graphql_pr_node(), _GRAPHQL_REPO)
+
+    assert detail["id"] == 7007
+    assert detail["number"] == 7
+    assert detail["html_url"] == "https://github.com/org/app/pull/7"
+    assert detail["state"] == "open"
+    assert detail["draft"] is False
+    assert detail["mergeable"] is True
+    assert detail["mergeable_state"] == "clean"
+    assert detail["commits"] == 4
+    assert detail["comments"] == 5
+    assert detail["review_comments"] == 6
+    assert detail["user"] == {"login": "alice", "html_url": "https://github.com/alice"}
+    assert detail["labels"] == [{"name": "bug", "color": "d73a4a"}]
+    assert detail["requested_reviewers"] == [
+        {"login": "bob", "html_url": "https://x/bob"}
+    ]
+    assert detail["requested_teams"] == [{"slug": "core", "name": "Core"}]
+    assert detail["head"] == {"ref": "feature/pancakes", "sha": "abc123"}
+    assert detail["base"]["ref"] == "main"
+    assert detail["base"]["repo"]["name"] == "app"
+    assert detail["base"]["repo"]["owner"]["login"] == "org"
+
+
+def test_normalize_graphql_pr_maps_merged_conflicts_and_ghost_author():
+    detail = api._normalize_graphql_pr(
+        _graphql_pr_node(
+            state="MERGED",
+            merged=True,
+            mergeable="CONFLICTING",
+            author=None,
+            labels=None,
+        ),
+        _GRAPHQL_REPO,
+    )
+
+    assert detail["state"] == "closed"
+    assert detail["merged"] is True
+    assert detail["mergeable"] is False
+    assert detail["user"]["login"] == "ghost"
+    assert detail["labels"] == []
+
+
+def test_normalize_graphql_pr_unknown_mergeable_is_none():
+    detail = api._normalize_graphql_pr(
+        _graphql_pr_node(mergeable="UNKNOWN", mergeStateStatus=None), _GRAPHQL_REPO
+    )
+
+    assert detail["mergeable"] is None
+    assert detail["mergeable_state"] is None
+
+
+def test_get_github_pr_details_filters_repos_and_requests_detail_fields(monkeypatch):
+    queries = []
+
+    def fake_graphql(query, _variables):
+        queries.append(query)
+        return _single_page_response(
+            [
+                {**_GRAPHQL_REPO, "pullRequests": {"nodes": [_graphql_pr_node()]}},
+                {
+                    **_GRAPHQL_REPO,
+                    "name": "other",
+                    "pullRequests": {"nodes": [_graphql_pr_node(number=8)]},
+                },
+            ]
+        )
+
+    monkeypatch.setattr(api, "make_github_graphql_request", fake_graphql)
+
+    details = api.get_github_pr_details("org", ["app"])
+
+    assert [d["number"] for d in details] == [7]
+    assert "changedFiles" in queries[0]
+    assert "owner { login }" in queries[0]
+
+
+# ---------------------------------------------------------------------------
+# Batched check status via statusCheckRollup
+# ---------------------------------------------------------------------------
+
+
+def _rollup(state, nodes, has_next=False):
+    return {
+        "state": state,
+        "contexts": {"pageInfo": {"hasNextPage": has_next}, "nodes": nodes},
+    }
+
+
+def test_check_status_from_rollup_none_when_missing():
+    assert api._check_status_from_rollup(None) == "none"
+
+
+def test_check_status_from_rollup_pending_run_wins_over_failure():
+    rollup = _rollup(
+        "FAILURE",
+        [
+            {"__typename": "CheckRun", "status": "IN_PROGRESS", "conclusion": None},
+            {"__typename": "CheckRun", "status": "COMPLETED", "conclusion": "FAILURE"},
+        ],
+    )
+    assert api._check_status_from_rollup(rollup) == "pending"
+
+
+def test_check_status_from_rollup_failed_status_context():
+    rollup = _rollup(
+        "FAILURE",
+        [
+            {"__typename": "CheckRun", "status": "COMPLETED", "conclusion": "SUCCESS"},
+            {"__typename": "StatusContext", "state": "ERROR"},
+        ],
+    )
+    assert api._check_status_from_rollup(rollup) == "fail"
+
+
+def test_check_status_from_rollup_expected_context_is_pending():
+    rollup = _rollup("EXPECTED", [{"__typename": "StatusContext", "state": "EXPECTED"}])
+    assert api._check_status_from_rollup(rollup) == "pending"
+
+
+def test_check_status_from_rollup_uses_rollup_state_when_truncated():
+    rollup = _rollup(
+        "FAILURE",
+        [{"__typename": "CheckRun", "status": "COMPLETED", "conclusion": "SUCCESS"}],
+        has_next=True,
+    )
+    assert api._check_status_from_rollup(rollup) == "fail"
+
+
+def test_get_check_statuses_batches_targets(monkeypatch):
+    calls = []
+
+    def fake_graphql(query, variables):
+        calls.append(variables)
+        count = len(variables) // 3
+        success = [
+            {"__typename": "CheckRun", "status": "COMPLETED", "conclusion": "SUCCESS"}
+        ]
+        return {
+            "data": {
+                f"c{i}": {"object": {"statusCheckRollup": _rollup("SUCCESS", success)}}
+                for i in range(count)
+            }
+        }
+
+    monkeypatch.setattr(api, "make_github_graphql_request", fake_graphql)
+    monkeypatch.setattr(api, "_GRAPHQL_BATCH_SIZE", 2)
+
+    targets = [("org", "repo", f"sha-{i}") for i in range(3)]
+    results = api.get_check_statuses(targets + targets[:1])
+
+    assert results == {target: "pass" for target in targets}
+    assert len(calls) == 2
+    assert calls[0] == {
+        "o0": "org",
+        "r0": "repo",
+        "s0": "sha-0",
+        "o1": "org",
+        "r1": "repo",
+        "s1": "sha-1",
+    }
+
+
+def test_get_check_status_reuses_settled_result_for_same_commit(monkeypatch):
+    calls = []
+
+    def fake_api_request(path):
+        calls.append(path)
+        if "/check-runs" in path:
+            return {"check_runs": [{"status": "completed", "conclusion": "failure"}]}
+        return {"statuses": []}
+
+    monkeypatch.setattr(api, "make_github_api_request", fake_api_request)
+    api.configure_check_cache(True)
+
+    assert api.get_check_status("org", "repo", "abc") == "fail"
+    assert api.get_check_status("org", "repo", "abc") == "fail"
+    assert len(calls) == 2
+
+
+def test_get_check_status_reads_every_page_of_check_runs(monkeypatch):
+    calls = []
+    passed = {"status": "completed", "conclusion": "success"}
+    failed = {"status": "completed", "conclusion": "failure"}
+
+    def fake_api_request(path):
+        calls.append(path)
+        if "/check-runs" in path:
+            if path.endswith("page=1"):
+                return {"total_count": 101, "check_runs": [passed] * 100}
+            return {"total_count": 101, "check_runs": [failed]}
+        return {"total_count": 0, "statuses": []}
+
+    monkeypatch.setattr(api, "make_github_api_request", fake_api_request)
+
+    assert api.get_check_status("org", "repo", "abc") == "fail"
+    assert calls == [
+        "/repos/org/repo/commits/abc/check-runs?per_page=100&page=1",
+        "/repos/org/repo/commits/abc/check-runs?per_page=100&page=2",
+        "/repos/org/repo/commits/abc/status?per_page=100&page=1",
+    ]
+
+
+def test_get_check_status_stops_at_total_count(monkeypatch):
+    calls = []
+    passed = {"status": "completed", "conclusion": "success"}
+
+    def fake_api_request(path):
+        calls.append(path)
+        if "/check-runs" in path:
+            return {"total_count": 100, "check_runs": [passed] * 100}
+        return {"statuses": []}
+
+    monkeypatch.setattr(api, "make_github_api_request", fake_api_request)
+
+    assert api.get_check_status("org", "repo", "abc") == "pass"
+    assert len(calls) == 2
+
+
+def test_get_check_status_repolls_pending_after_short_ttl(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        api,
+        "make_github_api_request",
+        lambda path: calls.append(path) or {"statuses": [{"state": "pending"}]},
+    )
+    api.configure_check_cache(True)
+    monkeypatch.setattr(api, "_PENDING_CHECK_CACHE_TTL", 0)
+
+    assert api.get_check_status("org", "repo", "abc") == "pending"
+    time.sleep(0.01)
+    assert api.get_check_status("org", "repo", "abc") == "pending"
+    assert len(calls) == 4
+
+
+def test_get_check_statuses_skips_cached_commits(monkeypatch):
+    api.configure_check_cache(True)
+    cache.write_check_cache("org", "repo", "sha-0", "pass")
+    calls = []
+
+    def fake_graphql(query, variables):
+        calls.append(variables)
+        failed = [
+            {"__typename": "CheckRun", "status": "COMPLETED", "conclusion": "FAILURE"}
+        ]
+        return {
+            "data": {
+                "c0": {"object": {"statusCheckRollup": _rollup("FAILURE", failed)}}
+            }
+        }
+
+    monkeypatch.setattr(api, "make_github_graphql_request", fake_graphql)
+
+    results = api.get_check_statuses(
+        [("org", "repo", "sha-0"), ("org", "repo", "sha-1")]
+    )
+
+    assert results == {
+        ("org", "repo", "sha-0"): "pass",
+        ("org", "repo", "sha-1"): "fail",
+    }
+    assert [call["s0"] for call in calls] == ["sha-1"]
+    assert cache.read_check_cache("org", "repo", "sha-1", 60) == "fail"
+
+
+def test_get_check_statuses_falls_back_to_rest_on_graphql_error(monkeypatch):
+    def fake_graphql(_query, _variables):
+        raise api.GitHubGraphQLError([{"type": "NOT_FOUND", "message": "gone"}])
+
+    monkeypatch.setattr(api, "make_github_graphql_request", fake_graphql)
+    monkeypatch.setattr(api, "get_check_status", lambda owner, repo, sha: "fail")
+
+    assert api.get_check_statuses([("org", "repo", "abc")]) == {
+        ("org", "repo", "abc"): "fail"
+    }
+
+
+def _approval_node(decision=None, reviews=()):
+    return {
+        "pullRequest": {
+            "reviewDecision": decision,
+            "latestOpinionatedReviews": {
+                "nodes": [
+                    {"state": state, "author": {"login": login}}
+                    for login, state in reviews
+                ]
+            },
+        }
+    }
+
+
+def test_approval_summary_from_graphql_applies_branch_protection():
+    node = _approval_node(reviews=[("alice", "APPROVED"), ("bob", "APPROVED")])
+    assert api._approval_summary_from_graphql(node["pullRequest"], 3) == {
+        "status": "pending",
+        "current": 2,
+        "required": 3,
+    }
+
+
+def test_approval_summary_from_graphql_prefers_review_decision():
+    node = _approval_node(
+        decision="CHANGES_REQUESTED",
+        reviews=[("alice", "APPROVED"), ("bob", "CHANGES_REQUESTED")],
+    )
+    assert api._approval_summary_from_graphql(node["pullRequest"], 1) == {
+        "status": "changes",
+        "current": 1,
+        "required": 1,
+    }
+
+
+def test_approval_summary_from_graphql_handles_missing_pull_request():
+    assert api._approval_summary_from_graphql(None) == {
+        "status": "pending",
+        "current": 0,
+        "required": None,
+    }
+
+
+def test_get_approval_summaries_batches_targets(monkeypatch):
+    calls = []
+
+    def fake_graphql(query, variables):
+        calls.append(variables)
+        count = len(variables) // 3
+        return {
+            "data": {
+                f"a{i}": _approval_node(
+                    decision="APPROVED", reviews=[("alice", "APPROVED")]
+                )
+                for i in range(count)
+            }
+        }
+
+    monkeypatch.setattr(api, "make_github_graphql_request", fake_graphql)
+    monkeypatch.setattr(api, "_GRAPHQL_BATCH_SIZE", 2)
+    monkeypatch.setattr(
+        api, "get_required_approving_review_count", lambda _o, _r, _b: 1
+    )
+
+    targets = [("org", "repo", number, "main") for number in (1, 2, 3)]
+    results = api.get_approval_summaries(targets + targets[:1])
+
+    assert results == {
+        target[:3]: {"status": "approved", "current": 1, "required": 1}
+        for target in targets
+    }
+    assert len(calls) == 2
+    assert calls[1] == {"o0": "org", "r0": "repo", "n0": 3}
+
+
+def test_get_approval_summaries_reads_protection_without_failing_batch(monkeypatch):
+    protection_calls = []
+
+    def fake_graphql(query, _variables):
+        assert "branchProtectionRule" not in query
+        return {
+            "data": {
+                f"a{i}": _approval_node(reviews=[("alice", "APPROVED")])
+                for i in range(2)
+            }
+        }
+
+    def forbidden(path):
+        protection_calls.append(path)
+        response = requests.Response()
+        response.status_code = 403
+        raise requests.exceptions.HTTPError(response=response)
+
+    def no_rest_fallback(*_args, **_kwargs):
+        raise AssertionError("the batch must not fall back to REST")
+
+    monkeypatch.setattr(api, "make_github_graphql_request", fake_graphql)
+    monkeypatch.setattr(api, "make_github_api_request", forbidden)
+    monkeypatch.setattr(api, "get_approval_summary", no_rest_fallback)
+
+    results = api.get_approval_summaries(
+        [("org", "repo", 1, "main"), ("org", "repo", 2, "main")]
+    )
+
+    # One protection lookup per base branch; a forbidden one is just unknown.
+    assert len(protection_calls) == 1
+    assert results == {
+        ("org", "repo", n): {"status": "approved", "current": 1, "required": None}
+        for n in (1, 2)
+    }
+
+
+def test_get_approval_summaries_falls_back_to_rest_on_graphql_error(monkeypatch):
+    def fake_graphql(_query, _variables):
+        raise api.GitHubGraphQLError([{"type": "FORBIDDEN", "message": "nope"}])
+
+    rest_calls = []
+
+    def fake_summary(owner, repo, pr_number, base_branch=None):
+        rest_calls.append((owner, repo, pr_number, base_branch))
+        if pr_number == 2:
+            raise requests.exceptions.ConnectionError("boom")
+        return {"status": "approved", "current": 2, "required": 2}
+
+    monkeypatch.setattr(api, "make_github_graphql_request", fake_graphql)
+    monkeypatch.setattr(api, "get_approval_summary", fake_summary)
+
+    results = api.get_approval_summaries(
+        [("org", "repo", 1, "main"), ("org", "repo", 2, "main")]
+    )
+
+    assert rest_calls == [("org", "repo", 1, "main"), ("org", "repo", 2, "main")]
+    assert results == {
+        ("org", "repo", 1): {"status": "approved", "current": 2, "required": 2},
+        ("org", "repo", 2): {"status": "pending", "current": 0, "required": None},
+    }
+
+
+# ---------------------------------------------------------------------------
+# Search-API discovery
+# ---------------------------------------------------------------------------
+
+
+def test_build_pr_search_query_maps_user_centric_filters():
+    query = api.build_pr_search_query(
+        "org",
+        ["=api", "=web"],
+        "open",
+        mine_only=True,
+        needs_my_review=True,
+        labels=("bug", "help wanted"),
+        exclude_labels=("wip",),
+        no_drafts=True,
+    )
+
+    assert query == (
+        "is:pr user:org repo:org/api repo:org/web is:open author:@me"
+        ' review-requested:@me label:bug,"help wanted" -label:wip draft:false'
+    )
+
+
+def test_build_pr_search_query_leaves_substring_filters_to_the_client():
+    query = api.build_pr_search_query("org", ["=api", "web"], "merged")
+
+    assert query == "is:pr user:org is:merged"
+
+
+def _search_page(nodes, has_next=False, cursor=None, issue_count=None):
+    return {
+        "data": {
+            "search": {
+                "issueCount": len(nodes) if issue_count is None else issue_count,
+                "nodes": nodes,
+                "pageInfo": {"endCursor": cursor, "hasNextPage": has_next},
+            }
+        }
+    }
+
+
+def _search_node(repo, number, updated="2026-01-01T00:00:00Z"):
+    return {
+        "url": f"https://github.com/org/{repo}/pull/{number}",
+        "updatedAt": updated,
+        "repository": {"name": repo},
+    }
+
+
+def test_search_github_prs_pages_and_filters_repos(monkeypatch):
+    calls = []
+    pages = [
+        _search_page([_search_node("web-app", 1), {}], has_next=True, cursor="c1"),
+        _search_page([_search_node("docs", 2), _search_node("web-api", 3)]),
+    ]
+
+    def fake_graphql(_query, variables):
+        calls.append(variables)
+        return pages.pop(0)
+
+    monkeypatch.setattr(api, "make_github_graphql_request", fake_graphql)
+    monkeypatch.setattr(api, "BREAKFAST_ITEMS", ["*"])
+
+    updates = api.search_github_prs("org", ["web"], "open", mine_only=True)
+
+    assert list(updates) == [
+        "https://github.com/org/web-app/pull/1",
+        "https://github.com/org/web-api/pull/3",
+    ]
+    assert calls[0]["searchQuery"] == "is:pr user:org is:open author:@me"
+    assert calls[1]["cursor"] == "c1"
+
+
+def test_search_github_prs_raises_owner_not_found(monkeypatch):
+    def fake_graphql(_query, _variables):
+        raise api.GitHubGraphQLError(
+            [
+                {
+                    "type": "INVALID",
+                    "message": "The listed users and repositories cannot be"
+                    " searched either because the resources do not exist or"
+                    " you do not have permission to view them.",
+                }
+            ]
+        )
+
+    monkeypatch.setattr(api, "make_github_graphql_request", fake_graphql)
+
+    with pytest.raises(api.OwnerNotFoundError):
+        api.search_github_prs("ghost", [])
+
+
+def test_search_github_prs_logs_truncated_results(monkeypatch, caplog):
+    monkeypatch.setattr(
+        api,
+        "make_github_graphql_request",
+        lambda _q, _v: _search_page([_search_node("api", 1)], issue_count=1500),
+    )
+
+    with caplog.at_level("WARNING", logger="breakfast"):
+        api.search_github_prs("org", [])
+
+    assert "graphql_search_truncated" in caplog.text
+
+
+# ---------------------------------------------------------------------------
+# Rate-limit scheduler wiring
+# ---------------------------------------------------------------------------
+
+
+def test_make_github_api_request_records_rate_limit_budget(monkeypatch):
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    reset = int(time.time()) + 3600
+    rate_headers = {"X-RateLimit-Remaining": "4321", "X-RateLimit-Reset": str(reset)}
+
+    def fake_get(url, headers, timeout):
+        return _ConditionalResponse(200, {}, rate_headers)
+
+    monkeypatch.setattr(api.requests, "get", fake_get)
+
+    api.make_github_api_request("/user")
+
+    assert api._rate_limit_scheduler.budget("core")["remaining"] == 4321
+
+
+def test_make_github_api_request_aborts_before_budget_runs_out(monkeypatch):
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    reset = int(time.time()) + 3600
+    api._rate_limit_scheduler.record(
+        "core", {"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": str(reset)}
+    )
+    calls = []
+    monkeypatch.setattr(api.requests, "get", lambda *_a, **_kw: calls.append(1) or None)
+
+    with pytest.raises(api.GitHubRateLimitError) as exc_info:
+        api.make_github_api_request("/user")
+
+    assert calls == []
+    assert exc_info.value.reset_time is not None
+
+
+def test_make_github_api_request_degrade_policy_fails_soft(monkeypatch):
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    api.configure_rate_limit_policy("degrade")
+    reset = int(time.time()) + 3600
+    api._rate_limit_scheduler.record(
+        "core", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)}
+    )
+    before = api.get_api_stats()["rate_limit_degraded"]
+
+    with pytest.raises(requests.exceptions.RequestException) as exc_info:
+        api.make_github_api_request("/repos/org/repo/pulls/1")
+
+    assert isinstance(exc_info.value, api.GitHubRateLimitBudgetExhausted)
+    assert exc_info.value.resource == "core"
+    assert api.get_api_stats()["rate_limit_degraded"] == before + 1
+
+
+def test_make_github_graphql_request_charges_graphql_budget(monkeypatch):
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    reset = int(time.time()) + 3600
+    api._rate_limit_scheduler.record(
+        "graphql", {"X-RateLimit-Remaining": "1", "X-RateLimit-Reset": str(reset)}
+    )
+
+    with pytest.raises(api.GitHubRateLimitError):
+        api.make_github_graphql_request("query { viewer { login } }")
+
+
+def test_configure_rate_limit_policy_rejects_unknown_policy():
+    with pytest.raises(ValueError):
+        api.configure_rate_limit_policy("panic")
+
+
+# ---------------------------------------------------------------------------
+# Adaptive concurrency wiring
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("status_code", "headers", "expected"),
+    [
+        (200, {}, False),
+        (404, {}, False),
+        (403, {}, False),
+        (403, {"Retry-After": "30"}, True),
+        (403, {"X-RateLimit-Remaining": "0"}, True),
+        (429, {}, True),
+        (502, {}, True),
+    ],
+)
+def test_is_congestion_signal(status_code, headers, expected):
+    response = _ConditionalResponse(status_code, headers=headers)
+
+    assert api._is_congestion_signal(response) is expected
+
+
+def test_is_congestion_signal_detects_secondary_rate_limit_body():
+    response = _ConditionalResponse(403, headers={"X-RateLimit-Remaining": "4999"})
+    response.text = "You have exceeded a secondary rate limit. Please wait."
+
+    assert api._is_congestion_signal(response) is True
+
+
+@pytest.mark.parametrize(
+    ("url", "family"),
+    [
+        ("https://api.github.com/repos/o/r/pulls", "pulls"),
+        ("https://api.github.com/repos/o/r/pulls/42", "pulls"),
+        ("https://api.github.com/repos/o/r/pulls/42/reviews", "pulls/reviews"),
+        (
+            "https://api.github.com/repos/o/r/commits/abc123/check-runs",
+            "commits/check-runs",
+        ),
+        (
+            "https://api.github.com/repos/o/r/branches/feature/x/protection",
+            "branches/protection",
+        ),
+        ("https://api.github.com/search/issues?q=x", "search/issues"),
+        ("https://api.github.com/user", "user"),
+    ],
+)
+def test_endpoint_family(url, family):
+    assert api._endpoint_family(url) == family
+
+
+def test_make_github_api_request_backs_off_concurrency_on_bad_gateway(
+    monkeypatch,
+):
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(api.time, "sleep", lambda _s: None)
+    api.configure_adaptive_concurrency(32)
+    responses = [_ConditionalResponse(502), _ConditionalResponse(200, {"ok": True})]
+
+    def fake_get(url, headers, timeout):
+        return responses.pop(0)
+
+    monkeypatch.setattr(api.requests, "get", fake_get)
+
+    assert api.make_github_api_request("/user") == {"ok": True}
+
+    stats = api.get_api_stats()
+    assert stats["concurrency_backoffs"] == 1
+    assert stats["concurrency_limit"] < 8
+
+
+# ---------------------------------------------------------------------------
+# Retry policy wiring
+# ---------------------------------------------------------------------------
+
+
+def test_make_github_api_request_retries_429_after_retry_after(monkeypatch):
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    slept = []
+    monkeypatch.setattr(api.time, "sleep", slept.append)
+    responses = [
+        _ConditionalResponse(429, headers={"Retry-After": "5"}),
+        _ConditionalResponse(200, {"ok": True}),
+    ]
+
+    def fake_get(url, headers, timeout):
+        return responses.pop(0)
+
+    monkeypatch.setattr(api.requests, "get", fake_get)
+
+    assert api.make_github_api_request("/user") == {"ok": True}
+    assert len(slept) == 1
+    assert 5 <= slept[0] <= 5 + api._RETRY_BASE_DELAY
+    assert api.get_api_stats()["retries"] == 1
+
+
+def test_make_github_graphql_request_retries_secondary_limit_403(monkeypatch):
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(api.time, "sleep", lambda _s: None)
+    responses = [
+        _ConditionalResponse(403, headers={"Retry-After": "1"}),
+        _ConditionalResponse(200, {"data": {"viewer": {"login": "me"}}}),
+    ]
+
+    def fake_post(url, json, headers, timeout):
+        return responses.pop(0)
+
+    monkeypatch.setattr(api.requests, "post", fake_post)
+
+    result = api.make_github_graphql_request("query { viewer { login } }")
+
+    assert result["data"]["viewer"]["login"] == "me"
+
+
+def test_make_github_api_request_stops_retrying_when_budget_is_spent(monkeypatch):
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(api.time, "sleep", lambda _s: None)
+    monkeypatch.setattr(api._retry_policy, "_tokens", 0.0)
+    calls = []
+
+    def fake_get(url, headers, timeout):
+        calls.append(url)
+        return _ConditionalResponse(502)
+
+    monkeypatch.setattr(api.requests, "get", fake_get)
+
+    api.make_github_api_request("/user")
+
+    assert len(calls) == 1
+    assert api.get_api_stats()["retries_refused"] == 1
+
+
+# ---------------------------------------------------------------------------
+# Request hedging wiring
+# ---------------------------------------------------------------------------
+
+
+def test_make_github_api_request_hedges_slow_get(monkeypatch):
+    import threading
+
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    api.configure_request_hedging(True, max_workers=2)
+    for _ in range(api._HEDGE_MIN_SAMPLES):
+        api._hedger.observe(0.01)
+    # Allow the hedge under the traffic cap.
+    monkeypatch.setattr(api._hedger, "_requests", 100)
+    release = threading.Event()
+    calls = []
+
+    def fake_get(url, headers, timeout):
+        calls.append(url)
+        if len(calls) == 1:
+            release.wait(2)
+            return _ConditionalResponse(200, {"copy": "primary"})
+        return _ConditionalResponse(200, {"copy": "hedge"})
+
+    monkeypatch.setattr(api.requests, "get", fake_get)
+
+    assert api.make_github_api_request("/repos/org/repo/pulls/1") == {"copy": "hedge"}
+    release.set()
+
+    stats = api.get_api_stats()
+    assert stats["hedges_sent"] == 1
+    assert stats["hedges_won"] == 1
+
+
+def test_get_api_stats_reports_zero_hedges_when_disabled():
+    stats = api.get_api_stats()
+
+    assert stats["hedges_sent"] == 0
+    assert stats["hedges_won"] == 0
+
+
+def test_concurrent_identical_rest_requests_share_one_call(monkeypatch):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    release = threading.Event()
+    calls = []
+    before = api.get_api_stats()["deduplicated_calls"]
+
+    def fake_get(url, headers, timeout):
+        calls.append(url)
+        release.wait(2)
+        return _ConditionalResponse(200, {"required_approving_review_count": 2})
+
+    monkeypatch.setattr(api.requests, "get", fake_get)
+    path = "/repos/org/repo/branches/main/protection/required_pull_request_reviews"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(api.make_github_api_request, path) for _ in range(4)]
+        while api._single_flight.shared - before < 3:
+            time.sleep(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert results == [{"required_approving_review_count": 2}] * 4
+    assert api.get_api_stats()["deduplicated_calls"] - before == 3
+
+
+def test_graphql_single_flight_key_includes_variables(monkeypatch):
+    keys = []
+
+    def fake_do(key, fn, *args, timeout=None):
+        keys.append(key)
+        return {}
+
+    monkeypatch.setattr(api._single_flight, "do", fake_do)
+
+    api.make_github_graphql_request("query", {"b": 1, "a": 2})
+    api.make_github_graphql_request("query", {"a": 2, "b": 1})
+    api.make_github_graphql_request("query", {"a": 3})
+
+    assert keys[0] == keys[1]
+    assert keys[0] != keys[2]
+
+
+# ---------------------------------------------------------------------------
+# Deadline
+# ---------------------------------------------------------------------------
+
+
+def test_deadline_caps_request_timeouts(monkeypatch):
+    timeouts = []
+
+    def fake_get(url, headers, timeout):
+        timeouts.append(timeout)
+        return _ConditionalResponse(200, {"ok": True})
+
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(api.requests, "get", fake_get)
+    api.configure_deadline(2)
+
+    assert api.make_github_api_request("/repos/org/repo") == {"ok": True}
+    connect, read = timeouts[0]
+    assert 0 < connect <= 2
+    assert 0 < read <= 2
+
+
+def test_no_requests_start_after_deadline(monkeypatch):
+    calls = []
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(
+        api.requests, "get", lambda url, headers, timeout: calls.append(url)
+    )
+    monkeypatch.setattr(
+        api.requests, "post", lambda url, json, headers, timeout: calls.append(url)
+    )
+    api.configure_deadline(1)
+    monkeypatch.setattr(api, "_deadline_at", time.monotonic() - 1)
+
+    with pytest.raises(api.GitHubDeadlineExceeded):
+        api.make_github_api_request("/repos/org/repo")
+    with pytest.raises(api.GitHubDeadlineExceeded):
+        api.make_github_graphql_request("query { viewer { login } }")
+    assert calls == []
+
+
+def test_retry_is_skipped_when_its_delay_outlasts_deadline(monkeypatch):
+    calls = []
+    sleeps = []
+
+    def fake_get(url, headers, timeout):
+        calls.append(url)
+        return _ConditionalResponse(503, {}, {"Retry-After": "10"})
+
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(api.requests, "get", fake_get)
+    monkeypatch.setattr(api.time, "sleep", sleeps.append)
+    api.configure_deadline(5)
+
+    with pytest.raises(api.GitHubDeadlineExceeded):
+        api.make_github_api_request("/repos/org/repo")
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_rate_limit_wait_past_deadline_raises_without_sleeping(monkeypatch):
+    calls = []
+    sleeps = []
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(
+        api.requests, "get", lambda url, headers, timeout: calls.append(url)
+    )
+    monkeypatch.setattr(api._rate_limit_scheduler, "_sleep", sleeps.append)
+    api.configure_rate_limit_policy("wait")
+    api._rate_limit_scheduler.record(
+        "core",
+        {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 600),
+        },
+    )
+    api.configure_deadline(5)
+
+    with pytest.raises(api.GitHubDeadlineExceeded):
+        api.make_github_api_request("/repos/org/repo")
+    assert calls == []
+    assert sleeps == []
+
+
+def test_request_timeout_is_recomputed_after_rate_limit_wait(monkeypatch):
+    timeouts = []
+
+    def fake_get(url, headers, timeout):
+        timeouts.append(timeout)
+        return _ConditionalResponse(200, {"ok": True})
+
+    def fake_acquire(resource, timeout=None):
+        # Stands in for a pacing sleep that uses most of the deadline.
+        monkeypatch.setattr(api, "_deadline_at", time.monotonic() + 0.5)
+
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(api.requests, "get", fake_get)
+    monkeypatch.setattr(api._rate_limit_scheduler, "acquire", fake_acquire)
+    api.configure_deadline(30)
+
+    api.make_github_api_request("/repos/org/repo")
+
+    assert all(limit <= 0.5 for limit in timeouts[0])
+
+
+def test_concurrency_slot_wait_past_deadline_raises(monkeypatch):
+    calls = []
+    monkeypatch.setattr(api, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(
+        api.requests, "get", lambda url, headers, timeout: calls.append(url)
+    )
+    api.configure_adaptive_concurrency(1)
+    api._concurrency_limiter.acquire()
+    api.configure_deadline(0.05)
+
+    with pytest.raises(api.GitHubDeadlineExceeded):
+        api.make_github_api_request("/repos/org/repo")
+    assert calls == []
+
+
+def test_single_flight_joiner_wait_past_deadline_raises(monkeypatch):
+    def fake_do(key, fn, *args, timeout=None):
+        assert timeout is not None and timeout <= 5
+        raise TimeoutError("still in flight")
+
+    monkeypatch.setattr(api._single_flight, "do", fake_do)
+    api.configure_deadline(5)
+
+    with pytest.raises(api.GitHubDeadlineExceeded):
+        api.make_github_api_request("/repos/org/repo")
+
+
+def test_deadline_remaining_is_none_without_deadline():
+    assert api.deadline_remaining() is None
+
+
+# ---------------------------------------------------------------------------
+# Streaming discovery
+# ---------------------------------------------------------------------------
+
+
+def _repository_page(repos, cursor, has_next):
+    return {
+        "data": {
+            "repositoryOwner": {
+                "repositories": {
+                    "nodes": [
+                        {
+                            "name": name,
+                            "pullRequests": {"nodes": [{"url": url} for url in urls]},
+                        }
+                        for name, urls in repos
+                    ],
+                    "pageInfo": {"endCursor": cursor, "hasNextPage": has_next},
+                }
+            }
+        }
+    }
+
+
+def test_discovery_sink_receives_each_page_before_discovery_finishes(monkeypatch):
+    pages = iter(
+        [
+            _repository_page([("app", ["u1", "u2"]), ("skip", ["u3"])], "c1", True),
+            _repository_page([("app-two", ["u4"])], "c2", False),
+        ]
+    )
+    events = []
+
+    def fake_graphql_request(_query, _variables):
+        events.append("page")
+        return next(pages)
+
+    monkeypatch.setattr(api, "make_github_graphql_request", fake_graphql_request)
+    monkeypatch.setattr(api, "BREAKFAST_ITEMS", ["*"])
+
+    with api.discovery_sink(lambda urls: events.append(urls)):
+        prs = api.get_github_prs("org", ["app*"])
+
+    assert prs == ["u1", "u2", "u4"]
+    assert events == ["page", ["u1", "u2"], "page", ["u4"]]
+
+
+def test_discovery_sink_is_removed_after_the_block(monkeypatch):
+    monkeypatch.setattr(
+        api,
+        "make_github_graphql_request",
+        lambda _q, _v: _repository_page([("app", ["u1"])], None, False),
+    )
+    seen = []
+
+    with api.discovery_sink(seen.extend):
+        pass
+    api.get_github_prs("org", [])
+
+    assert seen == []
+
+
+def test_search_github_prs_streams_matching_results(monkeypatch):
+    response = {
+        "data": {
+            "search": {
+                "issueCount": 2,
+                "nodes": [
+                    {"url": "u1", "updatedAt": "t1", "repository": {"name": "app"}},
+                    {"url": "u2", "updatedAt": "t2", "repository": {"name": "lib"}},
+                ],
+                "pageInfo": {"endCursor": None, "hasNextPage": False},
+            }
+        }
+    }
+    monkeypatch.setattr(api, "make_github_graphql_request", lambda _q, _v: response)
+    seen = []
+
+    with api.discovery_sink(seen.extend):
+        updates = api.search_github_prs("org", ["app"])
+
+    assert updates == {"u1": "t1"}
+    assert seen == ["u1"]
+
+
+def test_send_limited_keys_latency_by_endpoint_family_and_304():
+    api.configure_adaptive_concurrency(4)
+    limiter = api._concurrency_limiter
+
+    api._send_limited(
+        "rest",
+        lambda url: _ConditionalResponse(200),
+        "https://api.github.com/repos/o/r/pulls/1",
+    )
+    api._send_limited(
+        "rest",
+        lambda url: _ConditionalResponse(304),
+        "https://api.github.com/repos/o/r/pulls/2",
+    )
+
+    assert set(limiter._baseline) == {"rest:pulls", "rest:pulls:304"}
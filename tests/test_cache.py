@@ -1,4 +1,8 @@
 import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -103,6 +107,14 @@ def test_make_cache_key_differs_by_input():
 # ---------------------------------------------------------------------------
 
 
+def _backdate_pr_set(kind, org, scope, fetched_at):
+    """Rewrite the fetched_at of a cached PR set ("result" or "repo") in the store."""
+    cache._connect().execute(
+        "UPDATE pr_sets SET fetched_at = ? WHERE kind = ? AND owner = ? AND scope = ?",
+        (fetched_at, kind, org.lower(), scope.lower()),
+    )
+
+
 def test_read_pr_cache_miss_no_file(monkeypatch, tmp_path):
     monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
     assert cache.read_pr_cache("org", "filter", 300) is None
@@ -147,11 +159,8 @@ def test_read_pr_cache_expired(monkeypatch, tmp_path):
     cache.write_pr_cache("org", "filter", pr_details)
 
     # Manually backdate the fetched_at timestamp
-    path = cache.cache_path("org", "filter")
-    data = json.loads(path.read_text())
     old_time = (datetime.now(timezone.utc) - timedelta(seconds=600)).isoformat()
-    data["fetched_at"] = old_time
-    path.write_text(json.dumps(data))
+    _backdate_pr_set("result", "org", "filter", old_time)
 
     assert cache.read_pr_cache("org", "filter", 300) is None
 
@@ -165,19 +174,20 @@ def test_read_pr_cache_not_expired(monkeypatch, tmp_path):
     assert result["prs"] == pr_details
 
 
-def test_read_pr_cache_corrupt_json(monkeypatch, tmp_path):
+def test_read_pr_cache_corrupt_store_is_reset(monkeypatch, tmp_path):
     monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
     tmp_path.mkdir(parents=True, exist_ok=True)
-    path = cache.cache_path("org", "filter")
-    path.write_text("not json at all {{")
+    cache.store_path().write_text("not json at all {{")
     assert cache.read_pr_cache("org", "filter", 300) is None
+    # The unreadable file was replaced, so the cache works again.
+    cache.write_pr_cache("org", "filter", [{"number": 1}])
+    assert cache.read_pr_cache("org", "filter", 300)["prs"] == [{"number": 1}]
 
 
-def test_read_pr_cache_missing_keys(monkeypatch, tmp_path):
+def test_read_pr_cache_corrupt_row(monkeypatch, tmp_path):
     monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
-    tmp_path.mkdir(parents=True, exist_ok=True)
-    path = cache.cache_path("org", "filter")
-    path.write_text(json.dumps({"fetched_at": datetime.now(timezone.utc).isoformat()}))
+    cache.write_pr_cache("org", "filter", [{"number": 1}])
+    cache._connect().execute("UPDATE pr_objects SET body = 'not json at all {{'")
     assert cache.read_pr_cache("org", "filter", 300) is None
 
 
@@ -188,22 +198,55 @@ def test_write_pr_cache_creates_directory(monkeypatch, tmp_path):
     assert nested.exists()
 
 
-def test_write_pr_cache_is_atomic_no_lingering_tmp(monkeypatch, tmp_path):
-    """Atomic write: no .tmp file should remain after a successful write."""
+def test_write_pr_cache_overwrites_rows_in_place(monkeypatch, tmp_path):
+    """A shorter rewrite leaves no rows from the previous contents behind."""
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_pr_cache(
+        "org",
+        "filter",
+        [{"id": 1}, {"id": 2}],
+        check_statuses={1: "pass", 2: "fail"},
+        approval_statuses={1: "approved", 2: "needs_review"},
+    )
+    cache.write_pr_cache(
+        "org",
+        "filter",
+        [{"id": 2}],
+        check_statuses={2: "pass"},
+        approval_statuses={2: "approved"},
+    )
+    result = cache.read_pr_cache("org", "filter", 300)
+    assert result["prs"] == [{"id": 2}]
+    assert result["check_statuses"] == {2: "pass"}
+    assert result["approval_statuses"] == {2: "approved"}
+    assert result["approval_details"] is None
+
+
+def test_cache_keys_are_case_insensitive(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_pr_cache("Org", "Filter", [{"number": 1}])
+    cache.write_graphql_cache("Org", "Filter", ["https://example.com/pr/1"])
+    assert cache.read_pr_cache("org", "filter", 300)["prs"] == [{"number": 1}]
+    assert cache.read_graphql_cache("ORG", "FILTER", 300) == [
+        "https://example.com/pr/1"
+    ]
+
+
+def test_store_uses_wal_journal(monkeypatch, tmp_path):
     monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
     cache.write_pr_cache("org", "filter", [{"number": 1}])
-    leftovers = list(tmp_path.glob("*.tmp"))
-    assert leftovers == []
-    # The real cache file should be present and valid JSON.
-    assert cache.cache_path("org", "filter").exists()
+    mode = cache._connect().execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
 
 
-def test_write_graphql_cache_is_atomic_no_lingering_tmp(monkeypatch, tmp_path):
+def test_store_reads_from_other_threads(monkeypatch, tmp_path):
     monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
-    cache.write_graphql_cache("org", "filter", ["https://example.com/pr/1"])
-    leftovers = list(tmp_path.glob("*.tmp"))
-    assert leftovers == []
-    assert cache.graphql_cache_path("org", "filter").exists()
+    cache.write_pr_cache("org", "filter", [{"number": 1}])
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(
+            pool.map(lambda _: cache.read_pr_cache("org", "filter", 300), range(8))
+        )
+    assert all(r["prs"] == [{"number": 1}] for r in results)
 
 
 def test_write_pr_cache_silent_on_failure(monkeypatch, tmp_path):
@@ -256,24 +299,22 @@ def test_graphql_cache_expired(tmp_path, monkeypatch):
     urls = ["https://api.github.com/repos/org/repo/pulls/1"]
     cache.write_graphql_cache("org", "filter", urls)
     # Manually backdate the fetched_at timestamp
-    path = cache.graphql_cache_path("org", "filter")
-    data = json.loads(path.read_text())
     old_time = (datetime.now(timezone.utc) - timedelta(seconds=400)).isoformat()
-    data["fetched_at"] = old_time
-    path.write_text(json.dumps(data))
+    cache._connect().execute("UPDATE url_lists SET fetched_at = ?", (old_time,))
     assert cache.read_graphql_cache("org", "filter", 300) is None
 
 
-def test_graphql_cache_corrupt_json(tmp_path, monkeypatch):
+def test_graphql_cache_corrupt_store(tmp_path, monkeypatch):
     monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
-    cache.graphql_cache_path("org", "filter").parent.mkdir(parents=True, exist_ok=True)
-    cache.graphql_cache_path("org", "filter").write_text("}{ bad json")
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    cache.store_path().write_text("}{ bad json")
     assert cache.read_graphql_cache("org", "filter", 300) is None
 
 
-def test_graphql_cache_uses_separate_file(tmp_path, monkeypatch):
+def test_graphql_cache_is_separate_from_pr_cache(tmp_path, monkeypatch):
     monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
-    assert cache.graphql_cache_path("org", "f") != cache.cache_path("org", "f")
+    cache.write_graphql_cache("org", "f", ["url1"])
+    assert cache.read_pr_cache("org", "f", 300) is None
 
 
 # ---------------------------------------------------------------------------
@@ -284,8 +325,8 @@ def test_graphql_cache_uses_separate_file(tmp_path, monkeypatch):
 def test_read_graphql_cache_corrupt_warns_to_stderr(tmp_path, monkeypatch):
     """Corrupt GraphQL cache emits warning via click.echo(err=True)."""
     monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
-    cache.graphql_cache_path("org", "f").parent.mkdir(parents=True, exist_ok=True)
-    cache.graphql_cache_path("org", "f").write_text("}{ bad json")
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    cache.store_path().write_text("}{ bad json")
 
     echo_calls = []
     monkeypatch.setattr(
@@ -324,8 +365,8 @@ def test_write_graphql_cache_failure_warns_to_stderr(tmp_path, monkeypatch):
 def test_read_pr_cache_corrupt_warns_to_stderr(tmp_path, monkeypatch):
     """Corrupt PR cache emits warning via click.echo(err=True)."""
     monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
-    cache.cache_path("org", "f").parent.mkdir(parents=True, exist_ok=True)
-    cache.cache_path("org", "f").write_text("}{ bad json")
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    cache.store_path().write_text("}{ bad json")
 
     echo_calls = []
     monkeypatch.setattr(
@@ -407,11 +448,8 @@ def test_read_repo_pr_cache_miss_no_file(monkeypatch, tmp_path):
 def test_read_repo_pr_cache_expired(monkeypatch, tmp_path):
     monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
     cache.write_repo_pr_cache("myorg", "myrepo", [{"number": 1}])
-    path = cache.repo_pr_cache_path("myorg", "myrepo")
-    data = json.loads(path.read_text())
     old_time = (datetime.now(timezone.utc) - timedelta(seconds=600)).isoformat()
-    data["fetched_at"] = old_time
-    path.write_text(json.dumps(data))
+    _backdate_pr_set("repo", "myorg", "myrepo", old_time)
     assert cache.read_repo_pr_cache("myorg", "myrepo", 300) is None
 
 
@@ -424,12 +462,47 @@ def test_read_repo_pr_cache_not_expired(monkeypatch, tmp_path):
 
 def test_repo_pr_cache_key_differs_from_whole_blob_key(tmp_path, monkeypatch):
     monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
-    # repo_pr_cache_path uses (org, repo_name), not (org, repo_filter)
-    p1 = cache.repo_pr_cache_path("org", "my-repo")
-    p2 = cache.cache_path("org", "my-repo")
-    assert p1 != p2
-    assert p1.name.startswith("pr_repo_")
-    assert p2.name.startswith("prs_")
+    # The per-repo entry for "my-repo" is not the full entry for filter "my-repo"
+    cache.write_repo_pr_cache("org", "my-repo", [{"number": 1}])
+    cache.write_pr_cache("org", "my-repo", [{"number": 2}])
+    assert cache.read_repo_pr_cache("org", "my-repo", 300)["prs"] == [{"number": 1}]
+    assert cache.read_pr_cache("org", "my-repo", 300)["prs"] == [{"number": 2}]
+
+
+def test_write_repo_pr_caches_writes_all_repos(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_repo_pr_caches(
+        {
+            ("org", "a"): {"prs": [{"id": 1}], "check_statuses": {1: "pass"}},
+            ("org", "b"): {"prs": [{"id": 2}]},
+        }
+    )
+    assert cache.read_repo_pr_cache("org", "a", 300)["check_statuses"] == {1: "pass"}
+    assert cache.read_repo_pr_cache("org", "b", 300)["prs"] == [{"id": 2}]
+    assert cache.read_repo_pr_cache("org", "b", 300)["check_statuses"] is None
+
+
+def test_write_repo_pr_caches_is_all_or_nothing(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_repo_pr_cache("org", "a", [{"id": 1}])
+    original_put = cache._put_pr_set
+
+    def failing_put(conn, kind, owner, scope, *args):
+        if scope == "b":
+            raise sqlite3.OperationalError("disk I/O error")
+        return original_put(conn, kind, owner, scope, *args)
+
+    monkeypatch.setattr(cache, "_put_pr_set", failing_put)
+    # The second entry cannot be written, so the first is rolled back too.
+    cache.write_repo_pr_caches(
+        {
+            ("org", "a"): {"prs": [{"id": 10}]},
+            ("org", "b"): {"prs": [{"id": 2}]},
+        }
+    )
+    monkeypatch.setattr(cache, "_put_pr_set", original_put)
+    assert cache.read_repo_pr_cache("org", "a", 300)["prs"] == [{"id": 1}]
+    assert cache.read_repo_pr_cache("org", "b", 300) is None
 
 
 def test_read_pr_cache_expired_but_ignored(monkeypatch, tmp_path):
@@ -438,11 +511,8 @@ def test_read_pr_cache_expired_but_ignored(monkeypatch, tmp_path):
     cache.write_pr_cache("org", "filter", pr_details)
 
     # Manually backdate the fetched_at timestamp
-    path = cache.cache_path("org", "filter")
-    data = json.loads(path.read_text())
     old_time = (datetime.now(timezone.utc) - timedelta(seconds=600)).isoformat()
-    data["fetched_at"] = old_time
-    path.write_text(json.dumps(data))
+    _backdate_pr_set("result", "org", "filter", old_time)
 
     # Should miss normally
     assert cache.read_pr_cache("org", "filter", 300) is None
@@ -480,3 +550,422 @@ def test_write_cached_user_login_overwrites(monkeypatch, tmp_path):
     cache.write_cached_user_login("alice")
     cache.write_cached_user_login("bob")
     assert cache.read_cached_user_login() == "bob"
+
+
+# ---------------------------------------------------------------------------
+# conditional request store
+# ---------------------------------------------------------------------------
+
+
+def test_write_and_read_conditional_entry(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_conditional_entry(
+        "/repos/org/repo/pulls/1", '"abc"', "Tue, 01 Sep 2026 10:00:00 GMT", {"n": 1}
+    )
+    assert cache.read_conditional_entry("/repos/org/repo/pulls/1") == {
+        "etag": '"abc"',
+        "last_modified": "Tue, 01 Sep 2026 10:00:00 GMT",
+        "body": {"n": 1},
+    }
+    assert cache.read_conditional_entry("/repos/org/repo/pulls/2") is None
+
+
+def test_conditional_entries_are_keyed_by_scope(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_conditional_entry(
+        "/repos/org/private", '"abc"', None, {"secret": 1}, scope="token-a"
+    )
+    assert cache.read_conditional_entry("/repos/org/private", "token-a") is not None
+    assert cache.read_conditional_entry("/repos/org/private", "token-b") is None
+    assert cache.read_conditional_entry("/repos/org/private") is None
+
+
+def test_prune_conditional_cache_removes_unused_entries(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_conditional_entry("/repos/org/old", '"a"', None, {"n": 1})
+    cache.write_conditional_entry("/repos/org/used", '"b"', None, {"n": 2})
+    cache.write_conditional_entry("/repos/org/new", '"c"', None, {"n": 3})
+    stale = time.time() - 3600
+    for request_path in ("/repos/org/old", "/repos/org/used"):
+        path = cache.conditional_cache_path(request_path)
+        os.utime(path, (stale, stale))
+    # A hit counts as use, so the entry survives the prune.
+    assert cache.read_conditional_entry("/repos/org/used") is not None
+
+    assert cache.prune_conditional_cache(600) == 1
+    assert cache.read_conditional_entry("/repos/org/old") is None
+    assert cache.read_conditional_entry("/repos/org/used") is not None
+    assert cache.read_conditional_entry("/repos/org/new") is not None
+
+
+def test_read_conditional_entry_requires_a_validator(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_conditional_entry("/repos/org/repo", None, None, {"n": 1})
+    assert cache.read_conditional_entry("/repos/org/repo") is None
+
+
+def test_read_conditional_entry_returns_none_on_corrupt_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.conditional_cache_path("/repos/org/repo").write_text("not json{{")
+    assert cache.read_conditional_entry("/repos/org/repo") is None
+
+
+# ---------------------------------------------------------------------------
+# branch protection store
+# ---------------------------------------------------------------------------
+
+
+def test_write_and_read_protection_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_protection_cache("Org", "repo", "main", 2)
+    assert cache.read_protection_cache("org", "repo", "main", 60) == {"required": 2}
+    assert cache.read_protection_cache("org", "repo", "develop", 60) is None
+
+
+def test_protection_cache_is_keyed_by_scope(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_protection_cache("org", "repo", "main", None, "token-a")
+    assert cache.read_protection_cache("org", "repo", "main", 60, "token-a") == {
+        "required": None
+    }
+    assert cache.read_protection_cache("org", "repo", "main", 60, "token-b") is None
+
+
+def test_protection_cache_stores_negative_results(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_protection_cache("org", "repo", "main", None)
+    assert cache.read_protection_cache("org", "repo", "main", 60) == {"required": None}
+
+
+def test_read_protection_cache_expires_after_ttl(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_protection_cache("org", "repo", "main", 2)
+    path = cache.protection_cache_path("org", "repo", "main")
+    data = json.loads(path.read_text())
+    data["fetched_at"] = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+    path.write_text(json.dumps(data))
+    assert cache.read_protection_cache("org", "repo", "main", 3600) is None
+
+
+def test_read_protection_cache_returns_none_on_corrupt_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.protection_cache_path("org", "repo", "main").write_text("not json{{")
+    assert cache.read_protection_cache("org", "repo", "main", 60) is None
+
+
+# ---------------------------------------------------------------------------
+# per-commit check store
+# ---------------------------------------------------------------------------
+
+
+def _age_check_entry(owner, repo, sha, hours):
+    cache._connect().execute(
+        "UPDATE commit_checks SET fetched_at = ?"
+        " WHERE owner = ? AND repo = ? AND sha = ?",
+        (
+            (datetime.now(timezone.utc) - timedelta(hours=hours)).isoformat(),
+            owner,
+            repo,
+            sha,
+        ),
+    )
+
+
+def test_passed_check_results_never_expire(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_check_cache("org", "repo", "abc", "pass")
+    _age_check_entry("org", "repo", "abc", hours=24 * 365)
+    assert cache.read_check_cache("org", "repo", "abc", 60) == "pass"
+
+
+def test_failed_check_results_expire_after_fail_ttl(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_check_cache("org", "repo", "abc", "fail")
+    _age_check_entry("org", "repo", "abc", hours=1)
+    # Older than the pending TTL, still within the failure TTL.
+    assert cache.read_check_cache("org", "repo", "abc", 60, fail_ttl=7200) == "fail"
+    assert cache.read_check_cache("org", "repo", "abc", 60, fail_ttl=1800) is None
+
+
+@pytest.mark.parametrize("status", ["pending", "none"])
+def test_unsettled_check_results_expire(monkeypatch, tmp_path, status):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_check_cache("org", "repo", "abc", status)
+    assert cache.read_check_cache("org", "repo", "abc", 60) == status
+    _age_check_entry("org", "repo", "abc", hours=1)
+    assert cache.read_check_cache("org", "repo", "abc", 60) is None
+
+
+def test_check_cache_is_keyed_by_commit(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_check_cache("org", "repo", "abc", "pass")
+    assert cache.read_check_cache("org", "repo", "def", 60) is None
+    assert cache.read_check_cache("org", "other", "abc", 60) is None
+
+
+def test_read_repo_pr_cache_ignore_ttl_returns_expired(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_repo_pr_cache("org", "repo", [{"id": 1}])
+    _backdate_pr_set(
+        "repo",
+        "org",
+        "repo",
+        (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat(),
+    )
+
+    assert cache.read_repo_pr_cache("org", "repo", 300) is None
+    assert cache.read_repo_pr_cache("org", "repo", 300, ignore_ttl=True)["prs"] == [
+        {"id": 1}
+    ]
+
+
+# ---------------------------------------------------------------------------
+# migration from the per-key JSON files
+# ---------------------------------------------------------------------------
+
+
+def test_legacy_json_caches_are_migrated_into_store(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    now = datetime.now(timezone.utc).isoformat()
+    legacy = {
+        "prs_aaaa.json": {
+            "fetched_at": now,
+            "organization": "Org",
+            "repo_filter": "filter",
+            "prs": [{"id": 1}],
+            "check_statuses": {"1": "pass"},
+            "approval_details": {"1": {"status": "approved"}},
+        },
+        "pr_repo_bbbb.json": {
+            "fetched_at": now,
+            "organization": "org",
+            "repo": "repo",
+            "prs": [{"id": 2}],
+        },
+        "graphql_cccc.json": {
+            "fetched_at": now,
+            "organization": "org",
+            "repo_filter": "filter",
+            "urls": ["https://example.com/pr/1"],
+        },
+        "checks_dddd.json": {
+            "fetched_at": now,
+            "owner": "org",
+            "repo": "repo",
+            "sha": "abc",
+            "status": "pass",
+        },
+    }
+    for name, payload in legacy.items():
+        (tmp_path / name).write_text(json.dumps(payload))
+    (tmp_path / "prs_eeee.json").write_text("not json{{")
+
+    result = cache.read_pr_cache("org", "filter", 300)
+    assert result["prs"] == [{"id": 1}]
+    assert result["fetched_at"] == now
+    assert result["check_statuses"] == {1: "pass"}
+    assert result["approval_statuses"] is None
+    assert result["approval_details"] == {1: {"status": "approved"}}
+    assert cache.read_repo_pr_cache("org", "repo", 300)["prs"] == [{"id": 2}]
+    assert cache.read_graphql_cache("org", "filter", 300) == [
+        "https://example.com/pr/1"
+    ]
+    assert cache.read_check_cache("org", "repo", "abc", 60) == "pass"
+    assert list(tmp_path.glob("*.json")) == []
+
+
+def test_legacy_json_migration_runs_once(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_pr_cache("org", "filter", [{"id": 1}])
+    cache.close_store()
+    (tmp_path / "prs_aaaa.json").write_text(
+        json.dumps(
+            {
+                "fetched_at": datetime.now(timezone.utc).isoformat(),
+                "organization": "org",
+                "repo_filter": "filter",
+                "prs": [{"id": 99}],
+            }
+        )
+    )
+    assert cache.read_pr_cache("org", "filter", 300)["prs"] == [{"id": 1}]
+    assert (tmp_path / "prs_aaaa.json").exists()
+
+
+# ---------------------------------------------------------------------------
+# per-PR entries
+# ---------------------------------------------------------------------------
+
+
+def test_write_then_read_pr_entries(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    url = "https://github.com/Org/repo/pull/1"
+    detail = {"status": "approved", "current": 1, "required": 1}
+    cache.write_pr_entries(
+        {url: {"pr": {"id": 1}, "check_status": "pass", "approval_detail": detail}}
+    )
+    entries = cache.read_pr_entries([url, "https://github.com/org/repo/pull/2"], 300)
+    assert list(entries) == [url]
+    assert entries[url]["pr"] == {"id": 1}
+    assert entries[url]["check_status"] == "pass"
+    assert entries[url]["approval_detail"] == detail
+
+
+def test_read_pr_entries_skips_expired_unless_ignored(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    url = "https://github.com/org/repo/pull/1"
+    cache.write_pr_entries({url: {"pr": {"id": 1}}})
+    old_time = (datetime.now(timezone.utc) - timedelta(seconds=600)).isoformat()
+    cache._connect().execute("UPDATE pr_entries SET fetched_at = ?", (old_time,))
+    assert cache.read_pr_entries([url], 300) == {}
+    assert cache.read_pr_entries([url], 300, ignore_ttl=True)[url]["pr"] == {"id": 1}
+
+
+def test_write_pr_entries_drops_vanished_prs_per_repo(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    url = "https://github.com/org/{}/pull/{}".format
+    cache.write_pr_entries(
+        {
+            url("a", 1): {"pr": {"id": 1}},
+            url("a", 2): {"pr": {"id": 2}},
+            url("b", 3): {"pr": {"id": 3}},
+        }
+    )
+    cache.write_pr_entries({}, vanished_from={("org", "a"): [url("a", 1)]})
+    remaining = cache.read_pr_entries([url("a", 1), url("a", 2), url("b", 3)], 300)
+    assert set(remaining) == {url("a", 1), url("b", 3)}
+
+
+def test_write_pr_entries_prunes_expired_entries_and_objects(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    gone = "https://github.com/org/emptied/pull/1"
+    kept = "https://github.com/org/repo/pull/2"
+    cache.write_pr_entries({gone: {"pr": {"id": 1}}})
+    old_time = (datetime.now(timezone.utc) - timedelta(seconds=2000)).isoformat()
+    cache._connect().execute("UPDATE pr_entries SET fetched_at = ?", (old_time,))
+
+    # The repo of ``gone`` no longer lists any PRs, so nothing names it.
+    cache.write_pr_entries({kept: {"pr": {"id": 2}}}, max_age=1200)
+
+    assert list(cache.read_pr_entries([gone, kept], 0, ignore_ttl=True)) == [kept]
+    pr_ids = [
+        row[0] for row in cache._connect().execute("SELECT pr_id FROM pr_objects")
+    ]
+    assert pr_ids == [2]
+
+
+# ---------------------------------------------------------------------------
+# coverage and schema upgrades
+# ---------------------------------------------------------------------------
+
+
+def test_pr_cache_records_coverage(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    coverage = {"orgs": {"org": []}, "exclude_repos": [], "fetch_state": "all"}
+    cache.write_pr_cache("org", "", [{"id": 1}], coverage=coverage)
+    cache.write_pr_cache("org", "api", [{"id": 1}])
+    assert cache.read_pr_cache("org", "", 300)["coverage"] == coverage
+    assert cache.read_pr_cache("org", "api", 300)["coverage"] is None
+    assert cache.list_pr_cache_coverage(300) == [
+        {"org": "org", "repo_filter": "", "coverage": coverage}
+    ]
+    _backdate_pr_set(
+        "result",
+        "org",
+        "",
+        (datetime.now(timezone.utc) - timedelta(seconds=600)).isoformat(),
+    )
+    assert cache.list_pr_cache_coverage(300) == []
+
+
+def _pr_object_count():
+    return cache._connect().execute("SELECT COUNT(*) FROM pr_objects").fetchone()[0]
+
+
+def test_pr_body_is_stored_once_across_layers(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    pr = {"id": 1, "updated_at": "2024-01-01T00:00:00Z", "title": "Fix"}
+    cache.write_pr_cache("org", "", [pr])
+    cache.write_repo_pr_cache("org", "api", [pr])
+    cache.write_pr_entries({"https://github.com/org/api/pull/1": {"pr": pr}})
+    assert _pr_object_count() == 1
+    assert cache.read_pr_cache("org", "", 300)["prs"] == [pr]
+    assert cache.read_repo_pr_cache("org", "api", 300)["prs"] == [pr]
+    entries = cache.read_pr_entries(["https://github.com/org/api/pull/1"], 300)
+    assert entries["https://github.com/org/api/pull/1"]["pr"] == pr
+
+
+def test_write_skips_bodies_already_stored(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    pr = {"id": 1, "updated_at": "2024-01-01T00:00:00Z"}
+    cache.write_pr_cache("org", "", [pr])
+    rowid = cache._connect().execute("SELECT rowid FROM pr_objects").fetchone()
+    cache.write_pr_cache("org", "", [pr])
+    assert cache._connect().execute("SELECT rowid FROM pr_objects").fetchall() == [
+        rowid
+    ]
+
+
+def test_unreferenced_pr_bodies_are_dropped(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    old = {"id": 1, "updated_at": "2024-01-01T00:00:00Z"}
+    new = {"id": 1, "updated_at": "2024-01-02T00:00:00Z"}
+    cache.write_pr_cache("org", "", [old])
+    cache.write_repo_pr_cache("org", "api", [old])
+    cache.write_pr_cache("org", "", [new])
+    # The repo set still references the old revision.
+    assert _pr_object_count() == 2
+    cache.write_repo_pr_cache("org", "api", [new])
+    assert _pr_object_count() == 1
+
+
+def test_missing_pr_body_is_a_cache_miss(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_pr_cache("org", "", [{"id": 1}])
+    cache._connect().execute("DELETE FROM pr_objects")
+    assert cache.read_pr_cache("org", "", 300) is None
+
+
+def test_project_pr_detail_keeps_listed_fields_only():
+    pr = {
+        "id": 1,
+        "body": "text",
+        "labels": [{"name": "bug", "color": "d73a4a", "url": "https://x/bug"}],
+        "requested_teams": [],
+        "user": None,
+    }
+    assert cache.project_pr_detail(pr) == {
+        "id": 1,
+        "labels": [{"name": "bug", "color": "d73a4a"}],
+        "requested_teams": [],
+        "user": None,
+    }
+
+
+def test_pr_bodies_are_projected_on_write(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_pr_cache("org", "", [{"id": 1, "body": "text"}])
+    assert cache.read_pr_cache("org", "", 300)["prs"] == [{"id": 1}]
+
+
+def _set_pr_detail_schema(value):
+    cache._connect().execute(
+        "UPDATE meta SET value = ? WHERE key = 'pr_detail_schema'", (value,)
+    )
+    cache.close_store()
+
+
+def test_other_pr_detail_schema_invalidates_pr_caches(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    cache.write_pr_cache("org", "", [{"id": 1}])
+    cache.write_pr_entries({"https://github.com/org/api/pull/1": {"pr": {"id": 1}}})
+    cache.write_graphql_cache("org", "", ["https://github.com/org/api/pull/1"])
+    _set_pr_detail_schema("0")
+
+    assert cache.read_pr_cache("org", "", 300) is None
+    assert cache.read_pr_entries(["https://github.com/org/api/pull/1"], 300) == {}
+    assert _pr_object_count() == 0
+    # URL lists hold no PR bodies and survive.
+    assert cache.read_graphql_cache("org", "", 300) == [
+        "https://github.com/org/api/pull/1"
+    ]
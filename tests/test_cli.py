@@ -1,7 +1,10 @@
 import csv
 import io
 import json
+import logging
 import re
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
@@ -14,16 +17,25 @@ from freezegun import freeze_time
 from breakfast import api, cache, cli, renderers, ui
 
 
+def _review_decision_graphql(decision):
+    """Fake GraphQL that answers reviewDecision lookups with *decision*.
+
+    Batched check/approval queries (aliased ``$o0``, ``$o1``, ...) are
+    rejected, so they fall back to the REST resolvers the tests fake.
+    """
+
+    def fake_graphql(query, variables):
+        if "o0" in (variables or {}):
+            raise api.GitHubGraphQLError([{"type": "FORBIDDEN", "message": "stub"}])
+        return {"data": {"repository": {"pullRequest": {"reviewDecision": decision}}}}
+
+    return fake_graphql
+
+
 @pytest.fixture(autouse=True)
 def stub_review_decision(monkeypatch):
     monkeypatch.setattr(
-        api,
-        "make_github_graphql_request",
-        lambda query, variables: {
-            "data": {
-                "repository": {"pullRequest": {"reviewDecision": "REVIEW_REQUIRED"}}
-            }
-        },
+        api, "make_github_graphql_request", _review_decision_graphql("REVIEW_REQUIRED")
     )
 
 
@@ -102,6 +114,267 @@ def test_cli_outputs_table(monkeypatch):
     assert "✅ (clean)" in result.stdout
 
 
+def test_cli_graphql_discovery_skips_rest_detail_fetch(monkeypatch):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+
+    detail = {
+        "id": 1,
+        "base": {"repo": {"name": "repo", "owner": {"login": "org"}}, "ref": "main"},
+        "head": {"ref": "feature", "sha": "abc"},
+        "mergeable": True,
+        "mergeable_state": "clean",
+        "additions": 5,
+        "deletions": 2,
+        "title": "Test PR",
+        "user": {"login": "alice"},
+        "state": "open",
+        "changed_files": 1,
+        "commits": 1,
+        "review_comments": 0,
+        "created_at": "2026-01-10T00:00:00Z",
+        "html_url": "https://github.com/org/repo/pull/1",
+        "number": 1,
+    }
+
+    def fail_get_prs(*_a, **_kw):
+        raise AssertionError("URL-only discovery must not run")
+
+    def fail_api_request(_path):
+        raise AssertionError("REST detail fetch must be skipped")
+
+    monkeypatch.setattr(cli, "get_github_prs", fail_get_prs)
+    monkeypatch.setattr(
+        cli, "get_github_pr_details", lambda _org, _filters, _state: [detail]
+    )
+    monkeypatch.setattr(api, "make_github_api_request", fail_api_request)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.breakfast, ["-o", "org", "-r", "repo", "--discovery", "graphql"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "PR-1" in result.stdout
+    assert "✅ (clean)" in result.stdout
+
+
+def test_cli_graphql_discovery_batches_check_statuses(monkeypatch):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+
+    details = []
+    for number in (1, 2):
+        pr = _make_pr_fixture(number=number)
+        pr["id"] = number
+        pr["base"]["repo"]["owner"] = {"login": "org"}
+        pr["head"] = {"ref": "feature", "sha": f"sha-{number}"}
+        details.append(pr)
+
+    batches = []
+
+    def fake_get_check_statuses(targets):
+        targets = list(targets)
+        batches.append(targets)
+        return {target: "fail" for target in targets}
+
+    def fail_check_status(*_a, **_kw):
+        raise AssertionError("per-PR REST checks must not run")
+
+    monkeypatch.setattr(
+        cli, "get_github_pr_details", lambda _org, _filters, _state: details
+    )
+    monkeypatch.setattr(cli, "get_check_statuses", fake_get_check_statuses)
+    monkeypatch.setattr(cli, "get_check_status", fail_check_status)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.breakfast,
+        ["-o", "org", "--discovery", "graphql", "--checks", "--format", "json"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert len(batches) == 1
+    assert sorted(batches[0]) == [("org", "repo", "sha-1"), ("org", "repo", "sha-2")]
+    assert {pr["checks"] for pr in json.loads(result.stdout)} == {"fail"}
+
+
+def test_cli_graphql_discovery_batches_approvals(monkeypatch):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+
+    details = []
+    for number in (1, 2):
+        pr = _make_pr_fixture(number=number)
+        pr["id"] = number
+        pr["base"]["repo"]["owner"] = {"login": "org"}
+        pr["base"]["ref"] = "main"
+        details.append(pr)
+
+    batches = []
+
+    def fake_get_approval_summaries(targets):
+        targets = list(targets)
+        batches.append(targets)
+        return {
+            target[:3]: {"status": "approved", "current": 2, "required": 2}
+            for target in targets
+        }
+
+    def fail_approval_summary(*_a, **_kw):
+        raise AssertionError("per-PR REST approvals must not run")
+
+    monkeypatch.setattr(
+        cli, "get_github_pr_details", lambda _org, _filters, _state: details
+    )
+    monkeypatch.setattr(cli, "get_approval_summaries", fake_get_approval_summaries)
+    monkeypatch.setattr(cli, "get_approval_summary", fail_approval_summary)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.breakfast,
+        ["-o", "org", "--discovery", "graphql", "--approvals", "--format", "json"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert len(batches) == 1
+    assert sorted(batches[0]) == [
+        ("org", "repo", 1, "main"),
+        ("org", "repo", 2, "main"),
+    ]
+    rows = json.loads(result.stdout)
+    assert {pr["approval"] for pr in rows} == {"approved"}
+    assert {pr["approval_required"] for pr in rows} == {2}
+
+
+def test_cli_search_discovery_passes_user_filters(monkeypatch):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+    monkeypatch.setattr(cli, "get_authenticated_user_login", lambda: "alice")
+
+    searches = []
+
+    def fake_search(org, repo_filters, fetch_state, **qualifiers):
+        searches.append((org, repo_filters, fetch_state, qualifiers))
+        return {"https://github.com/org/repo/pull/1": "2026-01-11T00:00:00Z"}
+
+    def fail_scan(*_a, **_kw):
+        raise AssertionError("repository scan must not run")
+
+    pr = _make_pr_fixture(number=1)
+    pr["user"] = {"login": "alice"}
+    monkeypatch.setattr(cli, "search_github_prs", fake_search)
+    monkeypatch.setattr(cli, "get_github_prs", fail_scan)
+    monkeypatch.setattr(api, "make_github_api_request", lambda _path: pr)
+
+    result = CliRunner().invoke(
+        cli.breakfast,
+        [
+            "-o",
+            "org",
+            "--discovery",
+            "search",
+            "--mine-only",
+            "--label",
+            "bug",
+            "--no-drafts",
+            "--format",
+            "json",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert len(searches) == 1
+    assert searches[0][3] == {
+        "mine_only": True,
+        "needs_my_review": False,
+        "labels": ("bug",),
+        "exclude_labels": (),
+        "no_drafts": True,
+        "drafts_only": False,
+    }
+
+
+def test_cli_search_discovery_leaves_review_request_to_client_with_reviewers(
+    monkeypatch,
+):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+    monkeypatch.setattr(cli, "get_authenticated_user_login", lambda: "alice")
+
+    searches = []
+
+    def fake_search(org, repo_filters, fetch_state, **qualifiers):
+        searches.append(qualifiers)
+        return {"https://github.com/org/repo/pull/1": "2026-01-11T00:00:00Z"}
+
+    pr = _make_pr_fixture(number=1)
+    pr["requested_reviewers"] = [{"login": "bob"}]
+    monkeypatch.setattr(cli, "search_github_prs", fake_search)
+    monkeypatch.setattr(api, "make_github_api_request", lambda _path: pr)
+
+    result = CliRunner().invoke(
+        cli.breakfast,
+        [
+            "-o",
+            "org",
+            "--discovery",
+            "search",
+            "--needs-my-review",
+            "--filter-reviewer",
+            "bob",
+            "--format",
+            "json",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert searches[0]["needs_my_review"] is False
+    # bob is requested, alice is not: the client-side OR keeps the PR.
+    assert "pull/1" in result.stdout
+
+
+def test_cli_search_discovery_keeps_full_caches_untouched(monkeypatch, tmp_path):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+    monkeypatch.setattr(cli, "get_authenticated_user_login", lambda: "alice")
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    for name in (
+        "read_pr_cache",
+        "write_pr_cache",
+        "read_graphql_cache",
+        "write_graphql_cache",
+        "read_repo_pr_cache",
+        "write_repo_pr_caches",
+    ):
+        monkeypatch.setattr(cli, name, getattr(cache, name))
+
+    pr = _make_pr_fixture(number=1)
+    pr["user"] = {"login": "alice"}
+    monkeypatch.setattr(
+        cli,
+        "search_github_prs",
+        lambda *_a, **_kw: {"https://github.com/org/repo/pull/1": None},
+    )
+    monkeypatch.setattr(api, "make_github_api_request", lambda _path: pr)
+
+    result = CliRunner().invoke(
+        cli.breakfast,
+        ["-o", "org", "--discovery", "search", "--mine-only", "--cache"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert cache.read_graphql_cache("org", "", 300) is None
+    assert cache.read_pr_cache("org", "", 300) is None
+    assert cache.read_repo_pr_cache("org", "repo", 300) is None
+
+
 def test_cli_outputs_age_column_when_enabled(monkeypatch):
     monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
     monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
@@ -878,8 +1151,9 @@ def test_cli_checks_no_collision_across_repos(monkeypatch):
     }
 
     def fake_api_request(path):
-        if path in check_runs:
-            return check_runs[path]
+        endpoint = path.split("?", 1)[0]
+        if endpoint in check_runs:
+            return check_runs[endpoint]
         return pr_details[path]
 
     monkeypatch.setattr(cli, "get_github_prs", fake_get_prs)
@@ -1093,9 +1367,7 @@ def test_cli_outputs_approvals_column(monkeypatch):
     monkeypatch.setattr(
         api,
         "make_github_graphql_request",
-        lambda query, variables: {
-            "data": {"repository": {"pullRequest": {"reviewDecision": "APPROVED"}}}
-        },
+        _review_decision_graphql("APPROVED"),
     )
 
     runner = CliRunner()
@@ -1128,11 +1400,7 @@ def test_cli_renders_review_required_for_incomplete_reviews(monkeypatch):
     monkeypatch.setattr(
         api,
         "make_github_graphql_request",
-        lambda query, variables: {
-            "data": {
-                "repository": {"pullRequest": {"reviewDecision": "REVIEW_REQUIRED"}}
-            }
-        },
+        _review_decision_graphql("REVIEW_REQUIRED"),
     )
 
     runner = CliRunner()
@@ -1165,11 +1433,7 @@ def test_cli_renders_approval_counts_for_multi_review_branch(monkeypatch):
     monkeypatch.setattr(
         api,
         "make_github_graphql_request",
-        lambda query, variables: {
-            "data": {
-                "repository": {"pullRequest": {"reviewDecision": "REVIEW_REQUIRED"}}
-            }
-        },
+        _review_decision_graphql("REVIEW_REQUIRED"),
     )
 
     runner = CliRunner()
@@ -1221,11 +1485,7 @@ def test_cli_json_includes_approval_when_enabled(monkeypatch):
     monkeypatch.setattr(
         api,
         "make_github_graphql_request",
-        lambda query, variables: {
-            "data": {
-                "repository": {"pullRequest": {"reviewDecision": "CHANGES_REQUESTED"}}
-            }
-        },
+        _review_decision_graphql("CHANGES_REQUESTED"),
     )
 
     runner = CliRunner()
@@ -1261,11 +1521,7 @@ def test_cli_json_includes_approval_counts_when_available(monkeypatch):
     monkeypatch.setattr(
         api,
         "make_github_graphql_request",
-        lambda query, variables: {
-            "data": {
-                "repository": {"pullRequest": {"reviewDecision": "REVIEW_REQUIRED"}}
-            }
-        },
+        _review_decision_graphql("REVIEW_REQUIRED"),
     )
 
     runner = CliRunner()
@@ -1623,8 +1879,9 @@ def test_cli_status_columns_use_ascii_to_keep_rows_aligned(monkeypatch):
     check_runs["/repos/org/repo/commits/sha-4/status"] = {"statuses": []}
 
     def fake_api_request(path):
-        if path in check_runs:
-            return check_runs[path]
+        endpoint = path.split("?", 1)[0]
+        if endpoint in check_runs:
+            return check_runs[endpoint]
         return pr_details[path]
 
     monkeypatch.setattr(cli, "get_github_prs", fake_get_prs)
@@ -1872,6 +2129,14 @@ def _make_pr_detail(number=1, repo="repo"):
     }
 
 
+def _backdate_pr_set(kind, org, scope, fetched_at):
+    """Rewrite the fetched_at of a cached PR set ("result" or "repo") in the store."""
+    cache._connect().execute(
+        "UPDATE pr_sets SET fetched_at = ? WHERE kind = ? AND owner = ? AND scope = ?",
+        (fetched_at, kind, org.lower(), scope.lower()),
+    )
+
+
 def test_cache_hit_skips_get_github_prs(monkeypatch, tmp_path):
     monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
     monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
@@ -1894,6 +2159,121 @@ def test_cache_hit_skips_get_github_prs(monkeypatch, tmp_path):
     assert "PR number 1" in result.stdout
 
 
+def _fake_status_batches(monkeypatch):
+    """Record batched status lookups and fail any per-PR REST status call."""
+    batches = {"checks": [], "approvals": []}
+
+    def fake_get_check_statuses(targets):
+        targets = list(targets)
+        batches["checks"].append(targets)
+        return {target: "fail" for target in targets}
+
+    def fake_get_approval_summaries(targets):
+        targets = list(targets)
+        batches["approvals"].append(targets)
+        return {
+            target[:3]: {"status": "approved", "current": 1, "required": 1}
+            for target in targets
+        }
+
+    def fail_rest_status(*_a, **_kw):
+        raise AssertionError("per-PR REST statuses must not run")
+
+    monkeypatch.setattr(cli, "get_check_statuses", fake_get_check_statuses)
+    monkeypatch.setattr(cli, "get_approval_summaries", fake_get_approval_summaries)
+    monkeypatch.setattr(cli, "get_check_status", fail_rest_status)
+    monkeypatch.setattr(cli, "get_approval_summary", fail_rest_status)
+    monkeypatch.setattr(cli, "_fetch_check_runs", fail_rest_status)
+    monkeypatch.setattr(cli, "_review_status_from_latest_reviews", fail_rest_status)
+    return batches
+
+
+def test_rest_discovery_batches_statuses_after_detail_fetch(monkeypatch):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+    batches = _fake_status_batches(monkeypatch)
+    details = {n: _make_pr_detail(n) for n in (1, 2)}
+    monkeypatch.setattr(
+        cli,
+        "get_github_prs",
+        lambda *_a: [f"https://github.com/org/repo/pull/{n}" for n in details],
+    )
+    monkeypatch.setattr(
+        api, "make_github_api_request", lambda path: details[int(path.split("/")[-1])]
+    )
+
+    result = CliRunner().invoke(
+        cli.breakfast,
+        ["-o", "org", "-r", "repo", "--checks", "--approvals", "--format", "json"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert [len(batch) for batch in batches["checks"]] == [2]
+    assert [len(batch) for batch in batches["approvals"]] == [2]
+    rows = json.loads(result.stdout)
+    assert {row["checks"] for row in rows} == {"fail"}
+    assert {row["approval"] for row in rows} == {"approved"}
+
+
+def test_rest_discovery_falls_back_to_per_pr_checks_when_batch_fails(monkeypatch):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+
+    def failing_batch(_targets):
+        raise requests.exceptions.ConnectionError("graphql down")
+
+    def fake_api_request(path):
+        if "check-runs" in path:
+            return {"check_runs": [{"status": "completed", "conclusion": "success"}]}
+        if "/status" in path:
+            return {"statuses": []}
+        return _make_pr_detail(1)
+
+    monkeypatch.setattr(cli, "get_check_statuses", failing_batch)
+    monkeypatch.setattr(
+        cli, "get_github_prs", lambda *_a: ["https://github.com/org/repo/pull/1"]
+    )
+    monkeypatch.setattr(api, "make_github_api_request", fake_api_request)
+
+    result = CliRunner().invoke(
+        cli.breakfast, ["-o", "org", "-r", "repo", "--checks", "--format", "json"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.stdout)[0]["checks"] == "pass"
+
+
+def test_cache_hit_batches_missing_statuses(monkeypatch, tmp_path):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    batches = _fake_status_batches(monkeypatch)
+    cache.write_pr_cache("org", "repo", [_make_pr_detail(1), _make_pr_detail(2)])
+
+    result = CliRunner().invoke(
+        cli.breakfast,
+        [
+            "-o",
+            "org",
+            "-r",
+            "repo",
+            "--cache",
+            "--checks",
+            "--approvals",
+            "--format",
+            "json",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert len(batches["checks"]) == 1
+    assert len(batches["approvals"]) == 1
+    assert {row["checks"] for row in json.loads(result.stdout)} == {"fail"}
+
+
 def test_no_cache_flag_always_fetches(monkeypatch, tmp_path):
     monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
     monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
@@ -1935,7 +2315,7 @@ def test_no_cache_flag_writes_nothing(monkeypatch, tmp_path):
     result = runner.invoke(cli.breakfast, ["-o", "org", "-r", "repo", "--no-cache"])
 
     assert result.exit_code == 0
-    assert list(tmp_path.glob("prs_*.json")) == []
+    assert not cache.store_path().exists()
 
 
 def test_invalid_cache_ttl_exits_with_code_1(monkeypatch):
@@ -1984,10 +2364,9 @@ def test_corrupt_cache_falls_back_to_live_fetch(monkeypatch, tmp_path):
     monkeypatch.setattr(cli, "read_pr_cache", cache.read_pr_cache)
     monkeypatch.setattr(cli, "write_pr_cache", cache.write_pr_cache)
 
-    # Write corrupt cache file
+    # Write a corrupt cache store
     tmp_path.mkdir(parents=True, exist_ok=True)
-    path = cache.cache_path("org", "repo")
-    path.write_text("}{bad json")
+    cache.store_path().write_text("}{bad json")
 
     api_called = []
 
@@ -2192,7 +2571,7 @@ def test_per_repo_cache_hit_skips_fetch(monkeypatch, tmp_path):
     monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
     monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
     monkeypatch.setattr(cli, "read_repo_pr_cache", cache.read_repo_pr_cache)
-    monkeypatch.setattr(cli, "write_repo_pr_cache", cache.write_repo_pr_cache)
+    monkeypatch.setattr(cli, "write_repo_pr_caches", cache.write_repo_pr_caches)
     monkeypatch.setattr(cli, "read_pr_cache", cache.read_pr_cache)
     monkeypatch.setattr(cli, "write_pr_cache", cache.write_pr_cache)
     monkeypatch.setattr(cli, "read_graphql_cache", cache.read_graphql_cache)
@@ -2225,7 +2604,7 @@ def test_per_repo_cache_partial_hit(monkeypatch, tmp_path):
     monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
     monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
     monkeypatch.setattr(cli, "read_repo_pr_cache", cache.read_repo_pr_cache)
-    monkeypatch.setattr(cli, "write_repo_pr_cache", cache.write_repo_pr_cache)
+    monkeypatch.setattr(cli, "write_repo_pr_caches", cache.write_repo_pr_caches)
     monkeypatch.setattr(cli, "read_pr_cache", cache.read_pr_cache)
     monkeypatch.setattr(cli, "write_pr_cache", cache.write_pr_cache)
     monkeypatch.setattr(cli, "read_graphql_cache", cache.read_graphql_cache)
@@ -2266,41 +2645,241 @@ def test_per_repo_cache_partial_hit(monkeypatch, tmp_path):
     assert not any("repo-a" in u for u in fetched_urls)
 
 
-def test_per_repo_cache_writes_after_fetch(monkeypatch, tmp_path):
-    """After fetching fresh PRs, a per-repo cache file is written for each repo."""
+def test_narrower_query_is_served_from_broader_cached_fetch(monkeypatch):
     monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
     monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
     monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
-    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
-    monkeypatch.setattr(cli, "read_repo_pr_cache", cache.read_repo_pr_cache)
-    monkeypatch.setattr(cli, "write_repo_pr_cache", cache.write_repo_pr_cache)
-    monkeypatch.setattr(cli, "read_pr_cache", cache.read_pr_cache)
-    monkeypatch.setattr(cli, "write_pr_cache", cache.write_pr_cache)
 
-    monkeypatch.setattr(
-        cli,
-        "get_github_prs",
-        lambda *a: ["https://github.com/org/myrepo/pull/7"],
-    )
+    urls = {
+        "https://github.com/org/api-core/pull/1": _make_pr_detail(1, repo="api-core"),
+        "https://github.com/org/web/pull/2": _make_pr_detail(2, repo="web"),
+        "https://github.com/org/api-docs/pull/3": _make_pr_detail(3, repo="api-docs"),
+    }
+    monkeypatch.setattr(cli, "get_github_prs", lambda *a: list(urls))
     monkeypatch.setattr(
         api,
         "make_github_api_request",
-        lambda _: _make_pr_detail(7, repo="myrepo"),
+        lambda path: next(
+            pr for pr in urls.values() if path.endswith(f"/pulls/{pr['number']}")
+        ),
     )
-
     runner = CliRunner()
-    result = runner.invoke(cli.breakfast, ["-o", "org", "-r", "myrepo", "--cache"])
+    assert runner.invoke(cli.breakfast, ["-o", "org", "--cache"]).exit_code == 0
 
-    assert result.exit_code == 0, result.output
-    cached = cache.read_repo_pr_cache("org", "myrepo", 300)
-    assert cached is not None, "per-repo cache should be written after fetch"
-    assert len(cached["prs"]) == 1
-    assert cached["prs"][0]["number"] == 7
+    def no_network(*_a, **_kw):
+        raise AssertionError("a narrower query must not hit the network")
+
+    monkeypatch.setattr(cli, "get_github_prs", no_network)
+    monkeypatch.setattr(api, "make_github_api_request", no_network)
+    result = runner.invoke(
+        cli.breakfast,
+        ["-o", "ORG", "-r", "api", "--exclude-repo", "api-docs", "--cache"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "PR number 1" in result.stdout
+    assert "PR number 2" not in result.stdout
+    assert "PR number 3" not in result.stdout
+
+
+def test_open_query_is_served_from_cached_all_state_fetch(monkeypatch):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+
+    merged = dict(_make_pr_detail(2), state="closed", merged_at="2026-01-11T00:00:00Z")
+    cache.write_pr_cache(
+        "org",
+        "|state:all",
+        [_make_pr_detail(1), merged],
+        check_statuses={1001: "pass", 1002: "fail"},
+        coverage=cli._cache_coverage([("org", None)], [], [], "all"),
+    )
+    monkeypatch.setattr(
+        cli, "get_github_prs", lambda *a: pytest.fail("network must not be used")
+    )
+
+    result = CliRunner().invoke(cli.breakfast, ["-o", "org", "--cache", "--checks"])
+
+    assert result.exit_code == 0, result.output
+    assert "PR number 1" in result.stdout
+    assert "PR number 2" not in result.stdout
+
+
+def test_cached_fetch_does_not_answer_broader_queries():
+    coverage = cli._cache_coverage([("org", None)], ["api"], ["legacy"], "open")
+    wanted = cli._cache_coverage
+    assert cli._coverage_subsumes(
+        coverage, wanted([("Org", None)], ["api"], ["legacy", "x"], "open")
+    )
+    # Broader filter, a repo the entry excluded, another state, another owner.
+    assert not cli._coverage_subsumes(coverage, wanted([("org", None)], [], [], "open"))
+    assert not cli._coverage_subsumes(
+        coverage, wanted([("org", None)], ["api"], [], "open")
+    )
+    assert not cli._coverage_subsumes(
+        coverage, wanted([("org", None)], ["api"], ["legacy"], "all")
+    )
+    assert not cli._coverage_subsumes(
+        coverage, wanted([("other", None)], ["api"], ["legacy"], "open")
+    )
+
+
+def test_truncated_cached_fetch_only_answers_its_own_query():
+    wanted = cli._cache_coverage
+    coverage = dict(wanted([("org", None)], [], [], "all"), truncated=["org/monorepo"])
+
+    assert cli._coverage_subsumes(coverage, wanted([("org", None)], [], [], "all"))
+    assert not cli._coverage_subsumes(
+        coverage, wanted([("org", None)], ["monorepo"], [], "all")
+    )
+    assert not cli._coverage_subsumes(coverage, wanted([("org", None)], [], [], "open"))
+
+
+def test_truncated_discovery_is_not_cached_as_a_superset(monkeypatch):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+    url = "https://github.com/org/monorepo/pull/1"
+    discovered = []
+
+    def truncated_discovery(*_args):
+        discovered.append(1)
+        api._discovery_truncated.add("org/monorepo")
+        return [url]
+
+    monkeypatch.setattr(cli, "get_github_prs", truncated_discovery)
+    monkeypatch.setattr(
+        api, "make_github_api_request", lambda _path: _make_pr_detail(1, "monorepo")
+    )
+    runner = CliRunner()
+    assert runner.invoke(cli.breakfast, ["-o", "org", "--cache"]).exit_code == 0
+
+    result = runner.invoke(cli.breakfast, ["-o", "org", "--cache"])
+    assert result.exit_code == 0, result.output
+    assert len(discovered) == 1
+
+    result = runner.invoke(cli.breakfast, ["-o", "org", "-r", "mono", "--cache"])
+    assert result.exit_code == 0, result.output
+    assert len(discovered) == 2
+
+
+def test_fetch_state_gets_its_own_cache_entry(monkeypatch):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+    cache.write_pr_cache("org", "", [_make_pr_detail(1)])
+
+    discovered = []
+    monkeypatch.setattr(cli, "get_github_prs", lambda *a: discovered.append(a[2]) or [])
+
+    result = CliRunner().invoke(
+        cli.breakfast, ["-o", "org", "--cache", "--fetch-state", "merged"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert discovered == ["merged"]
+
+
+def test_per_pr_cache_reconciles_against_discovered_urls(monkeypatch, caplog):
+    """Cached PRs still discovered are reused, new ones fetched, gone ones dropped."""
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+
+    url = "https://github.com/org/repo/pull/{}".format
+    cache.write_graphql_cache("org", "repo", [url(1), url(2)])
+    cache.write_pr_entries(
+        {url(1): {"pr": _make_pr_detail(1)}, url(3): {"pr": _make_pr_detail(3)}}
+    )
+
+    fetched_paths = []
+
+    def fake_rest(path):
+        fetched_paths.append(path)
+        return _make_pr_detail(int(path.rsplit("/", 1)[1]))
+
+    monkeypatch.setattr(cli, "get_github_prs", lambda *a: [])
+    monkeypatch.setattr(api, "make_github_api_request", fake_rest)
+
+    with caplog.at_level(logging.DEBUG, logger="breakfast"):
+        result = CliRunner().invoke(
+            cli.breakfast, ["-o", "org", "-r", "repo", "--cache"]
+        )
+
+    assert result.exit_code == 0, result.output
+    assert "PR number 1" in result.stdout
+    assert "PR number 2" in result.stdout
+    assert "PR number 3" not in result.stdout
+    assert fetched_paths == ["/repos/org/repo/pulls/2"]
+    assert "cache_layer layer=pr_entry hits=1 misses=1" in caplog.text
+    assert set(cache.read_pr_entries([url(1), url(2), url(3)], 300)) == {
+        url(1),
+        url(2),
+    }
+
+
+def test_per_pr_cache_refetches_entries_missing_needed_statuses(monkeypatch):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+
+    url = "https://github.com/org/repo/pull/1"
+    cache.write_graphql_cache("org", "repo", [url])
+    cache.write_pr_entries({url: {"pr": _make_pr_detail(1)}})
+
+    bundles = []
+
+    def fake_bundle(bundle_url, checks, approvals, **_kw):
+        bundles.append(bundle_url)
+        return _make_pr_detail(1), "pass", None
+
+    monkeypatch.setattr(cli, "get_github_prs", lambda *a: [])
+    monkeypatch.setattr(cli, "_fetch_pr_bundle", fake_bundle)
+
+    result = CliRunner().invoke(
+        cli.breakfast, ["-o", "org", "-r", "repo", "--cache", "--checks"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert bundles == [url]
+    assert cache.read_pr_entries([url], 300)[url]["check_status"] == "pass"
+
+
+def test_per_repo_cache_writes_after_fetch(monkeypatch, tmp_path):
+    """After fetching fresh PRs, a per-repo cache file is written for each repo."""
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cli, "read_repo_pr_cache", cache.read_repo_pr_cache)
+    monkeypatch.setattr(cli, "write_repo_pr_caches", cache.write_repo_pr_caches)
+    monkeypatch.setattr(cli, "read_pr_cache", cache.read_pr_cache)
+    monkeypatch.setattr(cli, "write_pr_cache", cache.write_pr_cache)
+
+    monkeypatch.setattr(
+        cli,
+        "get_github_prs",
+        lambda *a: ["https://github.com/org/myrepo/pull/7"],
+    )
+    monkeypatch.setattr(
+        api,
+        "make_github_api_request",
+        lambda _: _make_pr_detail(7, repo="myrepo"),
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(cli.breakfast, ["-o", "org", "-r", "myrepo", "--cache"])
+
+    assert result.exit_code == 0, result.output
+    cached = cache.read_repo_pr_cache("org", "myrepo", 300)
+    assert cached is not None, "per-repo cache should be written after fetch"
+    assert len(cached["prs"]) == 1
+    assert cached["prs"][0]["number"] == 7
 
 
 def test_per_repo_cache_expired_triggers_refetch(monkeypatch, tmp_path):
     """An expired per-repo cache entry causes a fresh fetch for that repo."""
-    import json as _json
     from datetime import timedelta
 
     monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
@@ -2308,7 +2887,7 @@ def test_per_repo_cache_expired_triggers_refetch(monkeypatch, tmp_path):
     monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
     monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
     monkeypatch.setattr(cli, "read_repo_pr_cache", cache.read_repo_pr_cache)
-    monkeypatch.setattr(cli, "write_repo_pr_cache", cache.write_repo_pr_cache)
+    monkeypatch.setattr(cli, "write_repo_pr_caches", cache.write_repo_pr_caches)
     monkeypatch.setattr(cli, "read_pr_cache", cache.read_pr_cache)
     monkeypatch.setattr(cli, "write_pr_cache", cache.write_pr_cache)
     monkeypatch.setattr(cli, "read_graphql_cache", cache.read_graphql_cache)
@@ -2317,13 +2896,10 @@ def test_per_repo_cache_expired_triggers_refetch(monkeypatch, tmp_path):
     # Write per-repo cache, then backdate it to expire
     cache.write_graphql_cache("org", "repo", ["https://github.com/org/repo/pull/5"])
     cache.write_repo_pr_cache("org", "repo", [_make_pr_detail(99, repo="repo")])
-    path = cache.repo_pr_cache_path("org", "repo")
-    data = _json.loads(path.read_text())
     from datetime import datetime, timezone
 
     old_time = (datetime.now(timezone.utc) - timedelta(seconds=600)).isoformat()
-    data["fetched_at"] = old_time
-    path.write_text(_json.dumps(data))
+    _backdate_pr_set("repo", "org", "repo", old_time)
 
     fetch_calls = []
     monkeypatch.setattr(cli, "get_github_prs", lambda *a: [])
@@ -2341,6 +2917,89 @@ def test_per_repo_cache_expired_triggers_refetch(monkeypatch, tmp_path):
     assert "PR number 5" in result.stdout
 
 
+def _expire_repo_cache(org, repo):
+    from datetime import datetime, timedelta, timezone
+
+    _backdate_pr_set(
+        "repo", org, repo, (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+    )
+
+
+def test_delta_sync_refetches_only_changed_prs(monkeypatch, tmp_path):
+    """--delta-sync reuses unchanged cached PRs and evicts vanished ones."""
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+    monkeypatch.setattr(cache, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cli, "read_repo_pr_cache", cache.read_repo_pr_cache)
+    monkeypatch.setattr(cli, "write_repo_pr_caches", cache.write_repo_pr_caches)
+    monkeypatch.setattr(cli, "read_pr_cache", cache.read_pr_cache)
+    monkeypatch.setattr(cli, "write_pr_cache", cache.write_pr_cache)
+
+    cached_prs = []
+    for number in (1, 2, 3):
+        pr = _make_pr_detail(number)
+        pr["updated_at"] = "2026-01-11T00:00:00Z"
+        cached_prs.append(pr)
+    cache.write_repo_pr_cache("org", "repo", cached_prs)
+    _expire_repo_cache("org", "repo")
+
+    # PR 2 changed, PR 3 is gone, PR 4 is new.
+    monkeypatch.setattr(
+        cli,
+        "get_github_pr_updates",
+        lambda *_a: {
+            "https://github.com/org/repo/pull/1": "2026-01-11T00:00:00Z",
+            "https://github.com/org/repo/pull/2": "2026-01-12T00:00:00Z",
+            "https://github.com/org/repo/pull/4": "2026-01-12T00:00:00Z",
+        },
+    )
+    monkeypatch.setattr(
+        cli, "get_github_prs", lambda *_a: pytest.fail("URL-only discovery used")
+    )
+    fetched = []
+
+    def fake_rest(path):
+        number = int(path.rsplit("/", 1)[-1])
+        fetched.append(number)
+        pr = _make_pr_detail(number)
+        pr["updated_at"] = "2026-01-12T00:00:00Z"
+        return pr
+
+    monkeypatch.setattr(api, "make_github_api_request", fake_rest)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.breakfast, ["-o", "org", "-r", "repo", "--cache", "--delta-sync"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert sorted(fetched) == [2, 4]
+    assert "PR number 1" in result.stdout
+    assert "PR number 3" not in result.stdout
+    stored = cache.read_repo_pr_cache("org", "repo", 300)
+    assert sorted(pr["number"] for pr in stored["prs"]) == [1, 2, 4]
+
+
+def test_delta_sync_refreshes_pending_checks():
+    kept, stale, evicted = cli._delta_sync_repo(
+        {
+            "prs": [_make_pr_detail(1) | {"updated_at": "t"}],
+            "check_statuses": {1001: "pending"},
+            "approval_statuses": None,
+            "approval_details": None,
+        },
+        ["https://github.com/org/repo/pull/1"],
+        {"https://github.com/org/repo/pull/1": "t"},
+        checks=True,
+        approvals=False,
+    )
+
+    assert kept["prs"] == []
+    assert stale == ["https://github.com/org/repo/pull/1"]
+    assert evicted == 0
+
+
 # ---------------------------------------------------------------------------
 # Legendary PR tests
 # ---------------------------------------------------------------------------
@@ -2587,12 +3246,12 @@ def test_cli_checks_column_links_to_checks_tab(monkeypatch):
     assert "\x1b]8;;https://github.com/org/repo/pull/7/checks\x1b\\" in result.stdout
 
 
-def test_progress_emoji_emitted_after_check_status_fetch(monkeypatch):
-    """Emoji must appear only after the full bundle (detail + checks) is fetched.
+def test_progress_done_emitted_after_check_status_fetch(monkeypatch):
+    """...Done must appear only after every PR's checks are resolved.
 
-    Regression for #142: the old code emitted the emoji as soon as PR detail
-    completed, before check/approval statuses were fetched, causing a silent
-    delay after the progress line showed ...Done.
+    Regression for #142: statuses fetched after the progress line showed
+    ...Done caused a silent delay. Details arrive first (one emoji each) and
+    their statuses are batched before the line is finished.
     """
     monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
     monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
@@ -2619,6 +3278,8 @@ def test_progress_emoji_emitted_after_check_status_fetch(monkeypatch):
     def tracked_echo(msg=None, **kwargs):
         if msg == "*":
             call_log.append("emoji")
+        if msg == "...Done":
+            call_log.append("done")
         original_echo(msg, **kwargs)
 
     monkeypatch.setattr(cli.click, "echo", tracked_echo)
@@ -2641,15 +3302,7 @@ def test_progress_emoji_emitted_after_check_status_fetch(monkeypatch):
 
     assert result.exit_code == 0
 
-    # check_status_fetched must come before emoji in the log
-    assert "check_status_fetched" in call_log, "get_check_status was never called"
-    assert "emoji" in call_log, "progress emoji was never emitted"
-    check_idx = call_log.index("check_status_fetched")
-    emoji_idx = call_log.index("emoji")
-    assert check_idx < emoji_idx, (
-        f"Expected check status fetch (pos {check_idx}) before emoji "
-        f"(pos {emoji_idx}); got call_log={call_log}"
-    )
+    assert call_log == ["bundle_complete", "emoji", "check_status_fetched", "done"]
 
     # bundle_complete appears exactly once — no second bulk-fetch phase
     assert call_log.count("bundle_complete") == 1
@@ -2712,10 +3365,40 @@ def test_debug_flag_prints_summary_to_stderr(monkeypatch):
     assert "12 (10 REST + 2 GraphQL)" in result.stderr
     assert "4990 requests remaining" in result.stderr
     assert "4998 points remaining" in result.stderr
+    assert "Connections:" not in result.stderr
     # Normal table output is still present on stdout
     assert "PR-1" in result.stdout
 
 
+def test_print_debug_summary_reports_connection_reuse(capsys):
+    stats = {
+        "rest_calls": 10,
+        "graphql_calls": 2,
+        "connections_opened": 3,
+        "connections_reused": 9,
+    }
+
+    cli._print_debug_summary(time.monotonic(), 1, stats, None)
+
+    assert "Connections:      3 opened, 9 reuses" in capsys.readouterr().err
+
+
+def test_print_debug_summary_reports_not_modified(capsys):
+    stats = {"rest_calls": 10, "graphql_calls": 2, "rest_not_modified": 8}
+
+    cli._print_debug_summary(time.monotonic(), 1, stats, None)
+
+    assert "Not modified:     8 (304, no rate-limit cost)" in capsys.readouterr().err
+
+
+def test_print_debug_summary_reports_overflow_pages(capsys):
+    stats = {"rest_calls": 0, "graphql_calls": 5, "graphql_overflow_pages": 3}
+
+    cli._print_debug_summary(time.monotonic(), 1, stats, None)
+
+    assert "PR overflow:      3 extra GraphQL pages" in capsys.readouterr().err
+
+
 def _plain_pr():
     return {
         "base": {"repo": {"name": "repo", "html_url": "https://github.com/org/repo"}},
@@ -3805,6 +4488,84 @@ def test_multiple_orgs_deduplicates_shared_prs(monkeypatch):
     assert len(call_count) == 1
 
 
+def test_multiple_orgs_are_discovered_concurrently(monkeypatch):
+    """Owners are discovered in parallel under one shared progress line."""
+    import threading
+
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "tok")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_get_prs(org, _repo, _state="open"):
+        # Both owners must be in flight at once for the barrier to open.
+        barrier.wait()
+        return [f"https://github.com/{org}/repo/pull/1"]
+
+    def fake_api(path):
+        pr = _make_pr_detail(1)
+        org = path.split("/")[2]
+        pr["title"] = f"PR from {org}"
+        pr["id"] = len(org)
+        pr["html_url"] = f"https://github.com/{org}/repo/pull/1"
+        return pr
+
+    monkeypatch.setattr(cli, "get_github_prs", fake_get_prs)
+    monkeypatch.setattr(api, "make_github_api_request", fake_api)
+
+    result = CliRunner().invoke(cli.breakfast, ["-o", "org-a", "-o", "org-bb"])
+
+    assert result.exit_code == 0, result.output
+    assert "Fetching org-a, org-bb PRs..." in result.stderr
+    assert "PR from org-a" in result.stdout
+    assert "PR from org-bb" in result.stdout
+
+
+def test_discover_owners_returns_results_in_owner_order(monkeypatch):
+    import threading
+
+    org_b_done = threading.Event()
+
+    def fake_get_prs(org, _repo, _state="open"):
+        if org == "org-a":
+            assert org_b_done.wait(timeout=5)
+        else:
+            org_b_done.set()
+        return [f"https://github.com/{org}/repo/pull/1"]
+
+    monkeypatch.setattr(cli, "get_github_prs", fake_get_prs)
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+
+    results = cli._discover_owners(
+        [("org-a", []), ("org-b", [])], "open", "rest", False, 4
+    )
+
+    assert [urls for urls, _details, _stamps in results] == [
+        ["https://github.com/org-a/repo/pull/1"],
+        ["https://github.com/org-b/repo/pull/1"],
+    ]
+
+
+def test_multiple_orgs_owner_not_found_names_failing_owner(monkeypatch):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "tok")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+
+    def fake_get_prs(org, _repo, _state="open"):
+        if org == "ghost":
+            raise api.OwnerNotFoundError(org)
+        return []
+
+    monkeypatch.setattr(cli, "get_github_prs", fake_get_prs)
+
+    result = CliRunner().invoke(cli.breakfast, ["-o", "real-org", "-o", "ghost"])
+
+    assert result.exit_code == 1
+    assert "Owner not found: 'ghost'" in result.stderr
+    assert "Traceback" not in result.output
+
+
 def test_missing_organization_exits_with_error(monkeypatch):
     monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "tok")
     monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
@@ -3918,7 +4679,7 @@ def test_graphql_resource_limit_aborts_without_partial_output_or_cache(monkeypat
     )
 
     assert result.exit_code == 1
-    assert calls == ["first-owner", "second-owner"]
+    assert sorted(calls) == ["first-owner", "second-owner"]
     assert cache_writes == []
     assert result.stdout == ""
     assert "exceeded resource limits" in result.stderr
@@ -4464,11 +5225,8 @@ def test_cli_offline_flag_loads_from_cache(monkeypatch, tmp_path):
     cache.write_pr_cache("org", "repo", pr_details)
 
     # Manually backdate cache fetched_at to 3 hours ago
-    path = cache.cache_path("org", "repo")
-    data = json.loads(path.read_text())
     old_time = (datetime.now(timezone.utc) - timedelta(hours=3)).isoformat()
-    data["fetched_at"] = old_time
-    path.write_text(json.dumps(data))
+    _backdate_pr_set("result", "org", "repo", old_time)
 
     api_called = []
     monkeypatch.setattr(cli, "get_github_prs", lambda *a: api_called.append(1) or [])
@@ -4509,11 +5267,8 @@ def test_cli_network_failure_falls_back_to_cache(monkeypatch, tmp_path):
     cache.write_pr_cache("org", "repo", pr_details)
 
     # Manually backdate cache fetched_at to 2 hours ago
-    path = cache.cache_path("org", "repo")
-    data = json.loads(path.read_text())
     old_time = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
-    data["fetched_at"] = old_time
-    path.write_text(json.dumps(data))
+    _backdate_pr_set("result", "org", "repo", old_time)
 
     # Mock get_github_prs to simulate network connection error
     def mock_get_prs(*args, **kwargs):
@@ -4540,13 +5295,10 @@ def test_cli_offline_mode_does_not_write_cache(monkeypatch, tmp_path):
     # Pre-populate cache
     pr_details = [_make_pr_detail(1)]
     cache.write_pr_cache("org", "repo", pr_details)
-    path = cache.cache_path("org", "repo")
 
-    # Change file contents and get timestamp
-    data = json.loads(path.read_text())
+    # Backdate the cached entry
     old_time = (datetime.now(timezone.utc) - timedelta(hours=5)).isoformat()
-    data["fetched_at"] = old_time
-    path.write_text(json.dumps(data))
+    _backdate_pr_set("result", "org", "repo", old_time)
 
     # Track writes
     write_called = []
@@ -4566,8 +5318,8 @@ def test_cli_offline_mode_does_not_write_cache(monkeypatch, tmp_path):
     assert result.exit_code == 0
     assert len(write_called) == 0, "Should not write to cache in offline mode"
 
-    # Confirm cache file hasn't been updated/overwritten
-    data_after = json.loads(path.read_text())
+    # Confirm the cached entry hasn't been updated/overwritten
+    data_after = cache.read_pr_cache("org", "repo", 0, ignore_ttl=True)
     assert data_after["fetched_at"] == old_time
 
 
@@ -4583,11 +5335,8 @@ def test_cli_offline_mode_mine_only_no_cached_login_warns(monkeypatch, tmp_path)
     # Pre-populate expired cache (no user.json — simulates first-time offline run)
     pr_details = [_make_pr_detail(1)]
     cache.write_pr_cache("org", "repo", pr_details)
-    path = cache.cache_path("org", "repo")
-    data = json.loads(path.read_text())
     old_time = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
-    data["fetched_at"] = old_time
-    path.write_text(json.dumps(data))
+    _backdate_pr_set("result", "org", "repo", old_time)
 
     runner = CliRunner()
     result = runner.invoke(
@@ -4683,11 +5432,8 @@ def test_cli_offline_respects_no_age_flag(monkeypatch, tmp_path):
     pr_details = [_make_pr_detail(1)]
     cache.write_pr_cache("org", "repo", pr_details)
 
-    path = cache.cache_path("org", "repo")
-    data = json.loads(path.read_text())
     old_time = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
-    data["fetched_at"] = old_time
-    path.write_text(json.dumps(data))
+    _backdate_pr_set("result", "org", "repo", old_time)
 
     runner = CliRunner()
     result = runner.invoke(
@@ -4711,11 +5457,8 @@ def test_cli_offline_respects_age_flag(monkeypatch, tmp_path):
     pr_details = [_make_pr_detail(1)]
     cache.write_pr_cache("org", "repo", pr_details)
 
-    path = cache.cache_path("org", "repo")
-    data = json.loads(path.read_text())
     old_time = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
-    data["fetched_at"] = old_time
-    path.write_text(json.dumps(data))
+    _backdate_pr_set("result", "org", "repo", old_time)
 
     runner = CliRunner()
     result = runner.invoke(
@@ -5626,3 +6369,517 @@ def test_config_template_only_promises_flags_that_exist():
     assert promised, "expected the template to document some flags"
     missing = [flag for flag in promised if flag not in help_text]
     assert not missing, f"config template promises flags that do not exist: {missing}"
+
+
+def test_print_debug_summary_reports_rate_limit_pacing(capsys):
+    stats = {
+        "rest_calls": 10,
+        "graphql_calls": 0,
+        "rate_limit_waits": 4,
+        "rate_limit_wait_seconds": 12.34,
+        "rate_limit_degraded": 2,
+    }
+
+    cli._print_debug_summary(time.monotonic(), 1, stats, None)
+
+    err = capsys.readouterr().err
+    assert "Rate-limit waits: 4 (12.3s paced)" in err
+    assert "Skipped calls:    2 (rate-limit budget spent)" in err
+
+
+def test_on_rate_limit_option_configures_policy(monkeypatch):
+    chosen = []
+    monkeypatch.setattr(cli, "configure_rate_limit_policy", chosen.append)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.breakfast,
+        ["-o", "org", "-r", "repo", "--on-rate-limit", "degrade", "--show-config"],
+    )
+
+    assert result.exit_code == 0
+    assert chosen == ["degrade"]
+    assert "on-rate-limit" in result.output
+
+
+def test_print_debug_summary_reports_adaptive_concurrency(capsys):
+    stats = {
+        "rest_calls": 10,
+        "graphql_calls": 0,
+        "concurrency_limit": 12,
+        "concurrency_peak": 32,
+        "concurrency_backoffs": 2,
+    }
+
+    cli._print_debug_summary(time.monotonic(), 1, stats, None)
+
+    assert "Concurrency:      12 now, peak 32, 2 back-offs" in capsys.readouterr().err
+
+
+def test_print_debug_summary_reports_retries(capsys):
+    stats = {"rest_calls": 5, "graphql_calls": 0, "retries": 3, "retries_refused": 1}
+
+    cli._print_debug_summary(time.monotonic(), 1, stats, None)
+
+    assert "Retries:          3 (1 refused by budget)" in capsys.readouterr().err
+
+
+def test_print_debug_summary_reports_hedges(capsys):
+    stats = {"rest_calls": 50, "graphql_calls": 0, "hedges_sent": 2, "hedges_won": 1}
+
+    cli._print_debug_summary(time.monotonic(), 1, stats, None)
+
+    assert "Hedged:           2 slow requests, 1 won by hedge" in (
+        capsys.readouterr().err
+    )
+
+
+def test_print_debug_summary_reports_deduplicated_calls(capsys):
+    stats = {"rest_calls": 10, "graphql_calls": 0, "deduplicated_calls": 7}
+
+    cli._print_debug_summary(time.monotonic(), 1, stats, None)
+
+    assert "Deduplicated:     7 (shared an in-flight call)" in (capsys.readouterr().err)
+
+
+def test_hedge_option_configures_hedging(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        cli, "configure_request_hedging", lambda *args: calls.append(args)
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.breakfast,
+        ["-o", "org", "-r", "repo", "--workers", "8", "--hedge", "--show-config"],
+    )
+
+    assert result.exit_code == 0
+    assert calls == [(True, 8)]
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        (["--cache"], [(86400, False)]),
+        (["--cache", "--protection-cache-ttl", "2h", "--refresh"], [(7200, True)]),
+        (["--no-cache"], [(None, False)]),
+    ],
+)
+def test_protection_cache_ttl_configures_protection_cache(monkeypatch, args, expected):
+    calls = []
+    monkeypatch.setattr(
+        cli,
+        "configure_protection_cache",
+        lambda ttl, refresh=False: calls.append((ttl, refresh)),
+    )
+
+    result = CliRunner().invoke(
+        cli.breakfast, ["-o", "org", "-r", "repo", *args, "--show-config"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert calls == expected
+
+
+def test_invalid_protection_cache_ttl_exits_with_error():
+    result = CliRunner().invoke(
+        cli.breakfast,
+        ["-o", "org", "-r", "repo", "--protection-cache-ttl", "soon"],
+    )
+
+    assert result.exit_code == 1
+    assert "invalid --protection-cache-ttl value" in result.output
+
+
+def test_cli_fetches_details_while_discovery_is_still_paging(monkeypatch):
+    import threading
+
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+    first_url = "https://github.com/org/repo/pull/1"
+    second_url = "https://github.com/org/repo/pull/2"
+    first_fetched = threading.Event()
+    fetched = []
+    overlapped = []
+
+    def fake_get_prs(_org, _filters, _state):
+        api._emit_discovered([{"url": first_url}])
+        # The second "page" only arrives after the first PR is being fetched.
+        overlapped.append(first_fetched.wait(2))
+        api._emit_discovered([{"url": second_url}, {"url": first_url}])
+        return [first_url, second_url]
+
+    def fake_bundle(url, _checks, _approvals):
+        fetched.append(url)
+        if url == first_url:
+            first_fetched.set()
+        number = int(url.rsplit("/", 1)[1])
+        pr = _make_pr_fixture(title=f"PR-{number}", number=number)
+        pr["id"] = number
+        return pr, None, None
+
+    monkeypatch.setattr(cli, "get_github_prs", fake_get_prs)
+    monkeypatch.setattr(cli, "_fetch_pr_bundle", fake_bundle)
+
+    result = CliRunner().invoke(cli.breakfast, ["-o", "org", "-r", "repo"])
+
+    assert result.exit_code == 0, result.output
+    assert overlapped == [True]
+    assert sorted(fetched) == [first_url, second_url]
+    assert "PR-1" in result.stdout
+    assert "PR-2" in result.stdout
+
+
+def test_cli_does_not_stream_when_repo_cache_decides_what_to_fetch(monkeypatch):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+    url = "https://github.com/org/repo/pull/1"
+    fetched_during_discovery = []
+    fetched = []
+
+    def fake_get_prs(_org, _filters, _state):
+        api._emit_discovered([{"url": url}])
+        fetched_during_discovery.extend(fetched)
+        return [url]
+
+    def fake_bundle(bundle_url, _checks, _approvals):
+        fetched.append(bundle_url)
+        pr = _make_pr_fixture(number=1)
+        pr["id"] = 1
+        return pr, None, None
+
+    monkeypatch.setattr(cli, "get_github_prs", fake_get_prs)
+    monkeypatch.setattr(cli, "_fetch_pr_bundle", fake_bundle)
+
+    result = CliRunner().invoke(cli.breakfast, ["-o", "org", "-r", "repo", "--cache"])
+
+    assert result.exit_code == 0, result.output
+    assert fetched_during_discovery == []
+    assert fetched == [url]
+
+
+def _review_decision(decision):
+    def fake_graphql(_query, _variables):
+        return {"data": {"repository": {"pullRequest": {"reviewDecision": decision}}}}
+
+    return fake_graphql
+
+
+def test_fetch_pr_bundle_fans_out_status_calls(monkeypatch):
+    reviews_started = threading.Event()
+
+    def fake_api_request(path):
+        if "/check-runs" in path:
+            # Only completes if the review fetch runs concurrently.
+            assert reviews_started.wait(5)
+            return {"check_runs": [{"status": "completed", "conclusion": "success"}]}
+        if "/status?" in path:
+            return {"statuses": []}
+        if path.endswith("/protection/required_pull_request_reviews"):
+            return {"required_approving_review_count": 2}
+        raise AssertionError(path)
+
+    def fake_paginated(_path, rate=100):
+        reviews_started.set()
+        return [{"user": {"login": "bob"}, "state": "APPROVED"}]
+
+    monkeypatch.setattr(api, "make_github_api_request", fake_api_request)
+    monkeypatch.setattr(api, "make_paginated_github_api_request", fake_paginated)
+    monkeypatch.setattr(api, "make_github_graphql_request", _review_decision(None))
+
+    _pr, check_status, approval = cli._fetch_pr_bundle(
+        "https://github.com/org/repo/pull/1", True, True, pr_detail=_make_pr_detail(1)
+    )
+
+    assert check_status == "pass"
+    assert approval["current"] == 1
+    assert approval["required"] == 2
+
+
+def test_failed_status_batches_fall_back_to_fanned_out_calls(monkeypatch):
+    def fail_batch(_pr_details):
+        raise requests.exceptions.ConnectionError("batch down")
+
+    def fake_api_request(path):
+        if "/check-runs" in path:
+            return {"check_runs": [{"status": "completed", "conclusion": "failure"}]}
+        if "/status?" in path:
+            return {"statuses": []}
+        if path.endswith("/protection/required_pull_request_reviews"):
+            return {"required_approving_review_count": 1}
+        raise AssertionError(path)
+
+    monkeypatch.setattr(cli, "_batch_check_statuses", fail_batch)
+    monkeypatch.setattr(cli, "_batch_approval_details", fail_batch)
+    monkeypatch.setattr(api, "make_github_api_request", fake_api_request)
+    monkeypatch.setattr(
+        api,
+        "make_paginated_github_api_request",
+        lambda _path, rate=100: [{"user": {"login": "bob"}, "state": "APPROVED"}],
+    )
+    monkeypatch.setattr(
+        api, "make_github_graphql_request", _review_decision("APPROVED")
+    )
+    url = "https://github.com/org/repo/pull/1"
+    bundles = {url: [_make_pr_detail(1), None, None]}
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        missed = cli._fill_bundle_statuses(bundles, True, True, executor)
+
+    assert missed == set()
+    assert bundles[url][1] == "fail"
+    assert bundles[url][2]["status"] == "approved"
+    assert bundles[url][2]["required"] == 1
+
+
+def test_fetch_pr_bundle_keeps_sentinels_when_leaf_calls_fail(monkeypatch):
+    def fake_api_request(path):
+        if path.endswith("/pulls/1"):
+            return _make_pr_detail(1)
+        raise requests.exceptions.ConnectionError("boom")
+
+    def fail_paginated(_path, rate=100):
+        raise requests.exceptions.ConnectionError("boom")
+
+    monkeypatch.setattr(api, "make_github_api_request", fake_api_request)
+    monkeypatch.setattr(api, "make_paginated_github_api_request", fail_paginated)
+
+    _pr, check_status, approval = cli._fetch_pr_bundle(
+        "https://github.com/org/repo/pull/1", True, True
+    )
+
+    assert check_status == "none"
+    assert approval == {"status": "pending", "current": 0, "required": None}
+
+
+def test_fetch_pr_bundle_skips_check_calls_for_settled_head(monkeypatch):
+    calls = []
+
+    def fake_api_request(path):
+        calls.append(path)
+        return _make_pr_detail(1)
+
+    monkeypatch.setattr(api, "make_github_api_request", fake_api_request)
+    api.configure_check_cache(True)
+    cache.write_check_cache("org", "repo", "abc123", "pass")
+
+    _pr, check_status, _approval = cli._fetch_pr_bundle(
+        "https://github.com/org/repo/pull/1", True, False
+    )
+
+    assert check_status == "pass"
+    assert calls == ["/repos/org/repo/pulls/1"]
+
+
+def test_fetch_pr_bundle_propagates_detail_failure(monkeypatch):
+    def fail_api_request(_path):
+        raise requests.exceptions.ConnectionError("boom")
+
+    monkeypatch.setattr(api, "make_github_api_request", fail_api_request)
+    monkeypatch.setattr(
+        api, "make_paginated_github_api_request", lambda _path, rate=100: []
+    )
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        cli._fetch_pr_bundle("https://github.com/org/repo/pull/1", True, True)
+
+
+def _deadline_run(monkeypatch, args):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+    urls = [f"https://github.com/org/repo/pull/{n}" for n in (1, 2)]
+    release = threading.Event()
+
+    def fake_bundle(url, _checks, _approvals):
+        number = int(url.rsplit("/", 1)[1])
+        if number == 2:
+            release.wait(5)
+        return _make_pr_detail(number), None, None
+
+    monkeypatch.setattr(cli, "get_github_prs", lambda *_a: list(urls))
+    monkeypatch.setattr(cli, "_fetch_pr_bundle", fake_bundle)
+    try:
+        t0 = time.monotonic()
+        result = CliRunner().invoke(
+            cli.breakfast,
+            ["-o", "org", "-r", "repo", "--deadline", "1", "--json", *args],
+        )
+        elapsed = time.monotonic() - t0
+    finally:
+        release.set()
+    return result, elapsed
+
+
+def test_deadline_fills_late_prs_from_stale_repo_cache(monkeypatch):
+    cache.write_repo_pr_cache("org", "repo", [_make_pr_detail(2)])
+    _backdate_pr_set(
+        "repo",
+        "org",
+        "repo",
+        (datetime.now(timezone.utc) - timedelta(days=1)).isoformat(),
+    )
+
+    result, elapsed = _deadline_run(monkeypatch, ["--cache"])
+
+    assert result.exit_code == 0, result.output
+    assert elapsed < 4
+    rows = {row["pr_number"]: row for row in json.loads(result.stdout)}
+    assert rows[1]["stale"] is False
+    assert rows[2]["stale"] is True
+    assert "1 PR(s) shown from stale cache" in result.stderr
+    # A run cut short by the deadline leaves the cache untouched.
+    assert cache.read_pr_cache("org", "repo", 300) is None
+
+
+def test_deadline_reports_prs_missing_without_cache(monkeypatch):
+    result, elapsed = _deadline_run(monkeypatch, ["--no-cache"])
+
+    assert result.exit_code == 0, result.output
+    assert elapsed < 4
+    rows = json.loads(result.stdout)
+    assert [row["pr_number"] for row in rows] == [1]
+    assert "1 PR(s) missing: https://github.com/org/repo/pull/2" in result.stderr
+
+
+def test_deadline_during_discovery_falls_back_to_cached_prs(monkeypatch):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+    cache.write_pr_cache("org", "repo", [_make_pr_detail(1)])
+
+    def slow_discovery(*_args):
+        raise api.GitHubDeadlineExceeded()
+
+    monkeypatch.setattr(cli, "get_github_prs", slow_discovery)
+
+    result = CliRunner().invoke(
+        cli.breakfast,
+        [
+            "-o",
+            "org",
+            "-r",
+            "repo",
+            "--cache",
+            "--refresh",
+            "--deadline",
+            "5",
+            "--json",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Deadline reached" in result.stderr
+    assert json.loads(result.stdout)[0]["stale"] is True
+
+
+def test_status_batches_start_before_every_detail_is_in(monkeypatch):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+    monkeypatch.setattr(cli, "_GRAPHQL_BATCH_SIZE", 1)
+    urls = [f"https://github.com/org/repo/pull/{n}" for n in (1, 2)]
+    first_batch_done = threading.Event()
+    batches = []
+
+    def fake_bundle(url, _checks, _approvals, pr_detail=None):
+        number = int(url.rsplit("/", 1)[1])
+        if number == 2:
+            # Held back until a status batch has run for PR 1.
+            assert first_batch_done.wait(5)
+        return _make_pr_detail(number), None, None
+
+    def fake_batch(pr_details):
+        batches.append([pr["number"] for pr in pr_details])
+        first_batch_done.set()
+        return {pr["id"]: "pass" for pr in pr_details}
+
+    monkeypatch.setattr(cli, "get_github_prs", lambda *_a: list(urls))
+    monkeypatch.setattr(cli, "_fetch_pr_bundle", fake_bundle)
+    monkeypatch.setattr(cli, "_batch_check_statuses", fake_batch)
+
+    result = CliRunner().invoke(
+        cli.breakfast,
+        ["-o", "org", "-r", "repo", "--no-cache", "--checks", "--json"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert batches == [[1], [2]]
+    assert all(row["checks"] == "pass" for row in json.loads(result.stdout))
+
+
+def test_deadline_in_status_batch_marks_rows_without_fallback(monkeypatch):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "BREAKFAST_ITEMS", ["*"])
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+    urls = [f"https://github.com/org/repo/pull/{n}" for n in (1, 2)]
+    status_calls = []
+
+    def fake_bundle(url, checks, approvals, pr_detail=None):
+        if checks or approvals:
+            status_calls.append(url)
+        return _make_pr_detail(int(url.rsplit("/", 1)[1])), None, None
+
+    def deadline_batch(_pr_details):
+        raise api.GitHubDeadlineExceeded()
+
+    monkeypatch.setattr(cli, "get_github_prs", lambda *_a: list(urls))
+    monkeypatch.setattr(cli, "_fetch_pr_bundle", fake_bundle)
+    monkeypatch.setattr(cli, "_batch_check_statuses", deadline_batch)
+
+    result = CliRunner().invoke(
+        cli.breakfast,
+        ["-o", "org", "-r", "repo", "--no-cache", "--checks", "--json"],
+    )
+
+    assert result.exit_code == 0, result.output
+    rows = json.loads(result.stdout)
+    assert [row["stale"] for row in rows] == [True, True]
+    assert "2 PR(s) without check/approval statuses" in result.stderr
+    assert status_calls == []
+
+
+def test_fetch_pr_bundle_reraises_deadline_from_check_lookup(monkeypatch):
+    def deadline_check_runs(*_args, **_kwargs):
+        raise api.GitHubDeadlineExceeded()
+
+    monkeypatch.setattr(cli, "_fetch_check_runs", deadline_check_runs)
+    monkeypatch.setattr(cli, "_fetch_commit_statuses", lambda *_a, **_kw: [])
+
+    with pytest.raises(api.GitHubDeadlineExceeded):
+        cli._fetch_pr_bundle(
+            "https://github.com/org/repo/pull/1",
+            True,
+            False,
+            pr_detail=_make_pr_detail(1),
+        )
+
+
+def test_truncated_discovery_is_reported_on_stderr(monkeypatch):
+    monkeypatch.setattr(cli, "SECRET_GITHUB_TOKEN", "token-123")
+    monkeypatch.setattr(cli, "check_for_update", lambda **_kw: None)
+
+    def truncated_discovery(*_args):
+        api._discovery_truncated.add("org/monorepo")
+        return []
+
+    monkeypatch.setattr(cli, "get_github_prs", truncated_discovery)
+
+    result = CliRunner().invoke(
+        cli.breakfast, ["-o", "org", "-r", "monorepo", "--no-cache", "--json"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "1 repo(s) have more than" in result.stderr
+    assert "org/monorepo" in result.stderr
+
+
+def test_invalid_deadline_exits_with_error():
+    result = CliRunner().invoke(
+        cli.breakfast, ["-o", "org", "-r", "repo", "--deadline", "soon"]
+    )
+
+    assert result.exit_code == 1
+    assert "invalid --deadline value" in result.output
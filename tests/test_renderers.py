@@ -504,3 +504,108 @@ def test_autofit_truncates_reviewers_and_labels():
     for row in fitted:
         assert "Reviewers" not in row
         assert "Labels" not in row
+
+
+def _stale_fixture_prs():
+    return [
+        {
+            "id": pr_id,
+            "number": pr_id,
+            "html_url": f"https://github.com/org/repo/pull/{pr_id}",
+            "title": f"PR {pr_id}",
+            "user": {"login": "alice"},
+            "state": "open",
+            "changed_files": 1,
+            "commits": 1,
+            "review_comments": 0,
+            "additions": 1,
+            "deletions": 0,
+            "base": {
+                "ref": "main",
+                "repo": {"name": "repo", "owner": {"login": "org"}},
+            },
+        }
+        for pr_id in (1, 2)
+    ]
+
+
+def test_render_json_flags_stale_rows(capsys):
+    import json
+
+    renderers.render_json(_stale_fixture_prs(), False, False, {}, {}, {}, stale_ids={2})
+
+    rows = json.loads(capsys.readouterr().out)
+    assert [row["stale"] for row in rows] == [False, True]
+
+
+def test_render_json_omits_stale_field_without_stale_rows(capsys):
+    import json
+
+    renderers.render_json(_stale_fixture_prs(), False, False, {}, {}, {})
+
+    assert all("stale" not in row for row in json.loads(capsys.readouterr().out))
+
+
+def test_render_csv_adds_stale_column(capsys):
+    renderers.render_csv(
+        _stale_fixture_prs(), False, False, False, {}, {}, {}, stale_ids={1}
+    )
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].endswith(",stale")
+    assert lines[1].endswith(",True")
+    assert lines[2].endswith(",False")
+
+
+def test_render_markdown_marks_stale_state(capsys):
+    renderers.render_markdown(
+        _stale_fixture_prs(),
+        age=False,
+        checks=False,
+        approvals=False,
+        check_statuses={},
+        approval_statuses={},
+        approval_details={},
+        head_branch=False,
+        base_branch=False,
+        status_style="ascii",
+        stale_ids={2},
+    )
+
+    out = capsys.readouterr().out
+    assert out.count("(stale)") == 1
+    assert "open (stale)" in out
+
+
+def test_render_table_marks_stale_state(capsys):
+    renderers.render_table(
+        pr_details=_stale_fixture_prs(),
+        organizations=["org"],
+        legendary=False,
+        age=False,
+        checks=False,
+        approvals=False,
+        check_statuses={},
+        approval_statuses={},
+        approval_details={},
+        head_branch=False,
+        base_branch=False,
+        status_style="emoji",
+        seasonal_calendar="off",
+        colour=False,
+        colour_index=False,
+        max_title_length=None,
+        column_specs=None,
+        stdout_is_tty=False,
+        stale_ids={1},
+    )
+
+    assert renderers._strip_ansi(capsys.readouterr().out).count("(stale)") == 1
+
+
+def test_render_template_fills_stale_field(capsys):
+    renderers.render_template(
+        _stale_fixture_prs(), "{number}{stale}", colour=False, stale_ids={2}
+    )
+
+    assert capsys.readouterr().out.splitlines() == ["1", "2(stale)"]
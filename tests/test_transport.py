@@ -0,0 +1,621 @@
+import pytest
+
+from breakfast import transport
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _scheduler(clock, **kwargs):
+    options = {"pace_fraction": 0.1, "reserve": 5, "max_wait": 60}
+    options.update(kwargs)
+    return transport.RateLimitScheduler(clock=clock, sleep=clock.sleep, **options)
+
+
+def _headers(remaining, reset, limit=5000, resource=None):
+    headers = {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset),
+    }
+    if resource:
+        headers["X-RateLimit-Resource"] = resource
+    return headers
+
+
+def test_acquire_without_budget_proceeds_immediately():
+    clock = FakeClock()
+    scheduler = _scheduler(clock)
+
+    assert scheduler.acquire("core") is None
+    assert clock.sleeps == []
+
+
+def test_acquire_reserves_budget_without_pacing_when_plenty_remains():
+    clock = FakeClock()
+    scheduler = _scheduler(clock)
+    scheduler.record("core", _headers(4000, 2000))
+
+    assert scheduler.acquire("core") is None
+    assert scheduler.acquire("core") is None
+
+    assert scheduler.budget("core")["remaining"] == 3998
+    assert clock.sleeps == []
+
+
+def test_acquire_paces_requests_once_budget_runs_low():
+    clock = FakeClock()
+    scheduler = _scheduler(clock)
+    # 105 left, 5 held in reserve: 100 requests spread over 100 seconds.
+    scheduler.record("core", _headers(105, 1100))
+
+    scheduler.acquire("core")
+    scheduler.acquire("core")
+    scheduler.acquire("core")
+
+    assert clock.sleeps[0] == pytest.approx(1.0)
+    assert len(clock.sleeps) == 2
+    assert scheduler.waits == 2
+
+
+def test_acquire_waits_for_reset_when_it_is_close():
+    clock = FakeClock()
+    scheduler = _scheduler(clock)
+    scheduler.record("core", _headers(5, 1030))
+
+    assert scheduler.acquire("core") is None
+
+    assert clock.sleeps == [30]
+    assert scheduler.budget("core") is None
+
+
+@pytest.mark.parametrize("policy", ["degrade", "abort"])
+def test_acquire_returns_policy_when_reset_is_far_away(policy):
+    clock = FakeClock()
+    scheduler = _scheduler(clock, policy=policy)
+    scheduler.record("core", _headers(5, 4000))
+
+    assert scheduler.acquire("core") == policy
+    assert clock.sleeps == []
+
+
+def test_acquire_wait_policy_sleeps_until_reset():
+    clock = FakeClock()
+    scheduler = _scheduler(clock, policy="wait")
+    scheduler.record("core", _headers(2, 4000))
+
+    assert scheduler.acquire("core") is None
+    assert clock.sleeps == [3000]
+
+
+def test_acquire_returns_deadline_instead_of_outlasting_timeout():
+    clock = FakeClock()
+    scheduler = _scheduler(clock, policy="wait")
+    scheduler.record("core", _headers(105, 1100))
+    scheduler.acquire("core")
+
+    assert scheduler.acquire("core", timeout=0.5) == "deadline"
+    assert clock.sleeps == []
+    assert scheduler.budget("core")["remaining"] == 104
+    assert scheduler.acquire("core", timeout=5) is None
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+def test_record_keeps_lowest_remaining_within_a_window():
+    scheduler = _scheduler(FakeClock())
+    scheduler.record("core", _headers(100, 2000))
+    scheduler.record("core", _headers(300, 2000))
+
+    assert scheduler.budget("core")["remaining"] == 100
+
+    scheduler.record("core", _headers(5000, 5600))
+    assert scheduler.budget("core") == {
+        "limit": 5000,
+        "remaining": 5000,
+        "reset": 5600,
+    }
+
+
+def test_record_prefers_resource_header_and_ignores_malformed_values():
+    scheduler = _scheduler(FakeClock())
+    scheduler.record("core", _headers(20, 2000, limit=30, resource="search"))
+    scheduler.record("core", {"X-RateLimit-Remaining": object()})
+
+    assert scheduler.budget("search")["remaining"] == 20
+    assert scheduler.budget("core") is None
+
+
+def test_record_graphql_reads_rate_limit_object():
+    scheduler = _scheduler(FakeClock())
+    scheduler.record_graphql({"remaining": 4200, "resetAt": "1970-01-01T01:00:00Z"})
+
+    assert scheduler.budget("graphql") == {
+        "limit": 4200,
+        "remaining": 4200,
+        "reset": 3600,
+    }
+
+
+def test_reset_forgets_budgets_and_counters():
+    clock = FakeClock()
+    scheduler = _scheduler(clock)
+    scheduler.record("core", _headers(5, 1010))
+    scheduler.acquire("core")
+
+    scheduler.reset()
+
+    assert scheduler.budget("core") is None
+    assert scheduler.waits == 0
+    assert scheduler.waited_seconds == 0.0
+
+
+def _limiter(clock=None, **kwargs):
+    options = {"initial": 4, "cooldown": 1.0}
+    options.update(kwargs)
+    return transport.AdaptiveConcurrencyLimiter(
+        16, clock=clock or FakeClock(), **options
+    )
+
+
+def test_limiter_slow_starts_while_responses_are_healthy():
+    limiter = _limiter()
+
+    for _ in range(4):
+        limiter.acquire()
+        limiter.release("rest", 0.1, congested=False)
+
+    assert limiter.limit == 8
+
+
+def test_limiter_never_exceeds_max_limit():
+    limiter = _limiter()
+
+    for _ in range(50):
+        limiter.acquire()
+        limiter.release("rest", 0.1, congested=False)
+
+    assert limiter.limit == 16
+    assert limiter.peak == 16
+
+
+def test_limiter_halves_on_congestion_then_grows_additively():
+    clock = FakeClock()
+    limiter = _limiter(clock, initial=8)
+
+    limiter.acquire()
+    limiter.release("rest", 0.1, congested=True)
+    assert limiter.limit == 4
+    assert limiter.backoffs == 1
+
+    # One more slot per round of ``limit`` healthy responses.
+    for _ in range(5):
+        limiter.acquire()
+        limiter.release("rest", 0.1, congested=False)
+    assert limiter.limit == 5
+
+
+def test_limiter_counts_a_burst_of_congestion_as_one_backoff():
+    clock = FakeClock()
+    limiter = _limiter(clock, initial=8)
+
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release("rest", 0.1, congested=True)
+    assert limiter.limit == 4
+
+    clock.now += 2
+    limiter.acquire()
+    limiter.release("rest", 0.1, congested=True)
+    assert limiter.limit == 2
+    assert limiter.backoffs == 2
+
+
+def test_limiter_holds_when_latency_degrades():
+    limiter = _limiter()
+    limiter.acquire()
+    limiter.release("rest", 0.1, congested=False)
+
+    limiter.acquire()
+    limiter.release("rest", 1.0, congested=False)
+
+    assert limiter.limit == 5
+
+
+def test_limiter_keeps_latency_baselines_per_kind():
+    limiter = _limiter()
+    limiter.acquire()
+    limiter.release("rest", 0.1, congested=False)
+
+    limiter.acquire()
+    limiter.release("graphql", 1.0, congested=False)
+
+    assert limiter.limit == 6
+
+
+def test_limiter_baseline_decays_towards_recent_latency():
+    limiter = _limiter(initial=16, baseline_decay=0.5)
+    limiter.acquire()
+    limiter.release("rest", 0.1, congested=False)
+
+    # 0.1 -> 0.55 -> 0.775: the lucky first reply stops setting the bar.
+    for _ in range(2):
+        limiter.acquire()
+        limiter.release("rest", 1.0, congested=False)
+    assert limiter._baseline["rest"] == pytest.approx(0.775)
+    limiter.acquire()
+    limiter.release("rest", 1.0, congested=False)
+    assert limiter._baseline["rest"] == pytest.approx(0.8875)
+
+
+def test_limiter_acquire_gives_up_after_its_timeout():
+    limiter = _limiter(initial=1)
+    limiter.acquire()
+
+    assert limiter.acquire(timeout=0.01) is False
+
+    limiter.abandon()
+    assert limiter.acquire(timeout=0.01) is True
+    assert limiter.limit == 1
+
+
+def test_limiter_blocks_workers_beyond_the_limit():
+    import threading
+
+    limiter = _limiter(initial=1)
+    limiter.acquire()
+    entered = threading.Event()
+
+    def worker():
+        limiter.acquire()
+        entered.set()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    assert not entered.wait(0.05)
+
+    limiter.release("rest", 0.1, congested=True)
+    assert entered.wait(1)
+    thread.join()
+
+
+class _Response:
+    def __init__(self, status_code, headers=None, text=""):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = text
+
+
+def _policy(clock=None, **kwargs):
+    options = {
+        "max_retries": 3,
+        "base_delay": 2.0,
+        "max_delay": 30.0,
+        "max_wait": 60,
+        "retry_statuses": {502, 503, 504},
+        "secondary_limit_wait": 60,
+        "budget_ratio": 0.2,
+        "budget_min": 20,
+        # Always draw the upper bound so delays are predictable.
+        "jitter": lambda _low, high: high,
+    }
+    options.update(kwargs)
+    return transport.RetryPolicy(clock=clock or FakeClock(), **options)
+
+
+def test_retry_policy_uses_full_jitter_without_server_hint():
+    draws = []
+    policy = _policy(jitter=lambda low, high: draws.append((low, high)) or 0.5)
+
+    assert policy.delay_for(0, _Response(502)) == 0.5
+    assert policy.delay_for(2) == 0.5
+    assert draws == [(0, 2.0), (0, 8.0)]
+
+
+def test_retry_policy_caps_exponential_backoff():
+    policy = _policy(max_retries=10)
+
+    assert policy.delay_for(8, _Response(503)) == 30.0
+
+
+def test_retry_policy_honours_retry_after_seconds():
+    policy = _policy()
+
+    assert policy.delay_for(0, _Response(429, {"Retry-After": "7"})) == 9.0
+
+
+def test_retry_policy_honours_retry_after_http_date():
+    clock = FakeClock(now=1_700_000_000)
+    policy = _policy(clock, jitter=lambda _low, _high: 0)
+    response = _Response(403, {"Retry-After": "Tue, 14 Nov 2023 22:13:40 GMT"})
+
+    assert policy.delay_for(0, response) == 20.0
+
+
+def test_retry_policy_waits_for_short_rate_limit_reset():
+    policy = _policy(jitter=lambda _low, _high: 0)
+    response = _Response(
+        403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1045"}
+    )
+
+    assert policy.delay_for(0, response) == 45
+
+
+def test_retry_policy_gives_up_on_distant_reset():
+    policy = _policy()
+    response = _Response(429, {"Retry-After": "3600"})
+
+    assert policy.delay_for(0, response) is None
+
+
+def test_retry_policy_waits_a_minute_for_secondary_limit_without_hint():
+    policy = _policy(jitter=lambda _low, _high: 0)
+    response = _Response(
+        403, text='{"message": "You have exceeded a secondary rate limit"}'
+    )
+
+    assert policy.delay_for(0, response) == 60
+
+
+@pytest.mark.parametrize("status_code", [200, 400, 403, 404, 500])
+def test_retry_policy_does_not_retry_other_statuses(status_code):
+    assert _policy().delay_for(0, _Response(status_code)) is None
+
+
+def test_retry_policy_stops_after_max_retries():
+    policy = _policy()
+
+    assert policy.delay_for(2, _Response(502)) is not None
+    assert policy.delay_for(3, _Response(502)) is None
+
+
+def test_retry_policy_enforces_global_budget():
+    policy = _policy(budget_min=2, budget_ratio=0.5)
+
+    assert policy.delay_for(0) is not None
+    assert policy.delay_for(0) is not None
+    assert policy.delay_for(0) is None
+    assert policy.refused == 1
+
+    policy.record_request()
+    policy.record_request()
+    assert policy.delay_for(0) is not None
+    assert policy.retries == 3
+
+    policy.reset()
+    assert (policy.retries, policy.refused) == (0, 0)
+
+
+def _hedger(**kwargs):
+    options = {"max_workers": 4, "max_fraction": 1.0, "min_samples": 3}
+    options.update(kwargs)
+    hedger = transport.RequestHedger(**options)
+    for _ in range(options["min_samples"]):
+        hedger.observe(0.01)
+    return hedger
+
+
+def test_hedger_needs_samples_before_hedging():
+    hedger = transport.RequestHedger(max_workers=2, max_fraction=1.0, min_samples=3)
+
+    assert hedger.hedge_delay() is None
+    assert hedger.call(lambda: "ok") == "ok"
+    assert hedger.hedges == 0
+    hedger.shutdown()
+
+
+def test_hedger_delay_is_observed_quantile():
+    hedger = transport.RequestHedger(
+        max_workers=2, max_fraction=1.0, min_samples=10, min_delay=0.0
+    )
+    for latency in range(1, 21):
+        hedger.observe(latency / 10)
+
+    assert hedger.hedge_delay() == 2.0
+    hedger.shutdown()
+
+
+def test_hedger_duplicates_slow_request_and_first_reply_wins():
+    import threading
+
+    hedger = _hedger()
+    release = threading.Event()
+    calls = []
+
+    def send():
+        calls.append(1)
+        if len(calls) == 1:
+            release.wait(2)
+            return "slow"
+        return "fast"
+
+    assert hedger.call(send) == "fast"
+    assert (hedger.hedges, hedger.wins) == (1, 1)
+    release.set()
+    hedger.shutdown()
+
+
+def test_hedger_falls_back_to_other_copy_when_one_fails():
+    import threading
+
+    hedger = _hedger()
+    release = threading.Event()
+    calls = []
+
+    def send():
+        calls.append(1)
+        if len(calls) == 1:
+            release.wait(0.2)
+            return "primary"
+        raise ConnectionError("reset")
+
+    assert hedger.call(send) == "primary"
+    assert hedger.wins == 0
+    hedger.shutdown()
+
+
+def test_hedger_caps_hedges_as_fraction_of_requests():
+    import threading
+
+    hedger = _hedger(max_fraction=0.0)
+    release = threading.Event()
+
+    def send():
+        release.wait(0.1)
+        return "only"
+
+    assert hedger.call(send) == "only"
+    assert hedger.hedges == 0
+    hedger.shutdown()
+
+
+def test_hedger_skips_hedge_when_prepare_fails():
+    import threading
+
+    hedger = _hedger()
+    calls = []
+
+    def send():
+        calls.append(1)
+        threading.Event().wait(0.1)
+        return "primary"
+
+    def refuse():
+        raise RuntimeError("no budget")
+
+    assert hedger.call(send, prepare_hedge=refuse) == "primary"
+    assert len(calls) == 1
+    hedger.shutdown()
+
+
+# ---------------------------------------------------------------------------
+# SingleFlight
+# ---------------------------------------------------------------------------
+
+
+def _join_flight(flight, key, fn, followers):
+    """Start *followers* callers of *key* while *fn* is in flight."""
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = ThreadPoolExecutor(max_workers=followers + 1)
+    leader = executor.submit(flight.do, key, fn)
+    while key not in flight._calls:
+        time.sleep(0.001)
+    joined = [executor.submit(flight.do, key, fn) for _ in range(followers)]
+    deadline = time.monotonic() + 2
+    while flight.shared < followers and time.monotonic() < deadline:
+        time.sleep(0.001)
+    executor.shutdown(wait=False)
+    return leader, joined
+
+
+def test_single_flight_shares_one_call_between_concurrent_callers():
+    import threading
+
+    flight = transport.SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(2)
+        return {"items": [1]}
+
+    leader, joined = _join_flight(flight, "key", fetch, followers=3)
+    release.set()
+
+    results = [leader.result()] + [future.result() for future in joined]
+    assert calls == [1]
+    assert flight.shared == 3
+    assert all(result == {"items": [1]} for result in results)
+    # Followers get their own copy of the shared response.
+    results[1]["items"].append(2)
+    assert results[0] == {"items": [1]}
+
+
+def test_single_flight_followers_do_not_see_the_leaders_mutations():
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    flight = transport.SingleFlight()
+    release = threading.Event()
+
+    def fetch():
+        release.wait(2)
+        return {"items": [1]}
+
+    def lead():
+        # The leader's caller extends the response, as discovery does with
+        # overflow pages, while followers may still be copying it.
+        result = flight.do("key", fetch)
+        result["items"].extend(range(1000))
+        return result
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(lead)
+        while "key" not in flight._calls:
+            time.sleep(0.001)
+        joined = [executor.submit(flight.do, "key", fetch) for _ in range(3)]
+        while flight.shared < 3:
+            time.sleep(0.001)
+        release.set()
+
+    assert len(leader.result()["items"]) == 1001
+    assert all(future.result() == {"items": [1]} for future in joined)
+
+
+def test_single_flight_joiner_gives_up_after_its_timeout():
+    import threading
+
+    flight = transport.SingleFlight()
+    release = threading.Event()
+
+    def fetch():
+        release.wait(2)
+        return {"items": [1]}
+
+    leader, _ = _join_flight(flight, "key", fetch, followers=0)
+    with pytest.raises(TimeoutError):
+        flight.do("key", fetch, timeout=0.01)
+    release.set()
+
+    assert leader.result() == {"items": [1]}
+
+
+def test_single_flight_shares_the_leaders_exception():
+    import threading
+
+    flight = transport.SingleFlight()
+    release = threading.Event()
+
+    def fetch():
+        release.wait(2)
+        raise ValueError("boom")
+
+    leader, joined = _join_flight(flight, "key", fetch, followers=2)
+    release.set()
+
+    for future in [leader, *joined]:
+        with pytest.raises(ValueError, match="boom"):
+            future.result()
+
+
+def test_single_flight_does_not_cache_finished_calls():
+    flight = transport.SingleFlight()
+    calls = []
+
+    assert flight.do("key", lambda: calls.append(1) or len(calls)) == 1
+    assert flight.do("key", lambda: calls.append(1) or len(calls)) == 2
+    assert flight.shared == 0
+    assert flight._calls == {}